@@ -6,8 +6,19 @@ A professional CPU-Z alternative for Linux systems
 
 import sys
 import os
+import json
+import time
+import select
+import asyncio
+import argparse
+from functools import partial
 from typing import Optional
 
+# The headless inventory runs on every node of a fleet, so it never imports Rich or the UI
+if __name__ == '__main__' and sys.argv[1:2] == ['inventory']:
+    from utils.inventory import main as inventory_main
+    sys.exit(inventory_main(sys.argv[2:]))
+
 try:
     from rich.console import Console
     from rich.table import Table
@@ -15,32 +26,107 @@ try:
     from rich.layout import Layout
     from rich.text import Text
     from rich import box
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    from rich.live import Live
 except ImportError:
     print("Error: Required 'rich' library not found.")
     print("Please run: pip3 install rich --break-system-packages")
     sys.exit(1)
 
-from utils.cpu import CPUInfo
-from utils.memory import MemoryInfo
-from utils.storage import StorageInfo
-from utils.gpu import GPUInfo
-from utils.sensors import SensorInfo
 from utils.exporter import ExportReport
+from utils.diff import ReportDiff
+from utils.hotplug import DeviceInventory
+from utils.analytics import SensorHistory, NUMPY_AVAILABLE
+from utils.agent import CollectorAgent, FleetCollector
+from utils.registry import create_default_registry, Prefetcher
+from utils.telemetry import GPUTelemetry
+from utils.blockqueue import PROFILES as BLOCK_PROFILES
+from utils.cpufreq import PROFILES as POWER_PROFILES
+from utils.sysctl import PROFILES as SYSCTL_PROFILES
+from utils.sysfs import format_cpulist
+from utils.hwmon import format_value
+from utils.corelatency import CoreLatencyBenchmark, RELATIONS as CORE_LATENCY_RELATIONS
+from utils.bench import run_benchmarks, record_fixture, compare_results
+from utils import profiler as lxz_profiler
+from utils.inventory import add_arguments as add_inventory_arguments, run_inventory
 
 console = Console()
 
 class LXZ:
     """Main application class for LX-Z"""
     
-    def __init__(self):
-        self.cpu_info = CPUInfo()
-        self.memory_info = MemoryInfo()
-        self.storage_info = StorageInfo()
-        self.gpu_info = GPUInfo()
-        self.sensor_info = SensorInfo()
+    def __init__(self, block_profile: str = 'database', power_profile: str = 'balanced',
+                 sysctl_profile: str = 'throughput'):
+        self.inventory = DeviceInventory()
+        self.registry = create_default_registry(
+            inventory=self.inventory,
+            cache_path=os.path.expanduser("~/.cache/lxz/collectors.json")
+        )
+        self.cpu_info = self.registry.get('cpu').source
+        self.memory_info = self.registry.get('memory').source
+        self.storage_info = self.registry.get('storage').source
+        self.gpu_info = self.registry.get('gpu').source
+        self.sensor_info = self.registry.get('sensors').source
+        self.registry.get('blockqueue').source.profile = block_profile
+        self.registry.get('cpufreq').source.profile = power_profile
+        self.registry.get('sysctl').source.profile = sysctl_profile
         self.exporter = ExportReport()
         
+        # Views for registered collectors, menu entries are built from the registry
+        self.views = {
+            'cpu': self.show_cpu_info,
+            'memory': self.show_memory_info,
+            'storage': self.show_storage_info,
+            'gpu': self.show_gpu_info,
+            'motherboard': self.show_motherboard_info,
+            'sensors': self.show_sensor_info,
+            'interrupts': self.show_interrupt_info,
+            'cgroup': self.show_cgroup_info,
+            'mitigations': self.show_mitigation_info,
+            'cpufreq': self.show_frequency_policy,
+            'sysctl': self.show_sysctl_audit,
+            'isolation': self.show_isolation_audit
+        }
+        self.actions = [
+            ("Complete System Overview", self.show_complete_overview),
+            ("Export Report (JSON/TXT)", self.export_report),
+            ("Live Sensor Analytics", self.show_sensor_analytics),
+            ("Live GPU Telemetry", self.show_gpu_telemetry),
+            ("Core-to-Core Latency Benchmark", self.show_core_latency)
+        ]
+        
+        self.inventory.add_listener(self._on_device_change)
+        
+        # Sections are collected in the background while the menu waits for input
+        self.prefetcher = Prefetcher(self.registry)
+    
+    def _on_device_change(self, subsystem: str, action: str, name: str):
+        """Drop cached sections affected by a hot-plug event"""
+        affected = {'block': 'storage', 'pci': 'gpu'}.get(subsystem)
+        if affected:
+            self.registry.invalidate(affected)
+    
+    def get_collectors(self):
+        """Get the report sections and cache-aware functions that collect them"""
+        return {name: partial(self.registry.get_data, name) for name in self.registry.names()}
+    
+    def get_menu(self):
+        """Get numbered menu entries as (option, label, handler)"""
+        entries = []
+        
+        for collector in self.registry:
+            if collector.name not in self.views:
+                continue
+            label = collector.title
+            if self.registry.missing_privileges(collector.name):
+                label += " [dim](limited without root)[/dim]"
+            entries.append((str(len(entries) + 1), label, self.views[collector.name]))
+        
+        for label, handler in self.actions:
+            entries.append((str(len(entries) + 1), label, handler))
+        
+        return entries
+    
     def show_banner(self):
         """Display the application banner"""
         banner = """
@@ -74,20 +160,9 @@ class LXZ:
         table.add_column("Option", style="bold yellow", width=8)
         table.add_column("Description", style="bright_white")
         
-        menu_items = [
-            ("1", "🔹 CPU Information"),
-            ("2", "🔹 Memory (RAM) Information"),
-            ("3", "🔹 Storage Devices"),
-            ("4", "🔹 GPU Information"),
-            ("5", "🔹 Motherboard & BIOS"),
-            ("6", "🔹 Sensors & Hardware Monitor"),
-            ("7", "🔹 Complete System Overview"),
-            ("8", "🔹 Export Report (JSON/TXT)"),
-            ("0", "🔹 Exit")
-        ]
-        
-        for option, description in menu_items:
-            table.add_row(f"[{option}]", description)
+        for option, label, _ in self.get_menu():
+            table.add_row(f"[{option}]", f"🔹 {label}")
+        table.add_row("[0]", "🔹 Exit")
         
         console.print(table)
         console.print()
@@ -103,9 +178,11 @@ class LXZ:
             console=console
         ) as progress:
             task = progress.add_task("[cyan]Gathering CPU information...", total=None)
-            data = self.cpu_info.get_all_info()
+            data = self.prefetcher.get('cpu')
             progress.remove_task(task)
         
+        self.show_age('cpu')
+        
         # CPU Model & Basic Info
         basic_table = Table(
             title="[bold cyan]CPU Information[/bold cyan]",
@@ -123,6 +200,7 @@ class LXZ:
         basic_table.add_row("CPU Family", data.get('cpu_family', 'Unknown'))
         basic_table.add_row("Model Number", data.get('model_number', 'Unknown'))
         basic_table.add_row("Stepping", data.get('stepping', 'Unknown'))
+        basic_table.add_row("Microcode", data.get('microcode', 'Unknown'))
         
         console.print(basic_table)
         console.print()
@@ -140,6 +218,21 @@ class LXZ:
         core_table.add_row("Logical Processors", str(data.get('threads', 'Unknown')))
         core_table.add_row("Sockets", str(data.get('sockets', 'Unknown')))
         
+        # What the workload actually gets when running in a container or slice
+        cgroup = self.prefetcher.get('cgroup')
+        if cgroup['available'] and cgroup['effective']['limited']:
+            effective = cgroup['effective']
+            core_table.add_row("Effective CPUs (cgroup)",
+                               f"[yellow]{effective['cpus']:.2f}[/yellow] of {cgroup['host']['cpus']}")
+        
+        policy = self.prefetcher.get('cpufreq')
+        if policy['available']:
+            governors = ', '.join(policy['settings']['governor'])
+            if len(policy['settings']['governor']) > 1:
+                governors = f"[yellow]{governors} (mixed)[/yellow]"
+            core_table.add_row("Governor", f"{governors} ({', '.join(policy['settings']['driver'])}), "
+                                           f"turbo {policy['boost']}")
+        
         console.print(core_table)
         console.print()
         
@@ -176,19 +269,47 @@ class LXZ:
         console.print(cache_table)
         console.print()
         
+        # Instruction set level, i.e. which optimized builds this CPU can run
+        isa = data.get('isa')
+        if isa:
+            isa_table = Table(
+                title="[bold cyan]Instruction Set[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            isa_table.add_column("Property", style="yellow", width=25)
+            isa_table.add_column("Value", style="bright_white")
+            
+            isa_table.add_row("Feature Level", f"[green]{isa['level']}[/green]")
+            if isa.get('next_level'):
+                isa_table.add_row(f"Missing for {isa['next_level']}",
+                                  f"[dim]{', '.join(isa['missing_for_next'])}[/dim]")
+            if isa['family'] == 'x86-64':
+                avx512 = 'None'
+                if isa['avx512']:
+                    avx512 = f"{isa['avx512_generation'] or 'partial'} ({len(isa['avx512'])} subsets)"
+                isa_table.add_row("AVX-512", avx512)
+                isa_table.add_row("AMX", ', '.join(isa['amx']) or 'None')
+            else:
+                isa_table.add_row("Vector Extensions", ', '.join(isa['vector']) or 'None')
+            isa_table.add_row("Crypto", ', '.join(isa['crypto']) or 'None')
+            
+            console.print(isa_table)
+            console.print()
+        
         # CPU Flags (Features)
         if data.get('flags'):
-            flags_text = ", ".join(data['flags'][:30])  # Show first 30 flags
             flags_panel = Panel(
-                flags_text,
-                title="[bold cyan]CPU Features (Selected)[/bold cyan]",
+                " ".join(data['flags']),
+                title=f"[bold cyan]CPU Features ({len(data['flags'])})[/bold cyan]",
                 border_style="cyan",
                 padding=(1, 2)
             )
             console.print(flags_panel)
             console.print()
         
-        self.pause()
+        if self.pause('cpu'):
+            self.show_cpu_info()
     
     def show_memory_info(self):
         """Display memory information"""
@@ -201,9 +322,11 @@ class LXZ:
             console=console
         ) as progress:
             task = progress.add_task("[cyan]Gathering memory information...", total=None)
-            data = self.memory_info.get_all_info()
+            data = self.prefetcher.get('memory')
             progress.remove_task(task)
         
+        self.show_age('memory')
+        
         # Memory Overview
         mem_table = Table(
             title="[bold cyan]Memory Overview[/bold cyan]",
@@ -219,6 +342,15 @@ class LXZ:
         mem_table.add_row("Free RAM", data.get('free', 'Unknown'))
         mem_table.add_row("Usage Percentage", data.get('percent', 'Unknown'))
         
+        cgroup = self.prefetcher.get('cgroup')
+        if cgroup['available'] and cgroup['effective']['memory_max']:
+            limit = cgroup['effective']['memory_max']
+            current = cgroup['group']['memory_current']
+            mem_table.add_row("Cgroup Memory Limit", f"[yellow]{self._format_bytes(limit)}[/yellow]")
+            if current is not None:
+                mem_table.add_row("Cgroup Memory Usage",
+                                  f"{self._format_bytes(current)} ({current / limit * 100:.1f}%)")
+        
         console.print(mem_table)
         console.print()
         
@@ -250,21 +382,71 @@ class LXZ:
             modules_table.add_column("Size", style="bright_white")
             modules_table.add_column("Type", style="bright_white")
             modules_table.add_column("Speed", style="bright_white")
+            modules_table.add_column("Configured", style="bright_white")
+            modules_table.add_column("Rank", style="bright_white")
             modules_table.add_column("Manufacturer", style="bright_white")
             
             for module in data['modules']:
+                configured = module.get('configured_speed', 'N/A')
+                if 0 < module.get('configured_speed_mts', 0) < module.get('speed_mts', 0):
+                    configured = f"[red]{configured}[/red]"
                 modules_table.add_row(
                     module.get('locator', 'N/A'),
                     module.get('size', 'N/A'),
                     module.get('type', 'N/A'),
                     module.get('speed', 'N/A'),
+                    configured,
+                    module.get('rank', 'N/A'),
                     module.get('manufacturer', 'N/A')
                 )
             
             console.print(modules_table)
             console.print()
         
-        self.pause()
+        # Channel population per socket
+        topology = data.get('topology') or {}
+        if topology.get('sockets'):
+            topology_table = Table(
+                title=f"[bold cyan]DIMM Population ({topology['populated']} of {topology['slots']} slots)[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            topology_table.add_column("Socket", style="yellow")
+            topology_table.add_column("Channel", style="bright_white")
+            topology_table.add_column("DIMMs", style="bright_white")
+            topology_table.add_column("Capacity", style="bright_white")
+            topology_table.add_column("Speed", style="bright_white")
+            topology_table.add_column("Locators", style="bright_white")
+            
+            for socket in topology['sockets']:
+                for index, channel in enumerate(socket['channels']):
+                    topology_table.add_row(
+                        socket['socket'] if index == 0 else '',
+                        channel['channel'],
+                        f"{channel['dimms']} of {channel['slots']}" if channel['dimms'] else "[red]empty[/red]",
+                        self._format_bytes(channel['capacity_bytes']) if channel['dimms'] else '-',
+                        f"{channel['speed_mts']} MT/s" if channel['speed_mts'] else '-',
+                        ', '.join(channel['locators']) or '-'
+                    )
+                topology_table.add_row(
+                    '', f"[bold]{socket['populated_channels']} of {len(socket['channels'])}[/bold]", '',
+                    f"[bold]{self._format_bytes(socket['capacity_bytes'])}[/bold]",
+                    f"[bold]{socket['peak_gbps']} GB/s[/bold]", '',
+                    end_section=True
+                )
+            
+            console.print(topology_table)
+            if topology.get('potential_gbps'):
+                color = "green" if not topology['lost_gbps'] else "yellow"
+                console.print(f"[bold]Theoretical peak bandwidth:[/bold] [{color}]{topology['peak_gbps']} GB/s"
+                              f"[/{color}] of {topology['potential_gbps']} GB/s with every channel populated "
+                              f"at rated speed ({topology['lost_percent']}% lost)")
+            for issue in topology['issues']:
+                console.print(f"[yellow]⚠ {issue}[/yellow]")
+            console.print()
+        
+        if self.pause('memory'):
+            self.show_memory_info()
     
     def show_storage_info(self):
         """Display storage information"""
@@ -277,9 +459,19 @@ class LXZ:
             console=console
         ) as progress:
             task = progress.add_task("[cyan]Gathering storage information...", total=None)
-            data = self.storage_info.get_all_info()
+            # Devices arrive first, partition rows fill in as each statvfs returns
+            stream = self.prefetcher.stream('storage')
+            data = dict([next(stream)])
+            pcie_data = self.prefetcher.get('pcie')
+            device_links = self.registry.get('pcie').source.get_block_device_links(
+                pcie_data['links'], [device.get('name', '') for device in data.get('devices', [])]
+            )
+            nvme_data = self.prefetcher.get('nvme')
+            queue_data = self.prefetcher.get('blockqueue')
             progress.remove_task(task)
         
+        self.show_age('storage')
+        
         # Storage Devices
         if data.get('devices'):
             for device in data['devices']:
@@ -298,39 +490,166 @@ class LXZ:
                 device_table.add_row("Removable", device.get('removable', 'Unknown'))
                 device_table.add_row("Read-Only", device.get('readonly', 'Unknown'))
                 
+                link = device_links.get(device.get('name'))
+                if link:
+                    device_table.add_row(f"PCIe Link ({link['role']})", self._format_pcie_link(link))
+                    device_table.add_row("NUMA Node", link['numa_node'])
+                
                 console.print(device_table)
                 console.print()
         
-        # Partitions
-        if data.get('partitions'):
-            part_table = Table(
-                title="[bold cyan]Partitions & Filesystems[/bold cyan]",
+        # NVMe Controllers & Namespaces
+        if nvme_data.get('controllers'):
+            nvme_table = Table(
+                title="[bold cyan]NVMe Controllers & Namespaces[/bold cyan]",
                 box=box.ROUNDED,
                 border_style="cyan"
             )
-            part_table.add_column("Device", style="yellow")
-            part_table.add_column("Mount Point", style="bright_white")
-            part_table.add_column("Filesystem", style="bright_white")
-            part_table.add_column("Size", style="bright_white")
-            part_table.add_column("Used", style="bright_white")
-            part_table.add_column("Available", style="bright_white")
-            part_table.add_column("Usage", style="bright_white")
-            
-            for part in data['partitions']:
-                part_table.add_row(
-                    part.get('device', 'N/A'),
-                    part.get('mountpoint', 'N/A'),
-                    part.get('fstype', 'N/A'),
-                    part.get('size', 'N/A'),
-                    part.get('used', 'N/A'),
-                    part.get('free', 'N/A'),
-                    part.get('percent', 'N/A')
+            nvme_table.add_column("Device", style="yellow")
+            nvme_table.add_column("Model / Firmware", style="bright_white")
+            nvme_table.add_column("NUMA", style="bright_white")
+            nvme_table.add_column("Size", style="bright_white")
+            nvme_table.add_column("HW Queues", style="bright_white")
+            nvme_table.add_column("nr_requests", style="bright_white")
+            nvme_table.add_column("Scheduler", style="bright_white")
+            nvme_table.add_column("Max HW KB", style="bright_white")
+            
+            for controller in nvme_data['controllers']:
+                nvme_table.add_row(
+                    controller['name'],
+                    f"{controller['model']} / {controller['firmware']}",
+                    controller['numa_node'],
+                    "", "", "", "", ""
                 )
+                for namespace in controller['namespaces']:
+                    scheduler = namespace['scheduler']
+                    if scheduler not in ('none', 'Unknown'):
+                        scheduler = f"[yellow]{scheduler}[/yellow]"
+                    nvme_table.add_row(
+                        f"  └ {namespace['name']} (ns {namespace['nsid']})",
+                        "",
+                        "",
+                        self.storage_info._format_bytes(namespace['size_bytes']),
+                        str(namespace['hw_queues']),
+                        namespace['nr_requests'],
+                        scheduler,
+                        namespace['max_hw_sectors_kb']
+                    )
             
-            console.print(part_table)
+            console.print(nvme_table)
+            
+            for issue in nvme_data.get('issues', []):
+                console.print(f"[yellow]⚠ {issue}[/yellow]")
             console.print()
         
-        self.pause()
+        # Block Queue Tuning
+        if queue_data.get('devices'):
+            queue_table = Table(
+                title=f"[bold cyan]Block Queue Tuning[/bold cyan] [dim](profile: {queue_data['profile']})[/dim]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            queue_table.add_column("Device", style="yellow")
+            queue_table.add_column("Media", style="bright_white")
+            queue_table.add_column("Scheduler", style="bright_white")
+            queue_table.add_column("nr_requests", style="bright_white", justify="right")
+            queue_table.add_column("read_ahead_kb", style="bright_white", justify="right")
+            queue_table.add_column("Write Cache", style="bright_white")
+            queue_table.add_column("Discard Max", style="bright_white", justify="right")
+            queue_table.add_column("Block (L/P)", style="bright_white")
+            
+            flagged = {(issue['device'], issue['attribute']) for issue in queue_data['issues']}
+            
+            def cell(device, attribute):
+                value = device.get(attribute, '') or '-'
+                return f"[red]{value}[/red]" if (device['name'], attribute) in flagged else value
+            
+            for device in queue_data['devices']:
+                queue_table.add_row(
+                    device['name'],
+                    device['media'].upper(),
+                    cell(device, 'scheduler'),
+                    cell(device, 'nr_requests'),
+                    cell(device, 'read_ahead_kb'),
+                    cell(device, 'write_cache'),
+                    cell(device, 'discard_max_bytes'),
+                    f"{cell(device, 'logical_block_size')}/{device.get('physical_block_size', '-')}"
+                )
+            
+            console.print(queue_table)
+            
+            for issue in queue_data['issues']:
+                console.print(f"[yellow]⚠ {issue['device']}: {issue['attribute']}={issue['value']} "
+                              f"(expected {issue['expected']}) - {issue['reason']}[/yellow]")
+            console.print()
+        
+        # Partitions
+        with Live(self._build_partition_table([], pending=True), console=console,
+                  refresh_per_second=10) as live:
+            for key, value in stream:
+                data[key] = value
+                live.update(self._build_partition_table(data.get('partitions', []), pending=True))
+            live.update(self._build_partition_table(data.get('partitions', []), pending=False))
+        
+        for part in data.get('partitions', []):
+            for issue in part.get('issues', []):
+                console.print(f"[yellow]⚠ {part['mountpoint']}: {issue}[/yellow]")
+        console.print()
+        
+        if self.pause('storage'):
+            self.show_storage_info()
+    
+    def _build_partition_table(self, partitions, pending: bool) -> Table:
+        """Build the partition table from the rows collected so far"""
+        part_table = Table(
+            title="[bold cyan]Partitions & Filesystems[/bold cyan]",
+            caption="[dim]Probing filesystems...[/dim]" if pending else None,
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        part_table.add_column("Device", style="yellow")
+        part_table.add_column("Mount Point", style="bright_white")
+        part_table.add_column("Filesystem", style="bright_white")
+        part_table.add_column("Size", style="bright_white")
+        part_table.add_column("Used", style="bright_white")
+        part_table.add_column("Available", style="bright_white")
+        part_table.add_column("Usage", style="bright_white")
+        part_table.add_column("Inodes", style="bright_white")
+        part_table.add_column("Options", style="dim")
+        part_table.add_column("Backing Devices", style="dim")
+        
+        for part in partitions:
+            usage = part.get('percent', 'N/A')
+            if part.get('status', 'ok') != 'ok':
+                usage = f"[red]{usage}[/red]"
+            inodes = part.get('inodes', 'N/A')
+            if inodes.endswith('%') and float(inodes[:-1]) >= 90:
+                inodes = f"[red]{inodes}[/red]"
+            
+            part_table.add_row(
+                part.get('device', 'N/A'),
+                part.get('mountpoint', 'N/A'),
+                part.get('fstype', 'N/A'),
+                part.get('size', 'N/A'),
+                part.get('used', 'N/A'),
+                part.get('free', 'N/A'),
+                usage,
+                inodes,
+                ','.join(part.get('options', [])) or '-',
+                part.get('backing') or '-'
+            )
+        
+        return part_table
+    
+    def _format_pcie_link(self, link) -> str:
+        """Format a PCIe link, highlighting downgraded ones"""
+        text = f"{link['current_link']} (max {link['max_link']})"
+        if link['width_downgraded']:
+            return f"[red]{text} - downgraded[/red]"
+        if link['speed_downgraded']:
+            style = "yellow" if link['note'] and link['role'] == 'GPU' else "red"
+            return f"[{style}]{text} - downgraded[/{style}]"
+        return f"[green]{text}[/green]"
     
     def show_gpu_info(self):
         """Display GPU information"""
@@ -343,7 +662,10 @@ class LXZ:
             console=console
         ) as progress:
             task = progress.add_task("[cyan]Gathering GPU information...", total=None)
-            data = self.gpu_info.get_all_info()
+            # The PCI GPU list arrives first, glxinfo and vulkaninfo fill in below it
+            stream = self.prefetcher.stream('gpu')
+            data = dict([next(stream)])
+            pcie_links = {link['address']: link for link in self.prefetcher.get('pcie')['links']}
             progress.remove_task(task)
         
         if data.get('gpus'):
@@ -364,6 +686,13 @@ class LXZ:
                 
                 if gpu.get('vram'):
                     gpu_table.add_row("VRAM", gpu.get('vram', 'Unknown'))
+                if gpu.get('vbios'):
+                    gpu_table.add_row("VBIOS", gpu.get('vbios', 'Unknown'))
+                
+                link = pcie_links.get(gpu.get('pci_address'))
+                if link:
+                    gpu_table.add_row("PCIe Link", self._format_pcie_link(link))
+                    gpu_table.add_row("NUMA Node", link['numa_node'])
                 
                 console.print(gpu_table)
                 console.print()
@@ -372,25 +701,29 @@ class LXZ:
             console.print()
         
         # Graphics API Support
-        if data.get('opengl') or data.get('vulkan'):
-            api_table = Table(
-                title="[bold cyan]Graphics API Support[/bold cyan]",
-                box=box.ROUNDED,
-                border_style="cyan"
-            )
-            api_table.add_column("API", style="yellow", width=25)
-            api_table.add_column("Status", style="bright_white")
-            
-            if data.get('opengl'):
-                api_table.add_row("OpenGL", data['opengl'])
-            if data.get('vulkan'):
-                api_table.add_row("Vulkan", data['vulkan'])
-            
-            console.print(api_table)
-            console.print()
+        with Live(self._build_api_table(data), console=console, refresh_per_second=10) as live:
+            for key, value in stream:
+                data[key] = value
+                live.update(self._build_api_table(data))
+        console.print()
         
         self.pause()
     
+    def _build_api_table(self, data) -> Table:
+        """Build the graphics API table, with probes still running shown as pending"""
+        api_table = Table(
+            title="[bold cyan]Graphics API Support[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        api_table.add_column("API", style="yellow", width=25)
+        api_table.add_column("Status", style="bright_white")
+        
+        api_table.add_row("OpenGL", data.get('opengl', "[dim]probing...[/dim]"))
+        api_table.add_row("Vulkan", data.get('vulkan', "[dim]probing...[/dim]"))
+        
+        return api_table
+    
     def show_motherboard_info(self):
         """Display motherboard and BIOS information"""
         console.clear()
@@ -402,7 +735,7 @@ class LXZ:
             console=console
         ) as progress:
             task = progress.add_task("[cyan]Gathering motherboard information...", total=None)
-            data = self.memory_info.get_motherboard_info()
+            data = self.prefetcher.get('motherboard')
             progress.remove_task(task)
         
         # Motherboard Info
@@ -451,9 +784,14 @@ class LXZ:
             console=console
         ) as progress:
             task = progress.add_task("[cyan]Gathering sensor information...", total=None)
-            data = self.sensor_info.get_all_info()
+            data = self.prefetcher.get('sensors')
             progress.remove_task(task)
         
+        self.show_age('sensors')
+        
+        channels = data.get('channels', [])
+        alarms = {channel['name']: channel['alarms'] for channel in channels if channel['alarms']}
+        
         # Temperature Sensors
         if data.get('temperatures'):
             temp_table = Table(
@@ -465,11 +803,18 @@ class LXZ:
             temp_table.add_column("Temperature", style="bright_white")
             temp_table.add_column("Status", style="bright_white")
             
+            limits = data.get('limits', {})
             for sensor, temp in data['temperatures'].items():
                 temp_value = float(temp.replace('°C', '').strip()) if '°C' in temp else 0
-                if temp_value > 80:
+                
+                # Prefer the channel's own limits over the generic thresholds
+                hot_limit = limits.get(sensor, {}).get('crit', 80)
+                warm_limit = limits.get(sensor, {}).get('max', 60)
+                if alarms.get(sensor):
+                    status = f"[red]Alarm ({', '.join(alarms[sensor])})[/red]"
+                elif temp_value >= hot_limit:
                     status = "[red]Hot[/red]"
-                elif temp_value > 60:
+                elif temp_value >= warm_limit:
                     status = "[yellow]Warm[/yellow]"
                 else:
                     status = "[green]Normal[/green]"
@@ -488,13 +833,59 @@ class LXZ:
             )
             fan_table.add_column("Fan", style="yellow", width=30)
             fan_table.add_column("Speed (RPM)", style="bright_white")
+            fan_table.add_column("Min", style="bright_white")
+            fan_table.add_column("Status", style="bright_white")
             
+            fan_limits = {channel['name']: channel['limits'] for channel in channels if channel['type'] == 'fan'}
             for fan, speed in data['fans'].items():
-                fan_table.add_row(fan, speed)
+                minimum = fan_limits.get(fan, {}).get('min')
+                if alarms.get(fan):
+                    status = f"[red]Alarm ({', '.join(alarms[fan])})[/red]"
+                elif speed.startswith('0 '):
+                    status = "[dim]Stopped[/dim]"
+                else:
+                    status = "[green]Normal[/green]"
+                fan_table.add_row(fan, speed, f"{minimum:.0f}" if minimum else '-', status)
             
             console.print(fan_table)
             console.print()
         
+        # Voltages, currents and power draw
+        electrical = [channel for channel in channels
+                      if channel['type'] in ('in', 'curr', 'power', 'energy') and channel['value'] is not None]
+        if electrical:
+            power_table = Table(
+                title="[bold cyan]Voltage, Current & Power[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            power_table.add_column("Sensor", style="yellow", width=30)
+            power_table.add_column("Value", style="bright_white", justify="right")
+            power_table.add_column("Min", style="bright_white", justify="right")
+            power_table.add_column("Max", style="bright_white", justify="right")
+            power_table.add_column("Status", style="bright_white")
+            
+            for channel in electrical:
+                limits = channel['limits']
+                low = limits.get('min', limits.get('lcrit'))
+                high = limits.get('max', limits.get('cap', limits.get('crit')))
+                if channel['alarms']:
+                    status = f"[red]Alarm ({', '.join(channel['alarms'])})[/red]"
+                elif (low is not None and channel['value'] < low) or (high is not None and channel['value'] > high):
+                    status = "[yellow]Out of range[/yellow]"
+                else:
+                    status = "[green]Normal[/green]"
+                power_table.add_row(
+                    channel['name'],
+                    format_value(channel),
+                    f"{low:g} {channel['unit']}" if low is not None else '-',
+                    f"{high:g} {channel['unit']}" if high is not None else '-',
+                    status
+                )
+            
+            console.print(power_table)
+            console.print()
+        
         # Battery Info (if laptop)
         if data.get('battery'):
             battery_table = Table(
@@ -511,10 +902,847 @@ class LXZ:
             console.print(battery_table)
             console.print()
         
-        if not data.get('temperatures') and not data.get('fans') and not data.get('battery'):
+        if not data.get('temperatures') and not channels and not data.get('battery'):
             console.print("[yellow]No sensor information available. Run with sudo for better results.[/yellow]")
             console.print()
         
+        if self.pause('sensors'):
+            self.show_sensor_info()
+    
+    def _heatmap_buckets(self, cpus, cpu_nodes, width: int = 64):
+        """Group CPU columns into at most width buckets, split at NUMA node boundaries"""
+        per_bucket = max(1, -(-len(cpus) // width))
+        groups = []
+        for index, node in enumerate(cpu_nodes):
+            if not groups or groups[-1][0] != node:
+                groups.append((node, [[]]))
+            buckets = groups[-1][1]
+            if len(buckets[-1]) == per_bucket:
+                buckets.append([])
+            buckets[-1].append(index)
+        return per_bucket, [buckets for _, buckets in groups]
+    
+    def _format_heatmap(self, values, groups) -> str:
+        """Format per-CPU values as shaded cells relative to the row maximum"""
+        shades = [("·", "dim"), ("░", "green"), ("▒", "yellow"), ("▓", "dark_orange"), ("█", "red")]
+        totals = [[sum(values[i] for i in bucket) for bucket in buckets] for buckets in groups]
+        peak = max((total for node_totals in totals for total in node_totals), default=0)
+        
+        parts = []
+        for node_totals in totals:
+            cells = []
+            for total in node_totals:
+                level = 0 if total <= 0 or peak <= 0 else min(4, 1 + int(total / peak * 3.999))
+                char, style = shades[level]
+                cells.append(f"[{style}]{char}[/{style}]")
+            parts.append(''.join(cells))
+        return '[dim]│[/dim]'.join(parts)
+    
+    def show_interrupt_info(self):
+        """Display interrupt and softirq distribution across CPUs"""
+        console.clear()
+        self.show_banner()
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("[cyan]Sampling interrupts...", total=None)
+            data = self.prefetcher.get('interrupts')
+            progress.remove_task(task)
+        
+        if not data['cpus']:
+            console.print("[yellow]/proc/interrupts is not readable.[/yellow]\n")
+            self.pause()
+            return
+        
+        per_bucket, groups = self._heatmap_buckets(data['cpus'], data['cpu_nodes'])
+        scale = f"1 column = {per_bucket} CPUs" if per_bucket > 1 else "1 column = 1 CPU"
+        if data['numa_nodes'] > 1:
+            scale += ", │ separates NUMA nodes"
+        console.print(f"[dim]{data['total_rate']:.0f} interrupts/s over {data['interval']:.1f}s on "
+                      f"{len(data['cpus'])} CPUs ({scale})[/dim]\n")
+        
+        irq_table = Table(
+            title="[bold cyan]Device Interrupts per CPU[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        irq_table.add_column("Device", style="yellow")
+        irq_table.add_column("IRQs", style="bright_white", justify="right")
+        irq_table.add_column("Rate/s", style="bright_white", justify="right")
+        irq_table.add_column("Node", style="bright_white", justify="right")
+        irq_table.add_column("Affinity", style="bright_white")
+        irq_table.add_column("CPUs", no_wrap=True)
+        
+        irq_table.add_row("[bold]All devices[/bold]", "", f"{data['total_rate']:.0f}", "", "",
+                          self._format_heatmap(data['cpu_totals'], groups))
+        for device in [device for device in data['devices'] if device['rate'] > 0][:20]:
+            irq_table.add_row(
+                device['device'],
+                str(device['irqs']),
+                f"{device['rate']:.0f}",
+                str(device['node']) if device['node'] is not None else '-',
+                format_cpulist(device['affinity']) or '-',
+                self._format_heatmap(device['per_cpu'], groups)
+            )
+        
+        console.print(irq_table)
+        console.print()
+        
+        if data['softirqs']:
+            softirq_table = Table(
+                title="[bold cyan]Softirqs per CPU[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            softirq_table.add_column("Softirq", style="yellow")
+            softirq_table.add_column("Rate/s", style="bright_white", justify="right")
+            softirq_table.add_column("CPUs", no_wrap=True)
+            
+            for name, softirq in data['softirqs'].items():
+                softirq_table.add_row(name, f"{softirq['rate']:.0f}",
+                                      self._format_heatmap(softirq['per_cpu'], groups))
+            
+            console.print(softirq_table)
+            console.print()
+        
+        for issue in data['issues']:
+            console.print(f"[yellow]⚠ {issue}[/yellow]")
+        if data['issues']:
+            console.print()
+        
+        self.pause()
+    
+    def _format_bytes(self, value) -> str:
+        """Format a byte count for display"""
+        if value is None:
+            return 'none'
+        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+            if value < 1024:
+                return f"{value:.2f} {unit}"
+            value /= 1024
+        return f"{value:.2f} PB"
+    
+    def show_cgroup_info(self):
+        """Display cgroup v2 limits, usage and pressure next to host totals"""
+        console.clear()
+        self.show_banner()
+        
+        data = self.prefetcher.get('cgroup')
+        if not data['available']:
+            console.print(f"[yellow]{data['reason']}[/yellow]\n")
+            self.pause()
+            return
+        
+        effective = data['effective']
+        group = data['group']
+        host = data['host']
+        
+        console.print(f"[dim]cgroup {data['path']} on {data['mount']}"
+                      f"{' - ' + data['container'] if data['container'] else ''}[/dim]\n")
+        
+        limit_table = Table(
+            title="[bold cyan]Effective Limits vs. Host[/bold cyan]",
+            box=box.DOUBLE_EDGE,
+            border_style="cyan"
+        )
+        limit_table.add_column("Resource", style="yellow", width=25)
+        limit_table.add_column("Cgroup", style="bright_white")
+        limit_table.add_column("Host", style="bright_white")
+        
+        quota = f"{effective['cpu_quota']:.2f} CPUs" if effective['cpu_quota'] is not None else 'none'
+        cpuset = f"{effective['cpuset_cpus']} CPUs" if effective['cpuset_cpus'] else 'all'
+        limit_table.add_row("Effective CPUs", f"{effective['cpus']:.2f}", str(host['cpus']))
+        limit_table.add_row("CPU Quota (cpu.max)", quota, "")
+        limit_table.add_row("CPU Set", cpuset, "")
+        limit_table.add_row("CPU Weight", group['cpu_weight'] or 'N/A', "")
+        limit_table.add_row("Memory Limit (memory.max)", self._format_bytes(effective['memory_max']),
+                            self._format_bytes(host['memory_bytes']))
+        limit_table.add_row("Memory High (memory.high)", self._format_bytes(effective['memory_high']), "")
+        limit_table.add_row("Memory Usage", self._format_bytes(group['memory_current']), "")
+        limit_table.add_row("Memory Peak", self._format_bytes(group['memory_peak']), "")
+        limit_table.add_row("Swap Usage / Limit",
+                            f"{self._format_bytes(group['swap_current'])} / {self._format_bytes(group['swap_max'])}", "")
+        limit_table.add_row("Pids", f"{group['pids_current'] or 'N/A'} / {effective['pids_max'] or 'none'}", "")
+        
+        stat = group['cpu_stat']
+        if stat.get('nr_periods'):
+            limit_table.add_row("Throttled Periods",
+                                f"{stat.get('nr_throttled', 0)} of {stat['nr_periods']} "
+                                f"({stat.get('throttled_usec', 0) / 1e6:.1f}s)", "")
+        
+        console.print(limit_table)
+        console.print()
+        
+        if group['pressure']:
+            pressure_table = Table(
+                title="[bold cyan]Pressure Stall Information[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            pressure_table.add_column("Resource", style="yellow")
+            pressure_table.add_column("some avg10/60/300", style="bright_white")
+            pressure_table.add_column("full avg10/60/300", style="bright_white")
+            
+            for resource, pressure in group['pressure'].items():
+                cells = []
+                for kind in ('some', 'full'):
+                    values = pressure.get(kind)
+                    cells.append(f"{values.get('avg10', 0):.2f}% / {values.get('avg60', 0):.2f}% / "
+                                 f"{values.get('avg300', 0):.2f}%" if values else 'N/A')
+                pressure_table.add_row(resource, *cells)
+            
+            console.print(pressure_table)
+            console.print()
+        
+        if group['io']:
+            io_table = Table(
+                title="[bold cyan]IO by Device (io.stat)[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            io_table.add_column("Device", style="yellow")
+            io_table.add_column("Read", style="bright_white", justify="right")
+            io_table.add_column("Written", style="bright_white", justify="right")
+            io_table.add_column("Read IOs", style="bright_white", justify="right")
+            io_table.add_column("Write IOs", style="bright_white", justify="right")
+            
+            for device in group['io']:
+                io_table.add_row(device['device'], self._format_bytes(device.get('rbytes', 0)),
+                                 self._format_bytes(device.get('wbytes', 0)),
+                                 str(device.get('rios', 0)), str(device.get('wios', 0)))
+            
+            console.print(io_table)
+            console.print()
+        
+        for issue in data['issues']:
+            console.print(f"[yellow]⚠ {issue}[/yellow]")
+        if data['issues']:
+            console.print()
+        
+        choice = console.input("[bold yellow]Rank all cgroups by \\[c]pu, \\[m]emory or \\[i]o "
+                               "(Enter to go back):[/bold yellow] ").strip().lower()
+        sort = {'c': 'cpu', 'm': 'memory', 'i': 'io'}.get(choice[:1])
+        if not sort:
+            return
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("[cyan]Sampling all cgroups...", total=None)
+            ranked = self.registry.get('cgroup').source.rank_cgroups(sort=sort)
+            progress.remove_task(task)
+        
+        rank_table = Table(
+            title=f"[bold cyan]Top Cgroups by {sort.upper() if sort == 'io' else sort.title()}[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        rank_table.add_column("Cgroup", style="yellow")
+        rank_table.add_column("CPU", style="bright_white", justify="right")
+        rank_table.add_column("Memory", style="bright_white", justify="right")
+        rank_table.add_column("IO/s", style="bright_white", justify="right")
+        rank_table.add_column("Mem Pressure", style="bright_white", justify="right")
+        rank_table.add_column("Pids", style="bright_white", justify="right")
+        
+        for entry in ranked:
+            path = entry['path'] if entry['leaf'] else f"[dim]{entry['path']}[/dim]"
+            rank_table.add_row(path, f"{entry['cpu_percent']:.1f}%", self._format_bytes(entry['memory_bytes']),
+                               self._format_bytes(entry['io_bytes_per_sec']), f"{entry['memory_pressure']:.1f}%",
+                               str(entry['pids']))
+        
+        console.print(rank_table)
+        console.print("[dim]Dimmed rows are parents and include their children's usage[/dim]\n")
+        
+        self.pause()
+    
+    def show_mitigation_info(self):
+        """Display CPU vulnerability mitigations, microcode and their performance cost"""
+        console.clear()
+        self.show_banner()
+        
+        data = self.prefetcher.get('mitigations')
+        
+        states = {
+            'not_affected': "[dim green]Not affected[/dim green]",
+            'mitigated': "[green]Mitigated[/green]",
+            'partial': "[yellow]Partial[/yellow]",
+            'vulnerable': "[red]Vulnerable[/red]",
+            'unknown': "[dim]Unknown[/dim]"
+        }
+        
+        vuln_table = Table(
+            title="[bold cyan]CPU Vulnerabilities[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        vuln_table.add_column("Vulnerability", style="yellow")
+        vuln_table.add_column("State", style="bright_white")
+        vuln_table.add_column("Kernel Status", style="bright_white")
+        
+        for vulnerability in data['vulnerabilities']:
+            status = vulnerability['status'] if vulnerability['state'] != 'not_affected' else ''
+            vuln_table.add_row(vulnerability['name'], states[vulnerability['state']], status)
+        
+        if data['vulnerabilities']:
+            console.print(vuln_table)
+        else:
+            console.print("[yellow]The kernel does not report CPU vulnerabilities[/yellow]")
+        console.print()
+        
+        state_table = Table(
+            title="[bold cyan]Microcode & Kernel Parameters[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        state_table.add_column("Property", style="yellow", width=25)
+        state_table.add_column("Value", style="bright_white")
+        
+        microcode = data['microcode']
+        revision = microcode['revision']
+        if not microcode['consistent']:
+            revision = f"[red]{', '.join(microcode['revisions'])}[/red]"
+        state_table.add_row("Microcode Revision", revision)
+        state_table.add_row("SMT", f"{data['smt']['control']} ({'active' if data['smt']['active'] else 'inactive'})")
+        parameters = ' '.join(f"{key}={value}" if value != 'on' else key
+                              for key, value in data['parameters'].items())
+        state_table.add_row("Mitigation Parameters", parameters or "[dim]none (kernel defaults)[/dim]")
+        
+        console.print(state_table)
+        console.print()
+        
+        if data['costs']:
+            cost_table = Table(
+                title="[bold cyan]Mitigations With a Performance Cost[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            cost_table.add_column("Mitigation", style="yellow")
+            cost_table.add_column("For", style="bright_white")
+            cost_table.add_column("Typical Impact", style="bright_white")
+            
+            for cost in data['costs']:
+                cost_table.add_row(cost['mitigation'], cost['vulnerability'], cost['cost'])
+            
+            console.print(cost_table)
+            console.print("[dim]Impact depends on the workload; compare hosts with lxz diff before blaming hardware[/dim]\n")
+        else:
+            console.print("[green]✓ No mitigations with a known high performance cost are active[/green]\n")
+        
+        for issue in data['issues']:
+            console.print(f"[yellow]⚠ {issue}[/yellow]")
+        if data['issues']:
+            console.print()
+        
+        self.pause()
+    
+    def show_frequency_policy(self):
+        """Display cpufreq governors, EPP, boost and platform profile across all CPUs"""
+        console.clear()
+        self.show_banner()
+        
+        data = self.prefetcher.get('cpufreq')
+        
+        if not data['available']:
+            console.print("[yellow]No cpufreq policies found: the CPU frequency is managed by firmware "
+                          "or a hypervisor[/yellow]\n")
+            self.pause()
+            return
+        
+        system_table = Table(
+            title=f"[bold cyan]CPU Frequency Policy[/bold cyan] [dim](profile: {data['profile']})[/dim]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        system_table.add_column("Setting", style="yellow", width=28)
+        system_table.add_column("Value", style="bright_white")
+        
+        labels = {
+            'driver': "Scaling Driver",
+            'governor': "Governor",
+            'epp': "Energy/Performance Pref.",
+            'boost': "Turbo / Boost",
+            'energy_perf_bias': "Energy/Performance Bias"
+        }
+        for setting, label in labels.items():
+            groups = data['settings'][setting]
+            if not groups:
+                continue
+            if len(groups) == 1:
+                value = next(iter(groups))
+            else:
+                value = "[yellow]" + ', '.join(f"{value} on {cpus}" for value, cpus in groups.items()) + "[/yellow]"
+            if setting == 'boost' and data['boost_control']:
+                value += f" [dim]({data['boost_control']})[/dim]"
+            system_table.add_row(label, value)
+        
+        if data['intel_pstate']:
+            pstate = data['intel_pstate']
+            system_table.add_row("intel_pstate", f"{pstate['status'] or 'Unknown'}, perf "
+                                                 f"{pstate['min_perf_pct'] or '?'}-{pstate['max_perf_pct'] or '?'}%")
+        if data['amd_pstate']:
+            system_table.add_row("amd_pstate", data['amd_pstate'])
+        if data['platform_profile']:
+            choices = ' '.join(data['platform_profile_choices'])
+            system_table.add_row("Platform Profile", f"{data['platform_profile']} [dim]({choices})[/dim]")
+        
+        console.print(system_table)
+        console.print()
+        
+        policy_table = Table(
+            title="[bold cyan]Policies[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        policy_table.add_column("Policy", style="yellow")
+        policy_table.add_column("CPUs", style="bright_white")
+        policy_table.add_column("Governor", style="bright_white")
+        policy_table.add_column("EPP", style="bright_white")
+        policy_table.add_column("Min MHz", style="bright_white", justify="right")
+        policy_table.add_column("Max MHz", style="bright_white", justify="right")
+        policy_table.add_column("Current", style="bright_white", justify="right")
+        
+        for policy in data['policies']:
+            max_freq = str(policy['max_freq'] or '-')
+            if policy['capped']:
+                max_freq = f"[red]{max_freq}[/red] [dim]of {policy['hw_max_freq']}[/dim]"
+            min_freq = str(policy['min_freq'] or '-')
+            if policy['raised']:
+                min_freq = f"[yellow]{min_freq}[/yellow]"
+            policy_table.add_row(
+                policy['policy'],
+                format_cpulist(policy['cpus']),
+                policy['governor'],
+                policy['epp'] or '-',
+                min_freq,
+                max_freq,
+                str(policy['cur_freq'] or '-')
+            )
+        
+        console.print(policy_table)
+        console.print()
+        
+        for issue in data['issues']:
+            console.print(f"[yellow]⚠ {issue}[/yellow]")
+        if not data['issues']:
+            console.print(f"[green]✓ Frequency policy is consistent and matches the {data['profile']} profile[/green]")
+        console.print()
+        
+        self.pause()
+    
+    def show_sysctl_audit(self):
+        """Display audited sysctls and the THP mode with deviations from the workload profile"""
+        console.clear()
+        self.show_banner()
+        
+        data = self.prefetcher.get('sysctl')
+        
+        if not data['available']:
+            console.print("[yellow]/proc/sys is not readable[/yellow]\n")
+            self.pause()
+            return
+        
+        deviations = {deviation['setting']: deviation for deviation in data['deviations']}
+        
+        values_table = Table(
+            title=f"[bold cyan]Kernel Tunables[/bold cyan] [dim](profile: {data['profile']})[/dim]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        values_table.add_column("Setting", style="yellow")
+        values_table.add_column("Value", style="bright_white")
+        values_table.add_column("Expected", style="bright_white")
+        
+        previous_group = None
+        for setting, value in data['values'].items():
+            if not value:
+                continue
+            group = setting.split('.', 1)[0]
+            if previous_group and group != previous_group:
+                values_table.add_section()
+            previous_group = group
+            
+            deviation = deviations.get(setting)
+            values_table.add_row(
+                setting,
+                f"[red]{value}[/red]" if deviation else value,
+                deviation['expected'] if deviation else ''
+            )
+        
+        console.print(values_table)
+        console.print()
+        
+        if data['deviations']:
+            deviation_table = Table(
+                title=f"[bold cyan]Deviations From the {data['profile']} Profile[/bold cyan]",
+                box=box.ROUNDED,
+                border_style="cyan"
+            )
+            deviation_table.add_column("Setting", style="yellow")
+            deviation_table.add_column("Value", style="red")
+            deviation_table.add_column("Expected", style="green")
+            deviation_table.add_column("Why", style="bright_white")
+            
+            for deviation in data['deviations']:
+                deviation_table.add_row(deviation['setting'], deviation['value'], deviation['expected'],
+                                        deviation['reason'])
+            
+            console.print(deviation_table)
+            console.print("[dim]Other profiles: --sysctl-profile " + ', '.join(sorted(SYSCTL_PROFILES)) + "[/dim]\n")
+        else:
+            console.print(f"[green]✓ All audited settings match the {data['profile']} profile[/green]\n")
+        
+        self.pause()
+    
+    def show_isolation_audit(self):
+        """Display isolated CPUs with the interrupts and threads that reached them"""
+        console.clear()
+        self.show_banner()
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("[cyan]Sampling threads and interrupts...", total=None)
+            data = self.prefetcher.get('isolation')
+            progress.remove_task(task)
+        
+        if not data['isolated_cpus']:
+            console.print("[yellow]No CPUs are isolated: isolcpus, nohz_full and cpuset isolated partitions "
+                          "are all empty[/yellow]\n")
+            self.pause()
+            return
+        
+        cmdline = data['cmdline']
+        irqbalance = data['irqbalance']
+        settings_table = Table(
+            title="[bold cyan]CPU Isolation[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        settings_table.add_column("Property", style="yellow", width=25)
+        settings_table.add_column("Value", style="bright_white")
+        
+        settings_table.add_row("Isolated CPUs", data['isolated'])
+        settings_table.add_row("Housekeeping CPUs", data['housekeeping'] or 'None')
+        isolcpus = data['sources']['isolcpus'] or 'None'
+        if cmdline['isolcpus_flags']:
+            isolcpus += f" [dim]({cmdline['isolcpus_flags']})[/dim]"
+        settings_table.add_row("isolcpus", isolcpus)
+        settings_table.add_row("nohz_full", data['sources']['nohz_full'] or 'None')
+        settings_table.add_row("rcu_nocbs", data['sources']['rcu_nocbs'] or 'None')
+        if data['sources']['cpuset']:
+            settings_table.add_row("Cpuset Isolated", data['sources']['cpuset'])
+        settings_table.add_row("Default IRQ Affinity", data['default_irq_affinity'] or 'Unknown')
+        settings_table.add_row("Workqueue CPU Mask", data['workqueue_cpumask'] or 'Unknown')
+        settings_table.add_row("irqbalance", ("running" if irqbalance['running'] else "not running") + (
+            f", bans CPUs {irqbalance['banned']}" if irqbalance['banned'] else ''))
+        
+        console.print(settings_table)
+        console.print()
+        
+        cpu_table = Table(
+            title=f"[bold cyan]Isolated CPUs[/bold cyan] [dim](sampled over {data['interval']:.1f}s)[/dim]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        cpu_table.add_column("CPU", style="yellow", justify="right")
+        cpu_table.add_column("Node", style="bright_white", justify="right")
+        cpu_table.add_column("Sibling", style="bright_white")
+        cpu_table.add_column("Mode", style="bright_white")
+        cpu_table.add_column("IRQs/s", style="bright_white", justify="right")
+        cpu_table.add_column("Tick/s", style="bright_white", justify="right")
+        cpu_table.add_column("IPIs/s", style="bright_white", justify="right")
+        cpu_table.add_column("Threads", style="bright_white")
+        cpu_table.add_column("Status", style="bright_white")
+        
+        for entry in data['cpus']:
+            modes = [mode for mode in ('isolcpus', 'nohz_full', 'rcu_nocb', 'cpuset') if entry[mode]]
+            threads = ', '.join(f"{task['comm']} {task['cpu_percent']:.0f}%" for task in entry['tasks']
+                                if task['kind'] != 'per-cpu kthread')
+            kthreads = sum(1 for task in entry['tasks'] if task['kind'] == 'per-cpu kthread')
+            if kthreads:
+                threads += f"{', ' if threads else ''}[dim]+{kthreads} per-CPU kthreads[/dim]"
+            status = (f"[yellow]⚠ {len(entry['contamination'])}[/yellow]" if entry['contamination']
+                      else "[green]✓ Clean[/green]")
+            cpu_table.add_row(
+                str(entry['cpu']),
+                str(entry['node']) if entry['node'] is not None else '-',
+                entry['siblings'] or '-',
+                ', '.join(modes),
+                f"{entry['irq_rate']:.0f}",
+                f"{entry['tick_rate']:.0f}",
+                f"{entry['ipi_rate']:.0f}",
+                threads or '[dim]idle[/dim]',
+                status
+            )
+        
+        console.print(cpu_table)
+        console.print()
+        
+        if data['issues']:
+            for issue in data['issues']:
+                console.print(f"[yellow]⚠ {issue}[/yellow]")
+            console.print()
+        else:
+            console.print("[green]✓ No interrupts or foreign threads reached the isolated CPUs[/green]\n")
+        
+        self.pause()
+    
+    def _build_analytics_table(self, results, ticks: int) -> Table:
+        """Build the live sensor analytics table"""
+        table = Table(
+            title=f"[bold cyan]Live Sensor Analytics[/bold cyan] [dim]({ticks} samples, Ctrl+C to stop)[/dim]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        table.add_column("Channel", style="yellow")
+        table.add_column("Current", style="bright_white", justify="right")
+        table.add_column("Mean", style="bright_white", justify="right")
+        table.add_column("P95", style="bright_white", justify="right")
+        table.add_column("Max", style="bright_white", justify="right")
+        table.add_column("Rate/s", style="bright_white", justify="right")
+        table.add_column("Z", style="bright_white", justify="right")
+        table.add_column("Status", style="bright_white")
+        
+        status_styles = {
+            'critical': "[red]Critical[/red]",
+            'hot': "[yellow]Hot[/yellow]",
+            'anomaly': "[magenta]Anomaly[/magenta]",
+            'normal': "[green]Normal[/green]"
+        }
+        
+        for channel, stats in sorted(results.items()):
+            rate = stats['rate']
+            table.add_row(
+                channel,
+                f"{stats['current']:.1f}",
+                f"{stats['mean']:.1f}",
+                f"{stats['p95']:.1f}",
+                f"{stats['max']:.1f}",
+                f"{rate:+.2f}" if rate == rate else "-",
+                f"{stats['zscore']:+.1f}",
+                status_styles[stats['status']]
+            )
+        
+        return table
+    
+    def show_sensor_analytics(self, interval: float = 1.0):
+        """Display rolling sensor statistics sampled every interval"""
+        console.clear()
+        self.show_banner()
+        
+        if not NUMPY_AVAILABLE:
+            console.print("[yellow]Sensor analytics requires NumPy. Install it with: pip3 install numpy[/yellow]")
+            self.pause()
+            return
+        
+        history = SensorHistory()
+        history.set_limits(self.sensor_info.get_sample_limits())
+        
+        ticks = 0
+        try:
+            with Live(console=console, auto_refresh=False) as live:
+                while True:
+                    history.record(self.sensor_info.sample())
+                    ticks += 1
+                    live.update(self._build_analytics_table(history.analyze(), ticks), refresh=True)
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        
+        console.print()
+        self.pause()
+    
+    def _build_telemetry_table(self, samples, interval: float) -> Table:
+        """Build the live GPU telemetry table, dimming GPUs whose last sample is older than two intervals"""
+        table = Table(
+            title="[bold cyan]Live GPU Telemetry[/bold cyan] [dim](Ctrl+C to stop)[/dim]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        table.add_column("GPU", style="yellow")
+        table.add_column("Name", style="bright_white")
+        table.add_column("Util", style="bright_white", justify="right")
+        table.add_column("VRAM (MiB)", style="bright_white", justify="right")
+        table.add_column("Power", style="bright_white", justify="right")
+        table.add_column("Core", style="bright_white", justify="right")
+        table.add_column("Memory", style="bright_white", justify="right")
+        table.add_column("Temp", style="bright_white", justify="right")
+        table.add_column("Age", style="bright_white", justify="right")
+        
+        def fmt(value, template):
+            return template.format(value) if value is not None else "-"
+        
+        for sample in samples:
+            if sample['memory_used'] is not None and sample['memory_total']:
+                vram = f"{sample['memory_used']:.0f} / {sample['memory_total']:.0f}"
+            else:
+                vram = "-"
+            # A dead nvidia-smi stream leaves its last values behind
+            stale = sample['age'] > 2 * interval
+            table.add_row(
+                sample['id'],
+                sample['name'],
+                fmt(sample['utilization'], "{:.0f}%"),
+                vram,
+                fmt(sample['power'], "{:.1f} W"),
+                fmt(sample['core_clock'], "{:.0f} MHz"),
+                fmt(sample['memory_clock'], "{:.0f} MHz"),
+                fmt(sample['temperature'], "{:.0f}°C"),
+                f"[red]{sample['age']:.1f}s stale[/red]" if stale else f"{sample['age']:.1f}s",
+                style="dim" if stale else None
+            )
+        
+        return table
+    
+    def show_gpu_telemetry(self, interval: float = 0.5):
+        """Display live per-GPU utilization, memory, power and clocks"""
+        console.clear()
+        self.show_banner()
+        
+        telemetry = GPUTelemetry(interval_ms=int(interval * 1000))
+        if not telemetry.start():
+            console.print("[yellow]No GPU telemetry source found (nvidia-smi or AMD/Intel DRM sysfs).[/yellow]")
+            self.pause()
+            return
+        
+        try:
+            with Live(console=console, auto_refresh=False) as live:
+                while True:
+                    live.update(self._build_telemetry_table(telemetry.sample(), interval), refresh=True)
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            telemetry.stop()
+        
+        console.print()
+        self.pause()
+    
+    def _format_latency_row(self, matrix, row_bucket, groups, low: float, high: float) -> str:
+        """Format the mean latency from one row bucket to every column bucket as shaded cells"""
+        shades = [("█", "green"), ("▓", "bright_green"), ("▒", "yellow"), ("░", "dark_orange"), ("#", "red")]
+        parts = []
+        for buckets in groups:
+            cells = []
+            for bucket in buckets:
+                values = [matrix[row][column] for row in row_bucket for column in bucket
+                          if matrix[row][column] is not None]
+                if not values:
+                    cells.append("[dim]·[/dim]")
+                    continue
+                mean = sum(values) / len(values)
+                level = 0 if high <= low else min(4, int((mean - low) / (high - low) * 4.999))
+                char, style = shades[level]
+                cells.append(f"[{style}]{char}[/{style}]")
+            parts.append(''.join(cells))
+        return '[dim]│[/dim]'.join(parts)
+    
+    def show_core_latency(self):
+        """Measure and display the core-to-core latency matrix grouped by cache and NUMA topology"""
+        console.clear()
+        self.show_banner()
+        
+        benchmark = CoreLatencyBenchmark()
+        if len(benchmark.cpus) < 2:
+            console.print("[yellow]At least two usable CPUs are needed to measure core-to-core latency.[/yellow]\n")
+            self.pause()
+            return
+        
+        pairs = len(benchmark.cpus) * (len(benchmark.cpus) - 1) // 2
+        console.print(f"[dim]Ping-ponging a cache line between {pairs} CPU pairs, "
+                      f"{benchmark.iterations} round trips x {benchmark.samples} samples each...[/dim]\n")
+        
+        # Background collection would steal cycles from the pinned workers, the menu restarts it afterwards
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        ) as progress:
+            progress.add_task("[cyan]Waiting for background collection to finish...", total=None)
+            self.prefetcher.stop(wait=True)
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total} pairs"),
+                console=console
+            ) as progress:
+                task = progress.add_task("[cyan]Measuring core-to-core latency...", total=pairs)
+                data = benchmark.run(lambda done, total: progress.update(task, completed=done))
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Benchmark cancelled.[/yellow]\n")
+            self.pause()
+            return
+        
+        cpus = data['cpus']
+        topology = data['topology']
+        values = [value for row in data['matrix'] for value in row if value is not None]
+        if not values:
+            console.print("[yellow]No CPU pair could be measured.[/yellow]\n")
+            self.pause()
+            return
+        
+        # Columns and rows split wherever the last-level cache or NUMA node changes
+        keys = [(topology[cpu]['node'], topology[cpu]['cache']) for cpu in cpus]
+        per_bucket, groups = self._heatmap_buckets(cpus, keys)
+        low, high = min(values), max(values)
+        nodes = len({topology[cpu]['node'] for cpu in cpus})
+        scale = f"1 cell = {per_bucket} x {per_bucket} CPUs" if per_bucket > 1 else "1 cell = 1 CPU pair"
+        console.print(f"[bold cyan]Core-to-Core Latency[/bold cyan] [dim]({len(cpus)} CPUs in "
+                      f"{data['elapsed']:.1f}s, {scale}, │ separates last-level caches"
+                      f"{' and NUMA nodes' if nodes > 1 else ''})[/dim]\n")
+        
+        label_width = max(len(format_cpulist([cpus[i] for i in bucket])) for buckets in groups for bucket in buckets)
+        for group_index, buckets in enumerate(groups):
+            if group_index:
+                console.print(' ' * (label_width + 1) + '[dim]' + '┼'.join(
+                    '─' * len(column_buckets) for column_buckets in groups) + '[/dim]')
+            for bucket in buckets:
+                label = format_cpulist([cpus[i] for i in bucket])
+                console.print(f"[yellow]{label:>{label_width}}[/yellow] "
+                              + self._format_latency_row(data['matrix'], bucket, groups, low, high))
+        console.print(f"\n[dim]Shading: [green]█[/green] {low:.0f} ns ... [red]#[/red] {high:.0f} ns "
+                      f"(one-way, mean per cell)[/dim]\n")
+        
+        relation_table = Table(
+            title="[bold cyan]Latency by Topology[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        relation_table.add_column("CPU Pairs", style="yellow")
+        relation_table.add_column("Pairs", style="bright_white", justify="right")
+        relation_table.add_column("Min", style="bright_white", justify="right")
+        relation_table.add_column("Median", style="bright_white", justify="right")
+        relation_table.add_column("Max", style="bright_white", justify="right")
+        
+        for relation, stats in data['relations'].items():
+            relation_table.add_row(
+                CORE_LATENCY_RELATIONS[relation],
+                str(stats['pairs']),
+                f"{stats['min_ns']:.0f} ns",
+                f"{stats['median_ns']:.0f} ns",
+                f"{stats['max_ns']:.0f} ns"
+            )
+        
+        console.print(relation_table)
+        console.print("[dim]Latencies include Python interpreter overhead on both sides: compare pairs with each "
+                      "other rather than with native tools.[/dim]\n")
+        
+        if data['failed']:
+            plural = len(data['failed']) > 1
+            console.print(f"[yellow]⚠ Could not pin to CPU{'s' if plural else ''} {format_cpulist(data['failed'])}, "
+                          f"{'they were' if plural else 'it was'} skipped[/yellow]\n")
+        
         self.pause()
     
     def show_complete_overview(self):
@@ -524,16 +1752,12 @@ class LXZ:
         
         console.print("[bold cyan]Generating complete system report...[/bold cyan]\n")
         
-        # Show all sections in compact form
-        sections = [
-            ("CPU", self.cpu_info.get_summary),
-            ("Memory", self.memory_info.get_summary),
-            ("Storage", self.storage_info.get_summary),
-            ("GPU", self.gpu_info.get_summary),
-        ]
+        # Show all sections in compact form, from the same cache the views use
+        sections = [collector for collector in self.registry if collector.summary]
         
-        for title, getter in sections:
-            data = getter()
+        for collector in sections:
+            title = collector.title
+            data = collector.summary(self.prefetcher.get(collector.name))
             table = Table(
                 title=f"[bold cyan]{title}[/bold cyan]",
                 box=box.SIMPLE,
@@ -575,14 +1799,7 @@ class LXZ:
             task = progress.add_task("[cyan]Collecting system information...", total=None)
             
             # Gather all data
-            all_data = {
-                'cpu': self.cpu_info.get_all_info(),
-                'memory': self.memory_info.get_all_info(),
-                'storage': self.storage_info.get_all_info(),
-                'gpu': self.gpu_info.get_all_info(),
-                'sensors': self.sensor_info.get_all_info(),
-                'motherboard': self.memory_info.get_motherboard_info()
-            }
+            all_data = self.registry.collect_all()
             
             progress.update(task, description="[cyan]Exporting report...")
             
@@ -599,37 +1816,50 @@ class LXZ:
         console.print()
         self.pause()
     
-    def pause(self):
-        """Pause and wait for user input"""
+    def show_age(self, name: str):
+        """Note when a view shows stale data that is being refreshed behind it"""
+        age = self.prefetcher.get_age(name)
+        if age is not None:
+            console.print(f"[dim]Collected {age:.0f}s ago, refreshing in the background. "
+                          f"The view updates when it completes.[/dim]\n")
+    
+    def pause(self, refresh: Optional[str] = None) -> bool:
+        """Pause and wait for user input, returning True when the stale section shown was refreshed meanwhile"""
         console.print()
-        console.input("[dim]Press Enter to continue...[/dim]")
+        if refresh is None or self.prefetcher.get_age(refresh) is None:
+            console.input("[dim]Press Enter to continue...[/dim]")
+            return False
+        
+        console.print("[dim]Press Enter to continue...[/dim]", end="")
+        timestamp = self.registry.get_timestamp(refresh)
+        while not select.select([sys.stdin], [], [], 0)[0]:
+            if self.prefetcher.wait_refresh(refresh, 0.2):
+                if self.registry.get_timestamp(refresh) != timestamp:
+                    return True
+                # The refresh failed, the stale values stay until Enter
+                break
+        sys.stdin.readline()
+        return False
     
     def run(self):
         """Main application loop"""
+        # Keep device tables current from hot-plug events instead of re-scanning
+        self.inventory.start()
+        
         while True:
             console.clear()
             self.show_banner()
             self.show_menu()
+            self.prefetcher.start()
             
             choice = console.input("[bold yellow]Select an option:[/bold yellow] ").strip()
+            handlers = {option: handler for option, _, handler in self.get_menu()}
             
-            if choice == "1":
-                self.show_cpu_info()
-            elif choice == "2":
-                self.show_memory_info()
-            elif choice == "3":
-                self.show_storage_info()
-            elif choice == "4":
-                self.show_gpu_info()
-            elif choice == "5":
-                self.show_motherboard_info()
-            elif choice == "6":
-                self.show_sensor_info()
-            elif choice == "7":
-                self.show_complete_overview()
-            elif choice == "8":
-                self.export_report()
+            if choice in handlers:
+                handlers[choice]()
             elif choice == "0":
+                self.prefetcher.stop()
+                self.inventory.stop()
                 console.clear()
                 console.print("\n[bold cyan]Thank you for using LX-Z![/bold cyan]")
                 console.print("[dim]Goodbye![/dim]\n")
@@ -638,14 +1868,390 @@ class LXZ:
                 console.print("[red]Invalid option. Please try again.[/red]")
                 self.pause()
 
+def run_diff(paths, as_json: bool = False):
+    """Compare exported reports and display equivalence classes"""
+    result = ReportDiff().compare(paths)
+    
+    if as_json:
+        print(json.dumps(result, indent=2))
+        return
+    
+    console.print(f"[bold cyan]Compared {result['reports']} report(s): "
+                  f"{len(result['classes'])} hardware configuration(s)[/bold cyan]\n")
+    
+    for error in result['errors']:
+        console.print(f"[red]Error: {error}[/red]")
+    
+    if not result['classes']:
+        return
+    
+    # Equivalence classes, largest first
+    class_table = Table(
+        title="[bold cyan]Equivalence Classes[/bold cyan]",
+        box=box.ROUNDED,
+        border_style="cyan"
+    )
+    class_table.add_column("Class", style="yellow")
+    class_table.add_column("Hosts", style="bright_white", justify="right")
+    class_table.add_column("Members", style="bright_white")
+    
+    for cls in result['classes']:
+        members = ', '.join(cls['hosts'][:8])
+        if cls['count'] > 8:
+            members += f", ... (+{cls['count'] - 8})"
+        class_table.add_row(cls['hash'], str(cls['count']), members)
+    
+    console.print(class_table)
+    console.print()
+    
+    if not result['differing_fields']:
+        console.print("[green]✓ All reports share the same hardware configuration[/green]\n")
+        return
+    
+    # Field-by-field differences against the largest class
+    diff_table = Table(
+        title="[bold cyan]Differences (vs. largest class)[/bold cyan]",
+        box=box.ROUNDED,
+        border_style="cyan"
+    )
+    diff_table.add_column("Field", style="yellow")
+    for cls in result['classes']:
+        diff_table.add_column(f"{cls['hash'][:8]} ({cls['count']})", style="bright_white")
+    
+    baseline = result['classes'][0]['fingerprint']
+    for field in result['differing_fields']:
+        row = [field]
+        for cls in result['classes']:
+            value = cls['fingerprint'][field]
+            # Flag bitsets and sysctls read better as what changed against the baseline
+            if field in ('cpu.flags', 'kernel.sysctl') and cls is not result['classes'][0]:
+                value = cls['differences'].get(field, value)
+            elif field == 'kernel.sysctl':
+                drifted = {item.split('=', 1)[0] for other in result['classes'][1:]
+                           for item in other['differences'].get(field, '').split('; ')}
+                value = '; '.join(item for item in value.split('; ') if item.split('=', 1)[0] in drifted)
+            row.append(value if cls['fingerprint'][field] == baseline[field] else f"[red]{value}[/red]")
+        diff_table.add_row(*row)
+    
+    console.print(diff_table)
+    console.print()
+
+def run_agent(address: str, ttl: float, profiler=None):
+    """Serve cached collector results to fleet collectors"""
+    app = LXZ()
+    if profiler:
+        profiler.instrument(app.registry)
+    agent = CollectorAgent(app.get_collectors(), ttl=ttl)
+    console.print(f"[bold cyan]LX-Z agent listening on {address}[/bold cyan] [dim](Ctrl+C to stop)[/dim]")
+    
+    try:
+        asyncio.run(agent.serve(address))
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Agent stopped[/yellow]")
+
+def run_fleet(addresses, sections=None, timeout: float = 10.0, concurrency: int = 64,
+              output: Optional[str] = None, as_json: bool = False):
+    """Pull reports from many agents and merge them into one table or export"""
+    async def pull():
+        fleet = FleetCollector(timeout=timeout, concurrency=concurrency)
+        try:
+            return await fleet.collect(addresses, sections)
+        finally:
+            await fleet.close()
+    
+    start = time.monotonic()
+    results = asyncio.run(pull())
+    elapsed = time.monotonic() - start
+    reports = [result['report'] for result in results if result['ok']]
+    
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    table = Table(
+        title=f"[bold cyan]Fleet Inventory[/bold cyan] [dim]({len(reports)}/{len(results)} hosts in {elapsed:.2f}s)[/dim]",
+        box=box.ROUNDED,
+        border_style="cyan"
+    )
+    table.add_column("Agent", style="yellow")
+    table.add_column("Hostname", style="bright_white")
+    table.add_column("CPU", style="bright_white")
+    table.add_column("Threads", style="bright_white", justify="right")
+    table.add_column("RAM", style="bright_white", justify="right")
+    table.add_column("GPUs", style="bright_white", justify="right")
+    table.add_column("Latency", style="bright_white", justify="right")
+    
+    for result in results:
+        latency = f"{result['elapsed'] * 1000:.0f} ms"
+        if not result['ok']:
+            table.add_row(result['host'], f"[red]{result['error']}[/red]", "", "", "", "", latency)
+            continue
+        
+        info = result['report'].get('system_info', {})
+        table.add_row(
+            result['host'],
+            result['report'].get('hostname', 'Unknown'),
+            info.get('cpu', {}).get('model', '-'),
+            str(info.get('cpu', {}).get('threads', '-')),
+            info.get('memory', {}).get('total', '-'),
+            str(len(info.get('gpu', {}).get('gpus', []))) if 'gpu' in info else '-',
+            latency
+        )
+    
+    console.print(table)
+    console.print()
+    
+    if output:
+        exporter = ExportReport()
+        exporter.output_dir = os.path.dirname(os.path.abspath(output))
+        filepath = exporter.export_jsonl(reports, os.path.basename(output))
+        console.print(f"[green]✓[/green] Fleet reports exported to: [bold]{filepath}[/bold]")
+
+def run_bench(fixtures, repeat: int = 5, collectors=None, baseline: Optional[str] = None,
+              tolerance: float = 25.0, save: Optional[str] = None, as_json: bool = False) -> int:
+    """Benchmark the collectors against fixtures, returning 1 on regressions"""
+    reports = run_benchmarks(fixtures, repeat, collectors)
+    
+    if save:
+        with open(save, 'w') as f:
+            json.dump(reports, f, indent=2)
+    
+    regressions = []
+    if baseline:
+        with open(baseline) as f:
+            previous = {report['fixture']: report for report in json.load(f)}
+        for report in reports:
+            if report['fixture'] in previous:
+                regressions.extend(f"{report['fixture']}/{regression}" for regression in
+                                   compare_results(previous[report['fixture']], report, tolerance))
+    
+    if as_json:
+        print(json.dumps({'reports': reports, 'regressions': regressions}, indent=2))
+        return 1 if regressions else 0
+    
+    def optional(value, fmt="{:.0f}"):
+        return fmt.format(value) if value is not None else 'N/A'
+    
+    for report in reports:
+        bench_table = Table(
+            title=f"[bold cyan]Collector Benchmark: {report['fixture']} "
+                  f"({report['repeat']} runs, Python {report['python']})[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        bench_table.add_column("Collector", style="yellow")
+        bench_table.add_column("Median", style="bright_white", justify="right")
+        bench_table.add_column("Min / Max", style="dim", justify="right")
+        bench_table.add_column("CPU", style="bright_white", justify="right")
+        bench_table.add_column("Forks", style="bright_white", justify="right")
+        bench_table.add_column("Opens", style="bright_white", justify="right")
+        bench_table.add_column("Dir Reads", style="bright_white", justify="right")
+        bench_table.add_column("read/write Syscalls", style="bright_white", justify="right")
+        bench_table.add_column("Peak Memory", style="bright_white", justify="right")
+        
+        for result in report['collectors']:
+            bench_table.add_row(
+                result['name'],
+                f"{result['median_ms']:.1f} ms",
+                f"{result['min_ms']:.1f} / {result['max_ms']:.1f}",
+                f"{result['cpu_ms']:.1f} ms",
+                str(result['forks']),
+                str(result['opens']),
+                str(result['listdirs']),
+                f"{optional(result['read_syscalls'])} / {optional(result['write_syscalls'])}",
+                f"{optional(result['peak_kb'])} KB"
+            )
+        
+        console.print(bench_table)
+        console.print(f"[dim]Total median: {report['total_ms']:.1f} ms[/dim]\n")
+    
+    if save:
+        console.print(f"[green]✓ Results saved to {save}[/green]")
+    
+    if baseline:
+        if regressions:
+            for regression in regressions:
+                console.print(f"[red]✗ {regression}[/red]")
+            return 1
+        console.print(f"[green]✓ No regressions against {baseline}[/green]")
+    
+    return 0
+
+def show_profile(profiler, trace_path: Optional[str] = None, limit: int = 10):
+    """Display the ranked profiling breakdown and write the optional trace"""
+    breakdown = profiler.get_breakdown()
+    
+    profile_table = Table(
+        title="[bold cyan]Profile: Collectors by Wall Time[/bold cyan]",
+        box=box.ROUNDED,
+        border_style="cyan"
+    )
+    profile_table.add_column("Collector", style="yellow")
+    profile_table.add_column("Calls", style="bright_white", justify="right")
+    profile_table.add_column("Wall", style="bright_white", justify="right")
+    profile_table.add_column("CPU", style="bright_white", justify="right")
+    profile_table.add_column("Subprocesses", style="bright_white", justify="right")
+    profile_table.add_column("Child CPU", style="bright_white", justify="right")
+    profile_table.add_column("Sysfs Batches", style="bright_white", justify="right")
+    profile_table.add_column("statvfs", style="bright_white", justify="right")
+    
+    for entry in breakdown['collectors']:
+        profile_table.add_row(
+            entry['name'],
+            str(entry['calls']),
+            f"{entry['wall'] * 1000:.1f} ms",
+            f"{entry['cpu'] * 1000:.1f} ms",
+            f"{entry['subprocess']} ({entry['subprocess_time'] * 1000:.1f} ms)",
+            f"{entry['subprocess_cpu'] * 1000:.1f} ms"
+            + (f" [dim]({entry['subprocess_overlapped']} overlapped)[/dim]" if entry['subprocess_overlapped'] else ""),
+            f"{entry['sysfs']} ({entry['sysfs_time'] * 1000:.1f} ms)",
+            f"{entry['statvfs']} ({entry['statvfs_time'] * 1000:.1f} ms)"
+        )
+    
+    console.print(profile_table)
+    
+    if breakdown['subprocesses']:
+        command_table = Table(
+            title=f"[bold cyan]Slowest Subprocesses (top {limit})[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        command_table.add_column("Command", style="yellow")
+        command_table.add_column("Collector", style="bright_white")
+        command_table.add_column("Exit", style="bright_white", justify="right")
+        command_table.add_column("Duration", style="bright_white", justify="right")
+        
+        for span in breakdown['subprocesses'][:limit]:
+            exit_code = span['args']['exit_code']
+            if exit_code is None:
+                status = f"[red]{span['args']['error']}[/red]"
+            else:
+                status = str(exit_code) if exit_code == 0 else f"[red]{exit_code}[/red]"
+            command_table.add_row(span['name'], span['collector'] or '-', status,
+                                  f"{span['duration'] * 1000:.1f} ms")
+        
+        console.print(command_table)
+    
+    slow_mounts = [span for span in breakdown['statvfs'] if span['duration'] >= 0.1]
+    for span in slow_mounts[:limit]:
+        console.print(f"[yellow]⚠ statvfs({span['name']}) took {span['duration'] * 1000:.0f} ms[/yellow]")
+    
+    if trace_path:
+        profiler.write_trace(trace_path)
+        console.print(f"[green]✓ Chrome trace written to {trace_path}[/green] "
+                      f"[dim](open in chrome://tracing or ui.perfetto.dev)[/dim]")
+
+def read_hosts_file(path: str):
+    """Read agent addresses, one per line, ignoring comments"""
+    addresses = []
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                addresses.append(line)
+    return addresses
+
 def main():
     """Entry point"""
+    parser = argparse.ArgumentParser(prog='lxz', description='LX-Z - Linux Hardware Analyzer')
+    parser.add_argument('--block-profile', choices=sorted(BLOCK_PROFILES), default='database',
+                        help='Workload profile for block queue tuning checks (default: database)')
+    parser.add_argument('--power-profile', choices=sorted(POWER_PROFILES), default='balanced',
+                        help='Power profile for CPU frequency policy checks, performance for servers '
+                             'meant to run flat out (default: balanced)')
+    parser.add_argument('--sysctl-profile', choices=sorted(SYSCTL_PROFILES), default='throughput',
+                        help='Workload profile for the sysctl and THP audit (default: throughput)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Time collectors, subprocesses and sysfs reads, print a breakdown on exit')
+    parser.add_argument('--profile-trace', metavar='FILE',
+                        help='Also write the profile as a Chrome trace JSON file (implies --profile)')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    diff_parser = subparsers.add_parser('diff', help='Compare exported JSON reports')
+    diff_parser.add_argument('reports', nargs='+', help='Report files, JSONL files or directories')
+    diff_parser.add_argument('--json', action='store_true', help='Print the diff as JSON')
+    
+    agent_parser = subparsers.add_parser('agent', help='Serve collector results to fleet collectors')
+    agent_parser.add_argument('--listen', default='127.0.0.1:9770',
+                              help='HOST:PORT or unix:/path to listen on (default: 127.0.0.1:9770)')
+    agent_parser.add_argument('--ttl', type=float, default=60.0,
+                              help='Seconds to cache collector results (default: 60)')
+    
+    fleet_parser = subparsers.add_parser('fleet', help='Pull reports from many agents concurrently')
+    fleet_parser.add_argument('agents', nargs='*', help='Agent addresses (HOST[:PORT] or unix:/path)')
+    fleet_parser.add_argument('--hosts-file', help='File with one agent address per line')
+    fleet_parser.add_argument('--sections', help='Comma-separated sections to pull (default: all)')
+    fleet_parser.add_argument('--timeout', type=float, default=10.0, help='Per-host timeout in seconds')
+    fleet_parser.add_argument('--concurrency', type=int, default=64, help='Maximum agents queried at once')
+    fleet_parser.add_argument('--output', help='Write the collected reports to a JSONL file')
+    fleet_parser.add_argument('--json', action='store_true', help='Print raw results as JSON')
+    
+    bench_parser = subparsers.add_parser('bench', help='Benchmark the collectors against fixture trees')
+    bench_parser.add_argument('fixtures', nargs='*', default=['laptop', 'server'],
+                              help='Built-in fixtures (laptop, server) or recorded fixture directories')
+    bench_parser.add_argument('--repeat', type=int, default=5, help='Runs per collector (default: 5)')
+    bench_parser.add_argument('--collectors', help='Comma-separated collectors to run (default: all)')
+    bench_parser.add_argument('--record', metavar='DIR', help='Record this machine as a fixture and exit')
+    bench_parser.add_argument('--save', metavar='FILE', help='Write the results as JSON')
+    bench_parser.add_argument('--baseline', metavar='FILE', help='Compare against saved results')
+    bench_parser.add_argument('--tolerance', type=float, default=25.0,
+                              help='Allowed median slowdown in percent against the baseline (default: 25)')
+    bench_parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    
+    inventory_parser = subparsers.add_parser('inventory', help='Print one compact inventory record without the UI')
+    add_inventory_arguments(inventory_parser)
+    
+    args = parser.parse_args()
+    
+    # Nothing is instrumented unless profiling was asked for
+    profiler = lxz_profiler.start() if args.profile or args.profile_trace else None
+    
+    if args.command == 'bench':
+        if args.record:
+            os.makedirs(args.record, exist_ok=True)
+            recorded = record_fixture(args.record)
+            console.print(f"[green]✓ Recorded {recorded['files']} files and {recorded['commands']} "
+                          f"command outputs to {args.record}[/green]")
+            return
+        collectors = args.collectors.split(',') if args.collectors else None
+        sys.exit(run_bench(args.fixtures, args.repeat, collectors, args.baseline,
+                           args.tolerance, args.save, args.json))
+    
+    if args.command == 'inventory':
+        status = run_inventory(args)
+        if profiler:
+            show_profile(profiler, args.profile_trace)
+        sys.exit(status)
+    
+    if args.command == 'diff':
+        run_diff(args.reports, args.json)
+        return
+    
+    if args.command == 'agent':
+        run_agent(args.listen, args.ttl, profiler)
+        if profiler:
+            show_profile(profiler, args.profile_trace)
+        return
+    
+    if args.command == 'fleet':
+        addresses = list(args.agents)
+        if args.hosts_file:
+            addresses.extend(read_hosts_file(args.hosts_file))
+        if not addresses:
+            fleet_parser.error('no agent addresses given')
+        sections = args.sections.split(',') if args.sections else None
+        run_fleet(addresses, sections, args.timeout, args.concurrency, args.output, args.json)
+        return
+    
     if os.geteuid() != 0:
         console.print("[yellow]Warning: Running without root privileges.[/yellow]")
         console.print("[yellow]Some information may be limited. Consider running with sudo.[/yellow]\n")
     
     try:
-        app = LXZ()
+        app = LXZ(block_profile=args.block_profile, power_profile=args.power_profile,
+                  sysctl_profile=args.sysctl_profile)
+        if profiler:
+            profiler.instrument(app.registry)
         app.run()
     except KeyboardInterrupt:
         console.print("\n\n[yellow]Interrupted by user[/yellow]")
@@ -653,6 +2259,9 @@ def main():
     except Exception as e:
         console.print(f"\n[red]Error: {e}[/red]")
         sys.exit(1)
+    finally:
+        if profiler:
+            show_profile(profiler, args.profile_trace)
 
 if __name__ == "__main__":
     main()
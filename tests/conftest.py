@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tests import utils from the checkout, which is not installed as a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
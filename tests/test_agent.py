@@ -0,0 +1,54 @@
+import asyncio
+
+from utils.agent import CollectorAgent, FleetCollector, parse_address, DEFAULT_PORT
+
+
+def test_parse_address():
+    assert parse_address('host') == ('tcp', 'host', DEFAULT_PORT)
+    assert parse_address('host:9000') == ('tcp', 'host', 9000)
+    assert parse_address('[::1]:9000') == ('tcp', '::1', 9000)
+    assert parse_address('[::1]') == ('tcp', '::1', DEFAULT_PORT)
+    assert parse_address('unix:/run/lxz.sock') == ('unix', '/run/lxz.sock', None)
+
+
+def test_parse_bare_ipv6_address():
+    assert parse_address('::1') == ('tcp', '::1', DEFAULT_PORT)
+    assert parse_address('fe80::1:2') == ('tcp', 'fe80::1:2', DEFAULT_PORT)
+
+
+async def start_agents(count):
+    """Start loopback agents that each report their own index"""
+    servers, addresses = [], []
+    for index in range(count):
+        agent = CollectorAgent({'index': lambda index=index: {'value': index}})
+        server = await agent.start('127.0.0.1:0')
+        servers.append(server)
+        addresses.append(f"127.0.0.1:{server.sockets[0].getsockname()[1]}")
+    return servers, addresses
+
+
+async def collect(addresses_for):
+    servers, addresses = await start_agents(3)
+    fleet = FleetCollector(timeout=5.0)
+    try:
+        # The second round reuses the pooled connections
+        await fleet.collect(addresses)
+        return await fleet.collect(addresses_for(addresses)), addresses
+    finally:
+        await fleet.close()
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+
+
+def test_fleet_pulls_every_agent_in_order():
+    results, addresses = asyncio.run(collect(lambda addresses: addresses))
+    assert [result['host'] for result in results] == addresses
+    assert all(result['ok'] for result in results)
+    assert [result['report']['system_info']['index']['value'] for result in results] == [0, 1, 2]
+
+
+def test_fleet_serialises_duplicate_addresses():
+    results, addresses = asyncio.run(collect(lambda addresses: addresses + addresses[:1] * 3))
+    assert [result['ok'] for result in results] == [True] * 6
+    assert [result['report']['system_info']['index']['value'] for result in results] == [0, 1, 2, 0, 0, 0]
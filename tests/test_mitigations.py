@@ -0,0 +1,31 @@
+from utils.mitigations import MitigationInfo
+
+SMT_ON = {'control': 'on'}
+
+RETPOLINE = ('Mitigation: Retpolines; IBPB: conditional; IBRS_FW; STIBP: conditional; RSB filling; '
+             'PBRSB-eIBRS: Not affected; BHI: Not affected')
+EIBRS = ('Mitigation: Enhanced / Automatic IBRS; IBPB: conditional; RSB filling; '
+         'PBRSB-eIBRS: SW sequence; BHI: BHI_DIS_S')
+
+
+def get_costs(**statuses):
+    vulnerabilities = [{'name': name, 'status': status} for name, status in statuses.items()]
+    return MitigationInfo()._get_costs(vulnerabilities, SMT_ON, {})
+
+
+def test_retpoline_with_pbrsb_status_is_costly():
+    costs = get_costs(spectre_v2=RETPOLINE)
+    assert [cost['mitigation'] for cost in costs] == ['Retpoline']
+
+
+def test_eibrs_is_free():
+    assert get_costs(spectre_v2=EIBRS) == []
+
+
+def test_retbleed_eibrs_is_free():
+    assert get_costs(retbleed='Mitigation: Enhanced IBRS') == []
+
+
+def test_retbleed_return_thunk_is_costly():
+    costs = get_costs(retbleed='Mitigation: untrained return thunk; SMT enabled with STIBP protection')
+    assert [cost['mitigation'] for cost in costs] == ['Retbleed return thunks']
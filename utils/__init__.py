@@ -8,6 +8,25 @@ from .storage import StorageInfo
 from .gpu import GPUInfo
 from .sensors import SensorInfo
 from .exporter import ExportReport
+from .diff import ReportDiff
+from .hotplug import DeviceInventory
+from .analytics import SensorHistory
+from .agent import CollectorAgent, FleetCollector
+from .telemetry import GPUTelemetry
+from .pcie import PCIeInfo
+from .nvme import NVMeInfo
+from .blockqueue import BlockQueueInfo
+from .mounts import MountScanner
+from .profiler import Profiler
+from .interrupts import InterruptInfo
+from .cgroups import CgroupInfo
+from .mitigations import MitigationInfo
+from .cpufreq import FrequencyPolicyInfo
+from .sysctl import SysctlInfo
+from .isolation import IsolationInfo
+from .corelatency import CoreLatencyBenchmark
+from .inventory import BatchInventory
+from .registry import Collector, CollectorRegistry, Prefetcher, create_default_registry
 
 __all__ = [
     'CPUInfo',
@@ -15,5 +34,28 @@ __all__ = [
     'StorageInfo',
     'GPUInfo',
     'SensorInfo',
-    'ExportReport'
+    'ExportReport',
+    'ReportDiff',
+    'DeviceInventory',
+    'SensorHistory',
+    'CollectorAgent',
+    'FleetCollector',
+    'Collector',
+    'CollectorRegistry',
+    'Prefetcher',
+    'create_default_registry',
+    'GPUTelemetry',
+    'PCIeInfo',
+    'NVMeInfo',
+    'BlockQueueInfo',
+    'MountScanner',
+    'Profiler',
+    'InterruptInfo',
+    'CgroupInfo',
+    'MitigationInfo',
+    'FrequencyPolicyInfo',
+    'SysctlInfo',
+    'IsolationInfo',
+    'CoreLatencyBenchmark',
+    'BatchInventory'
 ]
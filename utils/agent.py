@@ -0,0 +1,199 @@
+"""
+Agent Module
+Serves cached collector results to remote fleet collectors and pulls them back
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_PORT = 9770
+
+# Upper bound for a single protocol line, reports are well below this
+MAX_LINE = 16 * 1024 * 1024
+
+def parse_address(address: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """Parse "host[:port]", "[ipv6][:port]" or "unix:/path" into (kind, host_or_path, port)"""
+    if address.startswith('unix:'):
+        return 'unix', address[5:], None
+
+    if address.startswith('['):
+        host, _, rest = address[1:].partition(']')
+        port = rest[1:] if rest.startswith(':') else ''
+        return 'tcp', host, int(port) if port.isdigit() else DEFAULT_PORT
+
+    # More than one colon is a bare IPv6 address, which has no room for a port
+    host, sep, port = address.partition(':')
+    if not sep or ':' in port or not port.isdigit():
+        return 'tcp', address, DEFAULT_PORT
+    return 'tcp', host, int(port)
+
+class CollectorAgent:
+    """Handles serving collector results over a line-delimited JSON protocol"""
+
+    def __init__(self, collectors: Dict[str, Callable[[], Dict]], ttl: float = 60.0):
+        self.collectors = collectors
+        self.ttl = ttl
+        self.hostname = socket.gethostname()
+        self._cache = {}
+        self._locks = {name: asyncio.Lock() for name in collectors}
+
+    async def _get_section(self, name: str) -> Dict:
+        """Get a section from cache or collect it in a worker thread"""
+        async with self._locks[name]:
+            cached = self._cache.get(name)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(None, self.collectors[name])
+            self._cache[name] = (time.monotonic(), value)
+            return value
+
+    async def build_report(self, sections: Optional[List[str]] = None) -> Dict:
+        """Build a report in the same shape as ExportReport.export_json"""
+        names = [name for name in (sections or self.collectors) if name in self.collectors]
+        values = await asyncio.gather(*(self._get_section(name) for name in names))
+
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'generator': 'LX-Z v1.0',
+            'hostname': self.hostname,
+            'system_info': dict(zip(names, values))
+        }
+
+    async def _handle_request(self, request: Dict) -> Dict:
+        """Dispatch a single protocol request"""
+        op = request.get('op')
+
+        if op == 'ping':
+            return {'ok': True, 'hostname': self.hostname}
+        if op == 'sections':
+            return {'ok': True, 'sections': list(self.collectors)}
+        if op == 'report':
+            report = await self.build_report(request.get('sections'))
+            return {'ok': True, 'report': report}
+
+        return {'ok': False, 'error': f"Unknown operation: {op}"}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    response = await self._handle_request(json.loads(line))
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"Invalid request: {e}"}
+                except Exception as e:
+                    response = {'ok': False, 'error': str(e)}
+
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, address: str):
+        """Start listening on a TCP address or unix socket"""
+        kind, host, port = parse_address(address)
+
+        if kind == 'unix':
+            if os.path.exists(host):
+                os.unlink(host)
+            return await asyncio.start_unix_server(self._handle_client, path=host, limit=MAX_LINE)
+        return await asyncio.start_server(self._handle_client, host=host, port=port, limit=MAX_LINE)
+
+    async def serve(self, address: str):
+        """Serve forever"""
+        server = await self.start(address)
+        async with server:
+            await server.serve_forever()
+
+class FleetCollector:
+    """Handles pulling reports from many agents concurrently"""
+
+    def __init__(self, timeout: float = 10.0, concurrency: int = 64):
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._pool = {}
+        # One request at a time per pooled connection, responses are matched by order
+        self._locks = {}
+
+    async def _connect(self, address: str):
+        """Get a pooled connection to an agent"""
+        connection = self._pool.get(address)
+        if connection and not connection[1].is_closing():
+            return connection
+
+        kind, host, port = parse_address(address)
+        if kind == 'unix':
+            connection = await asyncio.open_unix_connection(host, limit=MAX_LINE)
+        else:
+            connection = await asyncio.open_connection(host, port, limit=MAX_LINE)
+
+        self._pool[address] = connection
+        return connection
+
+    def _discard(self, address: str):
+        """Drop a pooled connection after an error"""
+        connection = self._pool.pop(address, None)
+        if connection:
+            connection[1].close()
+
+    async def request(self, address: str, request: Dict) -> Dict:
+        """Send one request to an agent and wait for the response"""
+        async with self._locks.setdefault(address, asyncio.Lock()):
+            reader, writer = await self._connect(address)
+            writer.write(json.dumps(request, separators=(',', ':')).encode() + b'\n')
+            await writer.drain()
+
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("Connection closed by agent")
+            return json.loads(line)
+
+    async def _pull(self, address: str, sections: Optional[List[str]], semaphore: asyncio.Semaphore) -> Dict:
+        """Pull a report from one agent within the per-host timeout"""
+        result = {'host': address, 'ok': False, 'error': None, 'report': None, 'elapsed': 0.0}
+
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                response = await asyncio.wait_for(
+                    self.request(address, {'op': 'report', 'sections': sections}),
+                    timeout=self.timeout
+                )
+                if response.get('ok'):
+                    result['ok'] = True
+                    result['report'] = response['report']
+                else:
+                    result['error'] = response.get('error', 'Unknown error')
+            except asyncio.TimeoutError:
+                result['error'] = f"Timed out after {self.timeout:.1f}s"
+                self._discard(address)
+            except (OSError, ValueError) as e:
+                result['error'] = str(e) or e.__class__.__name__
+                self._discard(address)
+            result['elapsed'] = time.monotonic() - start
+
+        return result
+
+    async def collect(self, addresses: List[str], sections: Optional[List[str]] = None) -> List[Dict]:
+        """Pull reports from all agents, in the order given"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(self._pull(address, sections, semaphore) for address in addresses))
+
+    async def close(self):
+        """Close all pooled connections"""
+        for address in list(self._pool):
+            self._discard(address)
+        await asyncio.sleep(0)
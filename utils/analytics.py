@@ -0,0 +1,145 @@
+"""
+Sensor Analytics Module
+Keeps per-channel sample history and computes rolling statistics with NumPy
+"""
+
+import time
+import warnings
+import importlib.util
+from typing import Dict, List, Optional
+
+# NumPy is imported on first use, so headless modes that never analyse sensors skip its memory cost
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+np = None
+
+class SensorHistory:
+    """Handles ring-buffered sensor history and vectorized analysis"""
+
+    def __init__(self, capacity: int = 120, z_threshold: float = 3.0):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for sensor analytics (pip3 install numpy)")
+
+        global np
+        if np is None:
+            import numpy as np
+
+        self.capacity = capacity
+        self.z_threshold = z_threshold
+        self.channels = {}
+        self.names = []
+        self.samples = np.full((0, capacity), np.nan)
+        self.timestamps = np.full(capacity, np.nan)
+        self.max_limits = np.full(0, np.nan)
+        self.crit_limits = np.full(0, np.nan)
+        self.count = 0
+        self._pos = 0
+
+    def _add_channels(self, names: List[str]):
+        """Grow the buffers for channels seen for the first time"""
+        for name in names:
+            self.channels[name] = len(self.names)
+            self.names.append(name)
+
+        extra = len(names)
+        self.samples = np.vstack([self.samples, np.full((extra, self.capacity), np.nan)])
+        self.max_limits = np.concatenate([self.max_limits, np.full(extra, np.nan)])
+        self.crit_limits = np.concatenate([self.crit_limits, np.full(extra, np.nan)])
+
+    def set_limits(self, limits: Dict[str, Dict[str, float]]):
+        """Set per-channel max/crit limits"""
+        new = [name for name in limits if name not in self.channels]
+        if new:
+            self._add_channels(new)
+
+        for name, limit in limits.items():
+            idx = self.channels[name]
+            self.max_limits[idx] = limit.get('max', np.nan)
+            self.crit_limits[idx] = limit.get('crit', np.nan)
+
+    def record(self, values: Dict[str, float], timestamp: Optional[float] = None):
+        """Record one sample for every channel (missing channels become NaN)"""
+        new = [name for name in values if name not in self.channels]
+        if new:
+            self._add_channels(new)
+
+        column = np.full(len(self.names), np.nan)
+        idx = np.fromiter((self.channels[name] for name in values), dtype=np.intp, count=len(values))
+        column[idx] = np.fromiter(values.values(), dtype=float, count=len(values))
+
+        self.samples[:, self._pos] = column
+        self.timestamps[self._pos] = time.monotonic() if timestamp is None else timestamp
+        self._pos = (self._pos + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _ordered(self):
+        """Get the buffered window in chronological order"""
+        if self.count < self.capacity:
+            return self.samples[:, :self.count], self.timestamps[:self.count]
+
+        order = np.roll(np.arange(self.capacity), -self._pos)
+        return self.samples[:, order], self.timestamps[order]
+
+    def analyze(self) -> Dict[str, Dict]:
+        """Compute rolling statistics for all channels in one pass"""
+        if not self.count or not self.names:
+            return {}
+
+        window, stamps = self._ordered()
+        latest = window[:, -1]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            valid = ~np.isnan(window)
+            counts = valid.sum(axis=1)
+            filled = np.where(valid, window, 0.0)
+            mean = filled.sum(axis=1) / counts
+            variance = (np.where(valid, window - mean[:, None], 0.0) ** 2).sum(axis=1) / counts
+            std = np.sqrt(variance)
+            maximum = np.where(valid, window, -np.inf).max(axis=1)
+            maximum[counts == 0] = np.nan
+            # nanpercentile is ~50x slower, only use it when there are gaps
+            if valid.all():
+                p95 = np.percentile(window, 95, axis=1)
+            else:
+                with warnings.catch_warnings():
+                    # Channels without any sample yet are all-NaN rows
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    p95 = np.nanpercentile(window, 95, axis=1)
+
+            # Rate of change over the last interval, per second
+            if window.shape[1] >= 2:
+                dt = stamps[-1] - stamps[-2]
+                rate = (window[:, -1] - window[:, -2]) / dt if dt > 0 else np.full(len(latest), np.nan)
+            else:
+                rate = np.full(len(latest), np.nan)
+
+            zscore = np.where(std > 0, (latest - mean) / std, 0.0)
+            anomaly = (np.abs(zscore) > self.z_threshold) & (counts >= 5)
+            critical = latest >= self.crit_limits
+            hot = latest >= self.max_limits
+
+        results = {}
+        for idx, name in enumerate(self.names):
+            if counts[idx] == 0:
+                continue
+
+            if critical[idx]:
+                status = 'critical'
+            elif hot[idx]:
+                status = 'hot'
+            elif anomaly[idx]:
+                status = 'anomaly'
+            else:
+                status = 'normal'
+
+            results[name] = {
+                'current': float(latest[idx]),
+                'mean': float(mean[idx]),
+                'p95': float(p95[idx]),
+                'max': float(maximum[idx]),
+                'rate': float(rate[idx]),
+                'zscore': float(zscore[idx]),
+                'anomaly': bool(anomaly[idx]),
+                'status': status
+            }
+
+        return results
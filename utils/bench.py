@@ -0,0 +1,587 @@
+"""
+Benchmark Harness Module
+Runs the collectors against recorded /proc and /sys fixture trees and fake command outputs
+"""
+
+import os
+import sys
+import glob
+import json
+import shlex
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from . import sysfs
+from .cpu import CPUInfo
+from .memory import MemoryInfo
+from .storage import StorageInfo
+from .gpu import GPUInfo
+from .sensors import SensorInfo
+
+# (name, class, method) for every benchmarked collector, constructors included
+# because availability checks fork their own --version probes
+BENCH_COLLECTORS = [
+    ('cpu', CPUInfo, 'get_all_info'),
+    ('memory', MemoryInfo, 'get_all_info'),
+    ('motherboard', MemoryInfo, 'get_motherboard_info'),
+    ('storage', StorageInfo, 'get_all_info'),
+    ('gpu', GPUInfo, 'get_all_info'),
+    ('sensors', SensorInfo, 'get_all_info')
+]
+
+# Audit events counted per collector run
+AUDIT_EVENTS = {
+    'subprocess.Popen': 'forks',
+    'open': 'opens',
+    'os.listdir': 'listdirs',
+    'os.scandir': 'listdirs'
+}
+
+# Files copied by record_fixture()
+RECORD_PATTERNS = [
+    '/proc/cpuinfo',
+    '/proc/meminfo',
+    '/proc/self/mountinfo',
+    '/sys/devices/system/cpu/online',
+    '/sys/devices/system/cpu/cpu*/cpufreq/scaling_*_freq',
+    '/sys/devices/system/cpu/cpu0/cache/index*/level',
+    '/sys/devices/system/cpu/cpu0/cache/index*/size',
+    '/sys/devices/system/cpu/cpu0/cache/index*/type',
+    '/sys/class/thermal/thermal_zone*/temp',
+    '/sys/class/thermal/thermal_zone*/type',
+    '/sys/class/hwmon/hwmon*/name',
+    '/sys/class/hwmon/hwmon*/*_input',
+    '/sys/class/hwmon/hwmon*/*_label',
+    '/sys/class/hwmon/hwmon*/*_max',
+    '/sys/class/hwmon/hwmon*/*_crit',
+    '/sys/class/hwmon/hwmon*/*_min',
+    '/sys/class/hwmon/hwmon*/*_cap',
+    '/sys/class/hwmon/hwmon*/*_average',
+    '/sys/class/hwmon/hwmon*/*_alarm',
+    '/sys/class/power_supply/BAT*/*',
+    '/sys/block/*/size',
+    '/sys/block/*/removable',
+    '/sys/block/*/ro',
+    '/sys/block/*/queue/rotational',
+    '/sys/block/*/device/model'
+]
+
+# Command lines captured by record_fixture()
+RECORD_COMMANDS = [
+    ['lscpu'],
+    ['dmidecode', '-t', 'memory'],
+    ['dmidecode', '-t', 'baseboard'],
+    ['dmidecode', '-t', 'bios'],
+    ['lsblk', '-b', '-d', '-o', 'NAME,SIZE,TYPE,MODEL,ROTA,RO'],
+    ['lspci'],
+    ['nvidia-smi', '--query-gpu=driver_version', '--format=csv,noheader'],
+    ['nvidia-smi', '--query-gpu=name,memory.total,driver_version,vbios_version,pci.bus_id',
+     '--format=csv,noheader'],
+    ['glxinfo'],
+    ['vulkaninfo', '--summary'],
+    ['modinfo', 'amdgpu'],
+    ['modinfo', 'i915'],
+    ['sensors', '-j']
+]
+
+# Synthetic machines for generate_fixture()
+FIXTURE_SPECS = {
+    'laptop': {
+        'cpu_model': '11th Gen Intel(R) Core(TM) i7-1165G7 @ 2.80GHz',
+        'vendor': 'GenuineIntel',
+        'sockets': 1,
+        'cores_per_socket': 4,
+        'threads_per_core': 2,
+        'dimms': 2,
+        'dimm_slots': 2,
+        'dimm_size_gb': 8,
+        'nvme_disks': 1,
+        'sata_disks': 0,
+        'gpus': 'intel',
+        'gpu_count': 1,
+        'hwmon': [('coretemp', 5, 0), ('acpitz', 1, 0), ('thinkpad', 0, 1)],
+        'battery': True
+    },
+    'server': {
+        'cpu_model': 'AMD EPYC 9754 128-Core Processor',
+        'vendor': 'AuthenticAMD',
+        'sockets': 2,
+        'cores_per_socket': 128,
+        'threads_per_core': 2,
+        'dimms': 24,
+        'dimm_slots': 24,
+        'dimm_size_gb': 64,
+        'nvme_disks': 4,
+        'sata_disks': 20,
+        'gpus': 'nvidia',
+        'gpu_count': 8,
+        'hwmon': [('k10temp', 13, 0), ('k10temp', 13, 0), ('nct6779', 4, 8)]
+                 + [('nvme', 3, 0)] * 4,
+        'battery': False
+    }
+}
+
+_audit_counters = None
+_audit_installed = False
+
+def _audit_hook(event: str, args):
+    """Count interesting audit events while a benchmark is running"""
+    counters = _audit_counters
+    if counters is not None and event in AUDIT_EVENTS:
+        counters[AUDIT_EVENTS[event]] += 1
+
+def _read_syscall_counts() -> Dict[str, Optional[int]]:
+    """Get read/write syscall totals for this process from /proc/self/io"""
+    counts = {'syscr': None, 'syscw': None}
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in counts:
+                    counts[key] = int(value)
+    except (OSError, ValueError):
+        pass
+    return counts
+
+def _write(root: str, path: str, content: str):
+    """Write one fixture file, creating parent directories"""
+    target = os.path.join(root, path.lstrip('/'))
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'w') as f:
+        f.write(content if content.endswith('\n') else content + '\n')
+
+def _generate_cpu(root: str, spec: Dict, commands: Dict):
+    """Generate /proc/cpuinfo, cpufreq, cache and lscpu output"""
+    cores = spec['cores_per_socket']
+    threads = spec['sockets'] * cores * spec['threads_per_core']
+    amd = spec['vendor'] == 'AuthenticAMD'
+    flags = ('fpu vme de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov pat pse36 clflush mmx fxsr '
+             'sse sse2 ht syscall nx pdpe1gb rdtscp lm constant_tsc rep_good nopl xtopology nonstop_tsc '
+             'cpuid pni pclmulqdq monitor ssse3 fma cx16 pcid sse4_1 sse4_2 x2apic movbe popcnt aes '
+             'xsave avx f16c rdrand lahf_lm abm 3dnowprefetch cpuid_fault ssbd ibrs ibpb stibp fsgsbase '
+             'bmi1 avx2 smep bmi2 erms invpcid avx512f avx512dq rdseed adx smap avx512ifma clflushopt '
+             'clwb avx512cd sha_ni avx512bw avx512vl xsaveopt xsavec xgetbv1 xsaves avx512vbmi umip '
+             'pku ospke avx512_vbmi2 gfni vaes vpclmulqdq avx512_vnni avx512_bitalg avx512_vpopcntdq rdpid')
+
+    blocks = []
+    for cpu in range(threads):
+        socket = cpu // (cores * spec['threads_per_core']) if spec['sockets'] > 1 else 0
+        blocks.append(
+            f"processor\t: {cpu}\n"
+            f"vendor_id\t: {spec['vendor']}\n"
+            f"cpu family\t: {25 if amd else 6}\n"
+            f"model\t\t: {17 if amd else 140}\n"
+            f"model name\t: {spec['cpu_model']}\n"
+            f"stepping\t: 1\n"
+            f"microcode\t: {'0xaa00215' if amd else '0xb4'}\n"
+            f"cpu MHz\t\t: 2400.000\n"
+            f"cache size\t: {'1024 KB' if amd else '12288 KB'}\n"
+            f"physical id\t: {socket}\n"
+            f"siblings\t: {cores * spec['threads_per_core']}\n"
+            f"core id\t\t: {cpu % cores}\n"
+            f"cpu cores\t: {cores}\n"
+            f"flags\t\t: {flags}\n"
+        )
+        base = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq"
+        _write(root, f"{base}/scaling_cur_freq", str(2400000 + (cpu % 7) * 100000))
+        _write(root, f"{base}/scaling_max_freq", '3100000' if amd else '4700000')
+        _write(root, f"{base}/scaling_min_freq", '400000')
+    _write(root, '/proc/cpuinfo', '\n'.join(blocks))
+    _write(root, '/sys/devices/system/cpu/online', f"0-{threads - 1}")
+
+    caches = [(1, 'Data', '32K'), (1, 'Instruction', '32K'), (2, 'Unified', '1024K' if amd else '1280K'),
+              (3, 'Unified', '32768K' if amd else '12288K')]
+    for index, (level, cache_type, size) in enumerate(caches):
+        base = f"/sys/devices/system/cpu/cpu0/cache/index{index}"
+        _write(root, f"{base}/level", str(level))
+        _write(root, f"{base}/type", cache_type)
+        _write(root, f"{base}/size", size)
+
+    commands['lscpu'] = {'': (
+        f"Architecture:            x86_64\n"
+        f"CPU(s):                  {threads}\n"
+        f"On-line CPU(s) list:     0-{threads - 1}\n"
+        f"Vendor ID:               {spec['vendor']}\n"
+        f"Model name:              {spec['cpu_model']}\n"
+        f"Thread(s) per core:      {spec['threads_per_core']}\n"
+        f"Core(s) per socket:      {cores}\n"
+        f"Socket(s):               {spec['sockets']}\n"
+        f"NUMA node(s):            {spec['sockets']}\n"
+    )}
+
+def _generate_memory(root: str, spec: Dict, commands: Dict):
+    """Generate /proc/meminfo and dmidecode output"""
+    total_kb = spec['dimms'] * spec['dimm_size_gb'] * 1024 * 1024
+    _write(root, '/proc/meminfo', (
+        f"MemTotal:       {total_kb} kB\n"
+        f"MemFree:        {total_kb // 2} kB\n"
+        f"MemAvailable:   {total_kb * 3 // 4} kB\n"
+        f"Buffers:        {total_kb // 64} kB\n"
+        f"Cached:         {total_kb // 8} kB\n"
+        f"SwapCached:            0 kB\n"
+        f"SwapTotal:      {8 * 1024 * 1024} kB\n"
+        f"SwapFree:       {8 * 1024 * 1024} kB\n"
+    ))
+
+    devices = []
+    for slot in range(spec['dimm_slots']):
+        installed = slot < spec['dimms']
+        devices.append(
+            f"Handle 0x{0x1100 + slot:04X}, DMI type 17, 92 bytes\n"
+            f"Memory Device\n"
+            f"\tSize: {str(spec['dimm_size_gb']) + ' GB' if installed else 'No Module Installed'}\n"
+            f"\tLocator: DIMM_{chr(ord('A') + slot % 12)}{slot // 12 + 1}\n"
+            f"\tBank Locator: P{slot // 12} CHANNEL {chr(ord('A') + slot % 12)}\n"
+            f"\tType: {'DDR5' if installed else 'Unknown'}\n"
+            f"\tData Width: {'64 bits' if installed else 'Unknown'}\n"
+            f"\tSpeed: {'4800 MT/s' if installed else 'Unknown'}\n"
+            f"\tConfigured Memory Speed: {'4800 MT/s' if installed else 'Unknown'}\n"
+            f"\tRank: {'2' if installed else 'Unknown'}\n"
+            f"\tManufacturer: {'Samsung' if installed else 'Not Specified'}\n"
+        )
+    commands['dmidecode'] = {
+        '-t memory': '# dmidecode 3.5\n\n' + '\n'.join(devices),
+        '-t baseboard': ("Base Board Information\n\tManufacturer: Supermicro\n\tProduct Name: H13DSG-O-CPU\n"
+                         "\tVersion: 1.01\n\tSerial Number: FIXTURE0001\n"),
+        '-t bios': ("BIOS Information\n\tVendor: American Megatrends International, LLC.\n"
+                    "\tVersion: 1.4\n\tRelease Date: 03/14/2024\n")
+    }
+
+def _generate_storage(root: str, spec: Dict, commands: Dict):
+    """Generate /sys/block, mountinfo and lsblk output"""
+    disks = [(f"nvme{i}n1", 259, i * 8, 3840755982336, 0, 'SAMSUNG MZQL23T8HCLS-00A07')
+             for i in range(spec['nvme_disks'])]
+    for i in range(spec['sata_disks']):
+        name = 'sd' + (chr(ord('a') + i) if i < 26 else 'a' + chr(ord('a') + i - 26))
+        disks.append((name, 8, i * 16, 18000207937536, 1, 'ST18000NM000J-2TV103'))
+
+    lsblk = ['NAME         SIZE TYPE MODEL ROTA RO']
+    mountinfo = []
+    for index, (name, major, minor, size, rotational, model) in enumerate(disks):
+        base = f"/sys/block/{name}"
+        _write(root, f"{base}/size", str(size // 512))
+        _write(root, f"{base}/removable", '0')
+        _write(root, f"{base}/ro", '0')
+        _write(root, f"{base}/queue/rotational", str(rotational))
+        _write(root, f"{base}/device/model", model)
+        lsblk.append(f"{name} {size} disk {model} {rotational} 0")
+
+        mountpoint = '/' if index == 0 else f"/data{index}"
+        os.makedirs(os.path.join(root, mountpoint.lstrip('/')), exist_ok=True)
+        mountinfo.append(f"{20 + index} 1 {major}:{minor} / {mountpoint} rw,relatime shared:1 - "
+                         f"{'ext4' if index == 0 else 'xfs'} /dev/{name} rw")
+
+    mountinfo.append("90 1 0:22 / /proc rw,nosuid,nodev,noexec,relatime shared:5 - proc proc rw")
+    mountinfo.append("91 1 0:23 / /sys rw,nosuid,nodev,noexec,relatime shared:6 - sysfs sysfs rw")
+    _write(root, '/proc/self/mountinfo', '\n'.join(mountinfo))
+    commands['lsblk'] = {'-b -d -o NAME,SIZE,TYPE,MODEL,ROTA,RO': '\n'.join(lsblk)}
+
+def _generate_gpu(root: str, spec: Dict, commands: Dict):
+    """Generate lspci, nvidia-smi, glxinfo and vulkaninfo output"""
+    lspci = ['00:00.0 Host bridge: Advanced Micro Devices, Inc. [AMD] Device 14a4']
+    lspci_verbose = {}
+
+    if spec['gpus'] == 'nvidia':
+        rows = []
+        for index in range(spec['gpu_count']):
+            bus = f"{0x18 + index * 0x10:02x}:00.0"
+            lspci.append(f"{bus} 3D controller: NVIDIA Corporation GH100 [H100 SXM5 80GB] (rev a1)")
+            lspci_verbose[f"-v -s {bus}"] = "\tKernel driver in use: nvidia\n\tKernel modules: nvidia\n"
+            rows.append(f"NVIDIA H100 80GB HBM3, 81559 MiB, 550.54.15, 96.00.89.00.01, 00000000:{bus}")
+        commands['nvidia-smi'] = {
+            '--query-gpu=driver_version --format=csv,noheader': '\n'.join(['550.54.15'] * spec['gpu_count']),
+            '--query-gpu=name,memory.total,driver_version,vbios_version,pci.bus_id --format=csv,noheader':
+                '\n'.join(rows)
+        }
+    else:
+        lspci.append("00:02.0 VGA compatible controller: Intel Corporation TigerLake-LP GT2 [Iris Xe Graphics] "
+                     "(rev 01)")
+        lspci_verbose['-v -s 00:02.0'] = "\tKernel driver in use: i915\n\tKernel modules: i915\n"
+        commands['modinfo'] = {'i915': 'filename: /lib/modules/i915.ko\nversion: 6.8.0\n'}
+        commands['glxinfo'] = {'': 'OpenGL version string: 4.6 (Compatibility Profile) Mesa 24.0.5\n'}
+        commands['vulkaninfo'] = {'--summary': '\tapiVersion        = 1.3.274\n'}
+
+    commands['lspci'] = {'': '\n'.join(lspci), **lspci_verbose}
+
+def _generate_sensors(root: str, spec: Dict, commands: Dict):
+    """Generate thermal zones, hwmon channels, batteries and sensors -j output"""
+    sensors = {}
+    for index, (name, temps, fans) in enumerate(spec['hwmon']):
+        base = f"/sys/class/hwmon/hwmon{index}"
+        _write(root, f"{base}/name", name)
+        chip = sensors[f"{name}-isa-{index:04x}"] = {'Adapter': 'ISA adapter'}
+        for channel in range(1, temps + 1):
+            label = 'Tctl' if name == 'k10temp' and channel == 1 else f"Core {channel - 1}"
+            _write(root, f"{base}/temp{channel}_input", str(45000 + channel * 500))
+            _write(root, f"{base}/temp{channel}_label", label)
+            _write(root, f"{base}/temp{channel}_max", '80000')
+            _write(root, f"{base}/temp{channel}_crit", '100000')
+            _write(root, f"{base}/temp{channel}_crit_alarm", '0')
+            chip[label] = {f"temp{channel}_input": 45 + channel * 0.5, f"temp{channel}_max": 80.0,
+                           f"temp{channel}_crit": 100.0, f"temp{channel}_crit_alarm": 0.0}
+        for channel in range(1, fans + 1):
+            _write(root, f"{base}/fan{channel}_input", str(1200 + channel * 100))
+            _write(root, f"{base}/fan{channel}_min", '300')
+            _write(root, f"{base}/fan{channel}_alarm", '0')
+            chip[f"fan{channel}"] = {f"fan{channel}_input": 1200.0 + channel * 100, f"fan{channel}_min": 300.0,
+                                     f"fan{channel}_alarm": 0.0}
+        if fans:
+            # Super I/O chips also monitor the supply rails
+            for channel, millivolts in enumerate([1200, 3312, 5040, 12096]):
+                _write(root, f"{base}/in{channel}_input", str(millivolts))
+                _write(root, f"{base}/in{channel}_min", str(millivolts * 9 // 10))
+                _write(root, f"{base}/in{channel}_max", str(millivolts * 11 // 10))
+                chip[f"in{channel}"] = {f"in{channel}_input": millivolts / 1000,
+                                        f"in{channel}_min": millivolts * 9 // 10 / 1000,
+                                        f"in{channel}_max": millivolts * 11 // 10 / 1000}
+            _write(root, f"{base}/power1_input", '142500000')
+            _write(root, f"{base}/power1_label", 'Package')
+            _write(root, f"{base}/power1_cap", '280000000')
+            chip['Package'] = {'power1_input': 142.5, 'power1_cap': 280.0}
+
+    for zone in range(2):
+        _write(root, f"/sys/class/thermal/thermal_zone{zone}/type", 'x86_pkg_temp' if zone else 'acpitz')
+        _write(root, f"/sys/class/thermal/thermal_zone{zone}/temp", str(47000 + zone * 1000))
+
+    if spec['battery']:
+        base = '/sys/class/power_supply/BAT0'
+        for attribute, value in [('capacity', '87'), ('status', 'Discharging'), ('energy_now', '45370000'),
+                                 ('energy_full', '52150000'), ('manufacturer', 'SMP'),
+                                 ('model_name', '5B10W13975')]:
+            _write(root, f"{base}/{attribute}", value)
+
+    commands['sensors'] = {'-j': json.dumps(sensors, indent=2)}
+
+def generate_fixture(name: str, path: str) -> str:
+    """Generate a synthetic fixture ('laptop' or 'server') into path"""
+    spec = FIXTURE_SPECS[name]
+    root = os.path.join(path, 'root')
+    commands = {}
+
+    _generate_cpu(root, spec, commands)
+    _generate_memory(root, spec, commands)
+    _generate_storage(root, spec, commands)
+    _generate_gpu(root, spec, commands)
+    _generate_sensors(root, spec, commands)
+
+    with open(os.path.join(path, 'commands.json'), 'w') as f:
+        json.dump({'name': name, 'commands': commands}, f, indent=2, sort_keys=True)
+    return path
+
+def record_fixture(path: str, name: Optional[str] = None) -> Dict:
+    """Record this machine's /proc and /sys files and command outputs as a fixture"""
+    root = os.path.join(path, 'root')
+    files = 0
+    for pattern in RECORD_PATTERNS:
+        for source in sorted(glob.glob(pattern)):
+            if not os.path.isfile(source):
+                continue
+            try:
+                with open(source, errors='replace') as f:
+                    content = f.read()
+            except OSError:
+                continue
+            _write(root, source, content)
+            files += 1
+
+    # Mount points must exist under the root for statvfs
+    try:
+        with open('/proc/self/mountinfo') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) > 4:
+                    os.makedirs(os.path.join(root, fields[4].lstrip('/')), exist_ok=True)
+    except OSError:
+        pass
+
+    commands = {}
+    recorded = list(RECORD_COMMANDS)
+    for command in list(recorded):
+        if command == ['lspci'] and shutil.which('lspci'):
+            output = subprocess.run(command, capture_output=True, text=True, check=False).stdout
+            for line in output.split('\n'):
+                if 'VGA compatible controller' in line or '3D controller' in line:
+                    recorded.append(['lspci', '-v', '-s', line.split()[0]])
+
+    for command in recorded:
+        if not shutil.which(command[0]):
+            continue
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, check=False, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        commands.setdefault(command[0], {})[' '.join(command[1:])] = result.stdout
+
+    with open(os.path.join(path, 'commands.json'), 'w') as f:
+        json.dump({'name': name or os.path.basename(os.path.abspath(path)), 'commands': commands},
+                  f, indent=2, sort_keys=True)
+
+    return {'files': files, 'commands': sum(len(outputs) for outputs in commands.values())}
+
+class CollectorBenchmark:
+    """Handles running the collectors against one fixture"""
+
+    def __init__(self, fixture_path: str, repeat: int = 5):
+        self.fixture_path = fixture_path
+        self.repeat = max(1, repeat)
+        with open(os.path.join(fixture_path, 'commands.json')) as f:
+            self.fixture = json.load(f)
+
+    def _build_bin(self, bin_dir: str):
+        """Write one fake executable per recorded tool that replays its outputs"""
+        sh = shutil.which('sh') or '/bin/sh'
+        cat = shutil.which('cat') or '/bin/cat'
+
+        for tool, outputs in self.fixture['commands'].items():
+            cases = []
+            for index, (args, output) in enumerate(sorted(outputs.items())):
+                output_file = os.path.join(bin_dir, f"{tool}.{index}.out")
+                with open(output_file, 'w') as f:
+                    f.write(output)
+                cases.append(f"  {shlex.quote(args)}) exec {cat} {shlex.quote(output_file)} ;;")
+            if '--version' not in outputs:
+                cases.append("  --version) exit 0 ;;")
+
+            script = f"#!{sh}\ncase \"$*\" in\n" + '\n'.join(cases) + "\nesac\nexit 1\n"
+            self._write_executable(os.path.join(bin_dir, tool), script)
+
+        # sudo runs the fake tool directly so privileged paths are exercised too
+        self._write_executable(os.path.join(bin_dir, 'sudo'), f"#!{sh}\nexec \"$@\"\n")
+
+    def _write_executable(self, path: str, content: str):
+        """Write an executable script"""
+        with open(path, 'w') as f:
+            f.write(content)
+        os.chmod(path, 0o755)
+
+    def _run_once(self, cls, method: str, trace_memory: bool = False) -> Dict:
+        """Run one collector once and measure it"""
+        global _audit_counters
+
+        counters = {key: 0 for key in AUDIT_EVENTS.values()}
+        io_before = _read_syscall_counts()
+        if trace_memory:
+            tracemalloc.start()
+
+        _audit_counters = counters
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            getattr(cls(), method)()
+        finally:
+            elapsed = time.perf_counter() - start
+            cpu = time.process_time() - cpu_start
+            _audit_counters = None
+
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        io_after = _read_syscall_counts()
+        syscalls = {
+            key: io_after[key] - io_before[key] if None not in (io_before[key], io_after[key]) else None
+            for key in io_before
+        }
+
+        return {
+            'wall_ms': elapsed * 1000,
+            'cpu_ms': cpu * 1000,
+            'read_syscalls': syscalls['syscr'],
+            'write_syscalls': syscalls['syscw'],
+            'peak_kb': peak / 1024 if peak is not None else None,
+            **counters
+        }
+
+    def run(self, collectors: Optional[List[str]] = None) -> Dict:
+        """Run every collector repeat times against the fixture"""
+        global _audit_installed
+        if not _audit_installed:
+            sys.addaudithook(_audit_hook)
+            _audit_installed = True
+
+        results = []
+        previous_root = sysfs.ROOT
+        previous_path = os.environ.get('PATH', '')
+
+        with tempfile.TemporaryDirectory(prefix='lxz-bench-') as bin_dir:
+            self._build_bin(bin_dir)
+            sysfs.set_root(os.path.join(self.fixture_path, 'root'))
+            # Only fixture tools are visible, so host tools cannot leak into results
+            os.environ['PATH'] = bin_dir
+
+            try:
+                for name, cls, method in BENCH_COLLECTORS:
+                    if collectors and name not in collectors:
+                        continue
+
+                    runs = [self._run_once(cls, method) for _ in range(self.repeat)]
+                    # Memory is traced in a separate run, tracemalloc skews timings
+                    memory = self._run_once(cls, method, trace_memory=True)
+                    walls = [run['wall_ms'] for run in runs]
+
+                    results.append({
+                        'name': name,
+                        'runs': self.repeat,
+                        'median_ms': statistics.median(walls),
+                        'min_ms': min(walls),
+                        'max_ms': max(walls),
+                        'cpu_ms': statistics.median(run['cpu_ms'] for run in runs),
+                        'forks': runs[-1]['forks'],
+                        'opens': runs[-1]['opens'],
+                        'listdirs': runs[-1]['listdirs'],
+                        'read_syscalls': runs[-1]['read_syscalls'],
+                        'write_syscalls': runs[-1]['write_syscalls'],
+                        'peak_kb': memory['peak_kb']
+                    })
+            finally:
+                sysfs.set_root(previous_root)
+                os.environ['PATH'] = previous_path
+
+        return {
+            'fixture': self.fixture.get('name', os.path.basename(self.fixture_path)),
+            'repeat': self.repeat,
+            'python': sys.version.split()[0],
+            'collectors': results,
+            'total_ms': sum(result['median_ms'] for result in results)
+        }
+
+def compare_results(baseline: Dict, current: Dict, tolerance: float = 25.0) -> List[str]:
+    """Compare benchmark results, flagging slower collectors and extra forks or opens"""
+    regressions = []
+    previous = {result['name']: result for result in baseline.get('collectors', [])}
+
+    for result in current.get('collectors', []):
+        before = previous.get(result['name'])
+        if not before:
+            continue
+
+        if before['median_ms'] > 0:
+            change = (result['median_ms'] - before['median_ms']) / before['median_ms'] * 100
+            if change > tolerance:
+                regressions.append(f"{result['name']}: median {before['median_ms']:.1f} ms -> "
+                                   f"{result['median_ms']:.1f} ms (+{change:.0f}%)")
+
+        # Counts are deterministic against a fixture, any increase is a regression
+        for key in ('forks', 'opens', 'listdirs'):
+            if result[key] > before[key]:
+                regressions.append(f"{result['name']}: {key} {before[key]} -> {result[key]}")
+
+    return regressions
+
+def run_benchmarks(fixtures: List[str], repeat: int = 5, collectors: Optional[List[str]] = None) -> List[Dict]:
+    """Run the benchmark for built-in fixture names or recorded fixture directories"""
+    reports = []
+    for fixture in fixtures:
+        if fixture in FIXTURE_SPECS:
+            with tempfile.TemporaryDirectory(prefix=f'lxz-fixture-{fixture}-') as path:
+                generate_fixture(fixture, path)
+                reports.append(CollectorBenchmark(path, repeat).run(collectors))
+        else:
+            reports.append(CollectorBenchmark(fixture, repeat).run(collectors))
+    return reports
@@ -0,0 +1,165 @@
+"""
+Block Queue Module
+Reports block-layer queue parameters and checks them against workload profiles
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from .sysfs import read_attributes
+
+QUEUE_ATTRIBUTES = [
+    'scheduler',
+    'nr_requests',
+    'read_ahead_kb',
+    'rotational',
+    'write_cache',
+    'discard_max_bytes',
+    'logical_block_size',
+    'physical_block_size'
+]
+
+# Virtual devices that have no tunable hardware queue
+SKIP_PREFIXES = ('loop', 'ram', 'zram', 'sr')
+
+# Rules apply to a media type ('nvme', 'ssd', 'hdd' or 'any') and check either
+# a set of allowed values or a numeric min/max. Rules marked 'scheduled' only apply
+# while an IO scheduler is active: with 'none', nr_requests is capped at the device's
+# tag depth (about 32 on SATA) and cannot be raised
+COMMON_RULES = [
+    {'attribute': 'scheduler', 'media': 'nvme', 'expect': ['none'],
+     'reason': "NVMe devices have deep hardware queues, an IO scheduler only adds latency"},
+]
+
+PROFILES = {
+    'database': COMMON_RULES + [
+        {'attribute': 'scheduler', 'media': 'ssd', 'expect': ['none', 'mq-deadline'],
+         'reason': "Low-latency random IO wants no scheduler or mq-deadline"},
+        {'attribute': 'scheduler', 'media': 'hdd', 'expect': ['mq-deadline'],
+         'reason': "mq-deadline bounds latency for mixed reads and writes"},
+        {'attribute': 'read_ahead_kb', 'media': 'any', 'max': 128,
+         'reason': "Large read-ahead wastes bandwidth on random page reads"},
+        {'attribute': 'nr_requests', 'media': 'ssd', 'min': 256, 'scheduled': True,
+         'reason': "A shallow queue limits parallelism on flash"},
+    ],
+    'streaming': COMMON_RULES + [
+        {'attribute': 'read_ahead_kb', 'media': 'any', 'min': 1024,
+         'reason': "Sequential reads need a large read-ahead window"},
+        {'attribute': 'scheduler', 'media': 'hdd', 'expect': ['mq-deadline', 'bfq'],
+         'reason': "A scheduler merges and orders large sequential requests on spinning disks"},
+        {'attribute': 'nr_requests', 'media': 'any', 'min': 256, 'scheduled': True,
+         'reason': "Deeper queues keep large sequential transfers in flight"},
+    ],
+    'vm-host': COMMON_RULES + [
+        {'attribute': 'scheduler', 'media': 'ssd', 'expect': ['none', 'mq-deadline'],
+         'reason': "Guests schedule their own IO, avoid double scheduling"},
+        {'attribute': 'scheduler', 'media': 'hdd', 'expect': ['bfq', 'mq-deadline'],
+         'reason': "Fair sharing between guests on spinning disks"},
+        {'attribute': 'read_ahead_kb', 'media': 'any', 'max': 512,
+         'reason': "Guests do their own read-ahead"},
+        {'attribute': 'discard_max_bytes', 'media': 'ssd', 'min': 1,
+         'reason': "Without discard, thin-provisioned guest images never release space"},
+    ]
+}
+
+class BlockQueueInfo:
+    """Handles block queue parameter reporting and tuning checks"""
+
+    def __init__(self, block_path: str = '/sys/block', profile: str = 'database'):
+        self.block_path = block_path
+        self.profile = profile
+
+    def _get_scheduler(self, value: str) -> str:
+        """Get the active scheduler from "[none] mq-deadline kyber" """
+        for token in value.split():
+            if token.startswith('[') and token.endswith(']'):
+                return token[1:-1]
+        return value or 'Unknown'
+
+    def _get_media(self, name: str, rotational: str) -> str:
+        """Classify a device as nvme, ssd or hdd"""
+        if name.startswith('nvme'):
+            return 'nvme'
+        return 'hdd' if rotational == '1' else 'ssd'
+
+    def get_devices(self) -> List[Dict]:
+        """Read every device's queue parameters in one batched pass per device"""
+        devices = []
+
+        try:
+            names = sorted(os.listdir(self.block_path))
+        except OSError:
+            return devices
+
+        for name in names:
+            if name.startswith(SKIP_PREFIXES):
+                continue
+
+            queue = read_attributes(os.path.join(self.block_path, name, 'queue'), QUEUE_ATTRIBUTES)
+            if not any(queue.values()):
+                continue
+
+            queue['scheduler'] = self._get_scheduler(queue['scheduler'])
+            queue['name'] = name
+            queue['media'] = self._get_media(name, queue['rotational'])
+            devices.append(queue)
+
+        return devices
+
+    def check_device(self, device: Dict, profile: Optional[str] = None) -> List[Dict]:
+        """Check one device against a profile's rules"""
+        issues = []
+
+        for rule in PROFILES[profile or self.profile]:
+            if rule['media'] not in ('any', device['media']):
+                continue
+            if rule.get('scheduled') and device.get('scheduler') in ('none', 'Unknown'):
+                continue
+
+            value = device.get(rule['attribute'], '')
+            if 'expect' in rule:
+                if value in rule['expect'] or value in ('', 'Unknown'):
+                    continue
+                expected = ' or '.join(rule['expect'])
+            else:
+                if not value.isdigit():
+                    continue
+                number = int(value)
+                if 'min' in rule and number < rule['min']:
+                    expected = f">= {rule['min']}"
+                elif 'max' in rule and number > rule['max']:
+                    expected = f"<= {rule['max']}"
+                else:
+                    continue
+
+            issues.append({
+                'device': device['name'],
+                'attribute': rule['attribute'],
+                'value': value,
+                'expected': expected,
+                'reason': rule['reason']
+            })
+
+        return issues
+
+    def get_all_info(self) -> Dict:
+        """Get all block queue information with issues for the active profile"""
+        devices = self.get_devices()
+        issues = []
+        for device in devices:
+            issues.extend(self.check_device(device))
+
+        return {
+            'profile': self.profile,
+            'devices': devices,
+            'issues': issues
+        }
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary block queue information"""
+        if info is None:
+            info = self.get_all_info()
+        return {
+            'Tuning Profile': info['profile'],
+            'Queue Issues': str(len(info['issues']))
+        }
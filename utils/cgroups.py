@@ -0,0 +1,367 @@
+"""
+Cgroup Module
+Reports cgroup v2 limits, usage and pressure for this process and ranks all cgroups
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attribute, read_attributes, parse_cpulist
+
+CGROUP_FILES = [
+    'cgroup.controllers',
+    'cpu.max',
+    'cpu.weight',
+    'cpu.stat',
+    'cpuset.cpus.effective',
+    'cpuset.mems.effective',
+    'memory.max',
+    'memory.high',
+    'memory.current',
+    'memory.peak',
+    'memory.swap.max',
+    'memory.swap.current',
+    'pids.max',
+    'pids.current',
+    'io.stat',
+    'io.max',
+    'cpu.pressure',
+    'memory.pressure',
+    'io.pressure'
+]
+
+# Files read for every cgroup when ranking
+RANK_FILES = ['memory.current', 'cpu.stat', 'io.stat', 'memory.pressure', 'pids.current']
+
+# PSI "some avg10" above this share of time is reported
+PRESSURE_WARNING = 10.0
+
+class CgroupInfo:
+    """Handles cgroup v2 limit, usage and pressure reporting"""
+
+    def __init__(self):
+        self._device_names = {}
+
+    def _find_mount(self) -> Optional[str]:
+        """Get the cgroup2 mount point (also on hybrid v1/v2 hosts)"""
+        try:
+            with open(host_path('/proc/self/mountinfo')) as f:
+                for line in f:
+                    fields = line.split()
+                    if '-' in fields and fields[fields.index('-') + 1] == 'cgroup2':
+                        return host_path(fields[4])
+        except OSError:
+            pass
+        return None
+
+    def _get_own_path(self) -> Optional[str]:
+        """Get this process's cgroup v2 path from /proc/self/cgroup"""
+        try:
+            with open(host_path('/proc/self/cgroup')) as f:
+                for line in f:
+                    if line.startswith('0::'):
+                        return line[3:].strip()
+        except OSError:
+            pass
+        return None
+
+    def _detect_container(self, path: str) -> Optional[str]:
+        """Guess the container runtime or systemd unit this process runs in"""
+        if os.environ.get('KUBERNETES_SERVICE_HOST') or 'kubepods' in path:
+            return 'kubernetes'
+        if os.path.exists('/.dockerenv') or 'docker' in path:
+            return 'docker'
+        if os.path.exists('/run/.containerenv') or 'libpod' in path:
+            return 'podman'
+        if 'lxc' in path:
+            return 'lxc'
+        unit = os.path.basename(path)
+        if unit.endswith(('.service', '.scope', '.slice')):
+            return f"systemd ({unit})"
+        return None
+
+    def _parse_keyed(self, text: str) -> Dict[str, int]:
+        """Parse "key value" lines such as cpu.stat"""
+        values = {}
+        for line in text.split('\n'):
+            key, _, value = line.partition(' ')
+            if value.strip().isdigit():
+                values[key] = int(value)
+        return values
+
+    def _parse_cpu_max(self, text: str) -> Optional[float]:
+        """Parse cpu.max ("max 100000" or "200000 100000") into a CPU count"""
+        parts = text.split()
+        if len(parts) != 2 or parts[0] == 'max' or not parts[1].isdigit() or int(parts[1]) == 0:
+            return None
+        return int(parts[0]) / int(parts[1])
+
+    def _parse_limit(self, text: str) -> Optional[int]:
+        """Parse a byte or count limit, None for "max" or missing"""
+        return int(text) if text.isdigit() else None
+
+    def _parse_pressure(self, text: str) -> Dict[str, Dict[str, float]]:
+        """Parse PSI lines "some avg10=0.00 avg60=0.00 avg300=0.00 total=0" """
+        pressure = {}
+        for line in text.split('\n'):
+            fields = line.split()
+            if not fields:
+                continue
+            values = {}
+            for field in fields[1:]:
+                key, _, value = field.partition('=')
+                try:
+                    values[key] = float(value)
+                except ValueError:
+                    continue
+            pressure[fields[0]] = values
+        return pressure
+
+    def _device_name(self, devno: str) -> str:
+        """Get the block device name for a major:minor number"""
+        if devno not in self._device_names:
+            real = os.path.realpath(host_path(f'/sys/dev/block/{devno}'))
+            self._device_names[devno] = os.path.basename(real) if os.path.exists(real) else devno
+        return self._device_names[devno]
+
+    def _parse_io_stat(self, text: str) -> List[Dict]:
+        """Parse io.stat lines "8:0 rbytes=1 wbytes=2 rios=3 wios=4 dbytes=0 dios=0" """
+        devices = []
+        for line in text.split('\n'):
+            fields = line.split()
+            if not fields:
+                continue
+            stats = {}
+            for field in fields[1:]:
+                key, _, value = field.partition('=')
+                if value.isdigit():
+                    stats[key] = int(value)
+            devices.append({'device': self._device_name(fields[0]), **stats})
+        return devices
+
+    def _get_host(self) -> Dict:
+        """Get host CPU and memory totals to compare limits against"""
+        online = read_attribute(host_path('/sys/devices/system/cpu/online'))
+        memory = 0
+        try:
+            with open(host_path('/proc/meminfo')) as f:
+                for line in f:
+                    if line.startswith('MemTotal:'):
+                        memory = int(line.split()[1]) * 1024
+                        break
+        except (OSError, ValueError, IndexError):
+            pass
+        return {
+            'cpus': len(parse_cpulist(online)) if online else os.cpu_count() or 0,
+            'memory_bytes': memory
+        }
+
+    def _read_group(self, directory: str) -> Dict:
+        """Read and parse the interesting files of one cgroup"""
+        raw = read_attributes(directory, CGROUP_FILES)
+        cpu_stat = self._parse_keyed(raw['cpu.stat'])
+        cpuset = parse_cpulist(raw['cpuset.cpus.effective']) if raw['cpuset.cpus.effective'] else []
+
+        return {
+            'controllers': raw['cgroup.controllers'].split(),
+            'cpu_quota': self._parse_cpu_max(raw['cpu.max']),
+            'cpu_weight': raw['cpu.weight'] or None,
+            'cpu_stat': cpu_stat,
+            'cpuset': cpuset,
+            'cpuset_mems': raw['cpuset.mems.effective'] or None,
+            'memory_max': self._parse_limit(raw['memory.max']),
+            'memory_high': self._parse_limit(raw['memory.high']),
+            'memory_current': self._parse_limit(raw['memory.current']),
+            'memory_peak': self._parse_limit(raw['memory.peak']),
+            'swap_max': self._parse_limit(raw['memory.swap.max']),
+            'swap_current': self._parse_limit(raw['memory.swap.current']),
+            'pids_max': self._parse_limit(raw['pids.max']),
+            'pids_current': self._parse_limit(raw['pids.current']),
+            'io': self._parse_io_stat(raw['io.stat']),
+            'io_max': [line for line in raw['io.max'].split('\n') if line],
+            'pressure': {
+                resource: self._parse_pressure(raw[f'{resource}.pressure'])
+                for resource in ('cpu', 'memory', 'io') if raw[f'{resource}.pressure']
+            }
+        }
+
+    def _get_effective(self, mount: str, path: str, group: Dict, host: Dict) -> Dict:
+        """Get the tightest limits along the path, parents cap their children"""
+        limits = {
+            'cpu.max': group['cpu_quota'],
+            'memory.max': group['memory_max'],
+            'memory.high': group['memory_high'],
+            'pids.max': group['pids_max']
+        }
+
+        parts = [part for part in path.split('/') if part]
+        for depth in range(len(parts) - 1, 0, -1):
+            parent = read_attributes(os.path.join(mount, *parts[:depth]), list(limits))
+            for name, text in parent.items():
+                value = self._parse_cpu_max(text) if name == 'cpu.max' else self._parse_limit(text)
+                if value is not None and (limits[name] is None or value < limits[name]):
+                    limits[name] = value
+
+        cpu_limit = limits['cpu.max']
+        memory_limit = limits['memory.max']
+        memory_high = limits['memory.high']
+        pids_limit = limits['pids.max']
+
+        cpus = float(len(group['cpuset']) or host['cpus'])
+        if cpu_limit is not None:
+            cpus = min(cpus, cpu_limit)
+        memory = host['memory_bytes']
+        if memory_limit is not None and memory:
+            memory = min(memory, memory_limit)
+
+        return {
+            'cpus': cpus,
+            'cpu_quota': cpu_limit,
+            'cpuset_cpus': len(group['cpuset']) or None,
+            'memory_bytes': memory,
+            'memory_max': memory_limit,
+            'memory_high': memory_high,
+            'pids_max': pids_limit,
+            'limited': (cpus < host['cpus'] or (memory_limit is not None and memory_limit < host['memory_bytes'])
+                        or memory_high is not None)
+        }
+
+    def _check(self, group: Dict, effective: Dict, host: Dict) -> List[str]:
+        """Flag throttling, memory close to the limit and resource pressure"""
+        issues = []
+
+        stat = group['cpu_stat']
+        if stat.get('nr_periods', 0) > 0:
+            throttled = stat.get('nr_throttled', 0) / stat['nr_periods']
+            if throttled > 0.1:
+                issues.append(f"CPU throttled in {throttled * 100:.0f}% of quota periods "
+                              f"({stat.get('throttled_usec', 0) / 1e6:.1f}s in total), raise cpu.max")
+
+        if effective['cpu_quota'] is not None and group['cpuset'] and effective['cpu_quota'] > len(group['cpuset']):
+            issues.append(f"CPU quota of {effective['cpu_quota']:.2f} CPUs exceeds the {len(group['cpuset'])} "
+                          f"CPUs in cpuset, the quota can never be used")
+
+        current = group['memory_current']
+        for limit, name in ((effective['memory_max'], 'memory.max'), (effective['memory_high'], 'memory.high')):
+            if limit and current and current / limit > 0.9:
+                issues.append(f"Memory usage is {current / limit * 100:.0f}% of {name}, "
+                              f"expect reclaim stalls or OOM kills")
+                break
+
+        for resource, pressure in group['pressure'].items():
+            some = pressure.get('some', {}).get('avg10', 0.0)
+            if some >= PRESSURE_WARNING:
+                issues.append(f"{resource} pressure: tasks stalled {some:.1f}% of the last 10s")
+
+        if effective['pids_max'] and group['pids_current'] and group['pids_current'] / effective['pids_max'] > 0.9:
+            issues.append(f"{group['pids_current']} of {effective['pids_max']} pids in use")
+
+        return issues
+
+    def get_all_info(self) -> Dict:
+        """Get limits, usage and pressure of this process's cgroup next to host totals"""
+        host = self._get_host()
+        mount = self._find_mount()
+        path = self._get_own_path()
+
+        if not mount or path is None:
+            return {
+                'available': False,
+                'reason': 'cgroup v2 is not mounted (cgroup v1 only host)',
+                'host': host
+            }
+
+        directory = os.path.join(mount, path.lstrip('/'))
+        group = self._read_group(directory)
+        effective = self._get_effective(mount, path, group, host)
+
+        return {
+            'available': True,
+            'mount': mount,
+            'path': path,
+            'container': self._detect_container(path),
+            'host': host,
+            'effective': effective,
+            'group': group,
+            'issues': self._check(group, effective, host)
+        }
+
+    def _walk(self, mount: str, max_groups: int) -> List[str]:
+        """List cgroup directories breadth first, bounded by max_groups"""
+        groups = []
+        queue = ['']
+        while queue and len(groups) < max_groups:
+            relative = queue.pop(0)
+            groups.append(relative)
+            try:
+                with os.scandir(os.path.join(mount, relative)) as entries:
+                    queue.extend(os.path.join(relative, entry.name) for entry in entries
+                                 if entry.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+        return groups
+
+    def _snapshot_groups(self, mount: str, groups: List[str]) -> Dict[str, Dict]:
+        """Read the ranking files of every cgroup once"""
+        snapshot = {}
+        for relative in groups:
+            raw = read_attributes(os.path.join(mount, relative), RANK_FILES)
+            io = self._parse_io_stat(raw['io.stat'])
+            snapshot[relative] = {
+                'memory': self._parse_limit(raw['memory.current']) or 0,
+                'cpu_usec': self._parse_keyed(raw['cpu.stat']).get('usage_usec', 0),
+                'io_bytes': sum(device.get('rbytes', 0) + device.get('wbytes', 0) for device in io),
+                'memory_pressure': self._parse_pressure(raw['memory.pressure']).get('some', {}).get('avg10', 0.0),
+                'pids': self._parse_limit(raw['pids.current']) or 0
+            }
+        return snapshot
+
+    def rank_cgroups(self, sort: str = 'cpu', limit: int = 20, interval: float = 0.5,
+                     max_groups: int = 5000, leaves_only: bool = False) -> List[Dict]:
+        """Rank all cgroups by CPU, memory or IO usage over a short sample"""
+        mount = self._find_mount()
+        if not mount:
+            return []
+
+        groups = self._walk(mount, max_groups)
+        before = self._snapshot_groups(mount, groups)
+        start = time.monotonic()
+        time.sleep(interval)
+        after = self._snapshot_groups(mount, groups)
+        elapsed = max(time.monotonic() - start, 1e-6)
+
+        parents = {os.path.dirname(relative) for relative in after if relative}
+        ranked = []
+        for relative, current in after.items():
+            previous = before.get(relative, current)
+            ranked.append({
+                'path': '/' + relative if relative else '/',
+                'depth': relative.count('/') + 1 if relative else 0,
+                'leaf': relative not in parents,
+                'cpu_percent': max(0, current['cpu_usec'] - previous['cpu_usec']) / 1e6 / elapsed * 100,
+                'memory_bytes': current['memory'],
+                'io_bytes_per_sec': max(0, current['io_bytes'] - previous['io_bytes']) / elapsed,
+                'memory_pressure': current['memory_pressure'],
+                'pids': current['pids']
+            })
+
+        key = {'cpu': 'cpu_percent', 'memory': 'memory_bytes', 'io': 'io_bytes_per_sec'}[sort]
+        # Parents include their children's usage, leaves_only ranks only the workloads themselves
+        ranked = [group for group in ranked if group['path'] != '/' and (group['leaf'] or not leaves_only)]
+        ranked.sort(key=lambda group: group[key], reverse=True)
+        return ranked[:limit]
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary cgroup information"""
+        if info is None:
+            info = self.get_all_info()
+        if not info['available']:
+            return {'Cgroup': 'v2 not available'}
+        effective = info['effective']
+        memory = effective['memory_max']
+        return {
+            'Cgroup': info['path'],
+            'Effective CPUs': f"{effective['cpus']:.2f} of {info['host']['cpus']}",
+            'Memory Limit': f"{memory / 1024 ** 3:.2f} GB" if memory else 'none'
+        }
@@ -0,0 +1,266 @@
+"""
+Core Latency Module
+Measures core-to-core latency by bouncing a cache line between pairs of pinned worker processes
+"""
+
+import os
+import time
+import signal
+import statistics
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .sysfs import host_path, read_attributes, parse_cpulist, get_numa_nodes
+
+# Each concurrent pair owns two cache lines, so the adjacent-line prefetcher does not couple neighbouring pairs
+SLOT_BYTES = 128
+
+DEFAULT_ITERATIONS = 1000
+DEFAULT_SAMPLES = 5
+
+# Pair relations from closest to farthest, with their display names
+RELATIONS = {
+    'smt': 'Same core (SMT)',
+    'cache': 'Shared last-level cache',
+    'node': 'Same NUMA node',
+    'remote': 'Across NUMA nodes'
+}
+
+def get_cpu_topology(cpus: List[int]) -> Dict[int, Dict]:
+    """Get the NUMA node, physical core and last-level cache of every CPU"""
+    cpu_path = host_path('/sys/devices/system/cpu')
+    numa_nodes = get_numa_nodes(host_path('/sys/devices/system/node'))
+
+    topology = {}
+    for cpu in cpus:
+        attrs = read_attributes(os.path.join(cpu_path, f"cpu{cpu}", 'topology'),
+                                ['physical_package_id', 'thread_siblings_list'])
+        siblings = parse_cpulist(attrs['thread_siblings_list']) if attrs['thread_siblings_list'] else [cpu]
+
+        # The highest data or unified cache level is the last-level cache, named after its first CPU
+        cache, cache_level = cpu, 0
+        cache_path = os.path.join(cpu_path, f"cpu{cpu}", 'cache')
+        try:
+            indexes = [name for name in os.listdir(cache_path) if name.startswith('index')]
+        except OSError:
+            indexes = []
+        for index in indexes:
+            info = read_attributes(os.path.join(cache_path, index), ['level', 'type', 'shared_cpu_list'])
+            if info['type'] == 'Instruction' or not info['level'].isdigit() or not info['shared_cpu_list']:
+                continue
+            if int(info['level']) > cache_level:
+                cache_level = int(info['level'])
+                cache = min(parse_cpulist(info['shared_cpu_list']))
+
+        topology[cpu] = {
+            'node': next((node for node, node_cpus in numa_nodes.items() if cpu in node_cpus), 0),
+            'package': int(attrs['physical_package_id']) if attrs['physical_package_id'].isdigit() else 0,
+            'core': min(siblings),
+            'cache': cache,
+            'cache_level': cache_level
+        }
+    return topology
+
+def get_relation(topology: Dict[int, Dict], first: int, second: int) -> str:
+    """Get how close two CPUs are"""
+    a, b = topology[first], topology[second]
+    if a['core'] == b['core']:
+        return 'smt'
+    if a['cache'] == b['cache'] and a['cache_level']:
+        return 'cache'
+    if a['node'] == b['node']:
+        return 'node'
+    return 'remote'
+
+def schedule_pairs(cpus: List[int], topology: Dict[int, Dict], parallel: bool = True) -> List[List[Tuple[int, int]]]:
+    """Split every CPU pair into batches that can run at once"""
+    # A batch leaves at least one CPU idle, so the coordinator and the progress display do not preempt a worker
+    max_pairs = max(1, (len(cpus) - 1) // 2)
+
+    # Round-robin tournament: each round pairs every CPU exactly once
+    players = list(cpus) + ([None] if len(cpus) % 2 else [])
+    batches = []
+    for _ in range(len(players) - 1):
+        pairs = [tuple(sorted((players[i], players[-1 - i]))) for i in range(len(players) // 2)
+                 if players[i] is not None and players[-1 - i] is not None]
+        players = [players[0], players[-1]] + players[1:-1]
+
+        if not parallel:
+            batches.extend([pair] for pair in pairs)
+            continue
+
+        # Pairs sharing a physical core would compete for it, so they go to separate batches
+        round_batches = []
+        for pair in pairs:
+            cores = {topology[cpu]['core'] for cpu in pair}
+            for batch, used in round_batches:
+                if not cores & used and len(batch) < max_pairs:
+                    batch.append(pair)
+                    used.update(cores)
+                    break
+            else:
+                round_batches.append(([pair], set(cores)))
+        batches.extend(batch for batch, _ in round_batches)
+
+    return batches
+
+def _ping(counters, index: int, iterations: int, samples: int) -> List[float]:
+    """Bounce the counter off the partner, returning the one-way latency of each sample in ns"""
+    # The first exchange waits for the partner to arrive and is not timed
+    counters[index] = 1
+    while counters[index] != 2:
+        pass
+
+    value = 2
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            counters[index] = value + 1
+            value += 2
+            while counters[index] != value:
+                pass
+        latencies.append((time.perf_counter_ns() - start) / iterations / 2)
+    return latencies
+
+def _pong(counters, index: int, exchanges: int):
+    """Answer every odd counter value with the next even one"""
+    value = 1
+    for _ in range(exchanges):
+        while counters[index] != value:
+            pass
+        counters[index] = value + 1
+        value += 2
+
+def _worker(cpu: int, shm, conn):
+    """Pin to one CPU and play ping or pong on the slot each command names"""
+    # Ctrl+C is handled by the coordinator, which stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        conn.send(str(e))
+        return
+    conn.send(None)
+
+    counters = shm.buf.cast('Q')
+    try:
+        while True:
+            command = conn.recv()
+            if command is None:
+                break
+            role, slot, iterations, samples = command
+            index = slot * SLOT_BYTES // 8
+            if role == 'ping':
+                conn.send(_ping(counters, index, iterations, samples))
+            else:
+                _pong(counters, index, iterations * samples + 1)
+                conn.send(None)
+    except EOFError:
+        pass
+    finally:
+        counters.release()
+
+class CoreLatencyBenchmark:
+    """Handles the core-to-core latency matrix of a set of CPUs"""
+
+    def __init__(self, cpus: Optional[List[int]] = None, iterations: int = DEFAULT_ITERATIONS,
+                 samples: int = DEFAULT_SAMPLES, parallel: bool = True):
+        self.cpus = sorted(cpus or os.sched_getaffinity(0))
+        self.iterations = iterations
+        self.samples = samples
+        self.parallel = parallel
+
+    def _summarize(self, cpus: List[int], matrix: List[List[Optional[float]]], topology: Dict[int, Dict]) -> Dict:
+        """Get latency statistics for every relation between CPU pairs"""
+        by_relation = {}
+        for row, first in enumerate(cpus):
+            for column in range(row + 1, len(cpus)):
+                latency = matrix[row][column]
+                if latency is not None:
+                    by_relation.setdefault(get_relation(topology, first, cpus[column]), []).append(latency)
+
+        return {relation: {
+            'pairs': len(by_relation[relation]),
+            'min_ns': round(min(by_relation[relation]), 1),
+            'median_ns': round(statistics.median(by_relation[relation]), 1),
+            'max_ns': round(max(by_relation[relation]), 1)
+        } for relation in RELATIONS if relation in by_relation}
+
+    def run(self, progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """Measure every CPU pair, calling progress(done, total) after each batch"""
+        topology = get_cpu_topology(self.cpus)
+        # Topology order keeps caches and nodes together in the matrix
+        cpus = sorted(self.cpus, key=lambda cpu: (topology[cpu]['node'], topology[cpu]['cache'],
+                                                  topology[cpu]['core'], cpu))
+        batches = schedule_pairs(cpus, topology, self.parallel)
+        total = sum(len(batch) for batch in batches)
+
+        # Workers are forked so they inherit the mapping instead of attaching to it by name
+        context = multiprocessing.get_context('fork')
+        shm = shared_memory.SharedMemory(create=True, size=SLOT_BYTES * max([len(batch) for batch in batches] + [1]))
+        counters = shm.buf.cast('Q')
+        workers = {}
+        latencies = {}
+        start = time.monotonic()
+        try:
+            for cpu in cpus:
+                parent, child = context.Pipe()
+                process = context.Process(target=_worker, args=(cpu, shm, child), daemon=True)
+                process.start()
+                workers[cpu] = (process, parent)
+            failed = {cpu for cpu, (_, conn) in workers.items() if conn.recv() is not None}
+
+            done = 0
+            for batch in batches:
+                batch = [pair for pair in batch if not set(pair) & failed]
+                for slot, (first, second) in enumerate(batch):
+                    counters[slot * SLOT_BYTES // 8] = 0
+                    workers[second][1].send(('pong', slot, self.iterations, self.samples))
+                    workers[first][1].send(('ping', slot, self.iterations, self.samples))
+                for first, second in batch:
+                    # The median sample drops the ones the scheduler interrupted
+                    latencies[(first, second)] = statistics.median(workers[first][1].recv())
+                    workers[second][1].recv()
+                done += len(batch)
+                if progress:
+                    progress(done, total)
+        finally:
+            for process, conn in workers.values():
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+            deadline = time.monotonic() + 1.0
+            for process, _ in workers.values():
+                process.join(max(0.0, deadline - time.monotonic()))
+            # Workers still spinning on an abandoned exchange never read the stop command
+            for process, _ in workers.values():
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            counters.release()
+            shm.close()
+            shm.unlink()
+
+        cpus = [cpu for cpu in cpus if cpu not in failed]
+        matrix = [[None] * len(cpus) for _ in cpus]
+        for row, first in enumerate(cpus):
+            for column, second in enumerate(cpus):
+                latency = latencies.get((min(first, second), max(first, second)))
+                if latency is not None:
+                    matrix[row][column] = round(latency, 1)
+
+        return {
+            'cpus': cpus,
+            'failed': sorted(failed),
+            'topology': {cpu: topology[cpu] for cpu in cpus},
+            'matrix': matrix,
+            'relations': self._summarize(cpus, matrix, topology),
+            'iterations': self.iterations,
+            'samples': self.samples,
+            'parallel': self.parallel,
+            'batches': len(batches),
+            'elapsed': time.monotonic() - start
+        }
@@ -8,12 +8,17 @@ import re
 import os
 from typing import Dict, List, Optional
 
+from .sysfs import host_path
+from .isa import encode_flags, format_flag_bits, classify
+
 class CPUInfo:
     """Handles CPU information gathering"""
     
     def __init__(self):
-        self.cpuinfo_path = "/proc/cpuinfo"
+        self.cpuinfo_path = host_path("/proc/cpuinfo")
         self.lscpu_available = self._check_command("lscpu")
+        # Everything but the frequency stays the same while running, so lscpu runs once per instance
+        self._static = None
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available"""
@@ -68,12 +73,13 @@ class CPUInfo:
         
         return data
     
-    def _get_cache_info(self) -> Dict[str, str]:
+    def _get_cache_info(self, lscpu: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Get CPU cache information"""
         cache = {}
         
         if self.lscpu_available:
-            lscpu = self._get_lscpu_info()
+            if lscpu is None:
+                lscpu = self._get_lscpu_info()
             cache['l1d_cache'] = lscpu.get('l1d_cache', 'Unknown')
             cache['l1i_cache'] = lscpu.get('l1i_cache', 'Unknown')
             cache['l2_cache'] = lscpu.get('l2_cache', 'Unknown')
@@ -81,7 +87,7 @@ class CPUInfo:
         else:
             # Fallback to /sys/devices/system/cpu
             try:
-                cpu0_path = "/sys/devices/system/cpu/cpu0/cache"
+                cpu0_path = host_path("/sys/devices/system/cpu/cpu0/cache")
                 if os.path.exists(cpu0_path):
                     for idx in os.listdir(cpu0_path):
                         index_path = os.path.join(cpu0_path, idx)
@@ -125,21 +131,21 @@ class CPUInfo:
         try:
             # Current frequency
             current_freq = 0
-            freq_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"
+            freq_path = host_path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq")
             if os.path.exists(freq_path):
                 with open(freq_path) as f:
                     current_freq = int(f.read().strip()) / 1000  # Convert to MHz
                 freq['current_freq'] = f"{current_freq:.2f} MHz"
             
             # Max frequency
-            max_freq_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_max_freq"
+            max_freq_path = host_path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_max_freq")
             if os.path.exists(max_freq_path):
                 with open(max_freq_path) as f:
                     max_freq = int(f.read().strip()) / 1000
                 freq['max_freq'] = f"{max_freq:.2f} MHz"
             
             # Min frequency
-            min_freq_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_min_freq"
+            min_freq_path = host_path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_min_freq")
             if os.path.exists(min_freq_path):
                 with open(min_freq_path) as f:
                     min_freq = int(f.read().strip()) / 1000
@@ -166,18 +172,22 @@ class CPUInfo:
             cpuinfo = self._parse_cpuinfo()
             if 'flags' in cpuinfo:
                 return cpuinfo['flags'].split()
+            # ARM lists hwcaps as Features
+            if 'Features' in cpuinfo:
+                return cpuinfo['Features'].split()
         except Exception:
             pass
         return []
     
-    def _count_cores_threads(self) -> Dict[str, int]:
+    def _count_cores_threads(self, lscpu: Optional[Dict[str, str]] = None) -> Dict[str, int]:
         """Count physical cores and logical processors"""
         cores = 0
         threads = 0
         sockets = 1
         
         if self.lscpu_available:
-            lscpu = self._get_lscpu_info()
+            if lscpu is None:
+                lscpu = self._get_lscpu_info()
             cores = int(lscpu.get('core_per_socket', 0))
             sockets = int(lscpu.get('socket', 1))
             threads = int(lscpu.get('cpu', 0))
@@ -205,14 +215,16 @@ class CPUInfo:
             'sockets': sockets
         }
     
-    def get_all_info(self) -> Dict:
-        """Get all CPU information"""
+    def _get_static_info(self) -> Dict:
+        """Get the model, topology, cache and flag information"""
+        if self._static is not None:
+            return self._static
+        
         cpuinfo = self._parse_cpuinfo()
         lscpu = self._get_lscpu_info()
-        cache = self._get_cache_info()
-        freq = self._get_frequency_info()
+        cache = self._get_cache_info(lscpu)
         flags = self._get_cpu_flags()
-        core_thread = self._count_cores_threads()
+        core_thread = self._count_cores_threads(lscpu)
         
         data = {
             'model': cpuinfo.get('model_name', lscpu.get('model_name', 'Unknown')),
@@ -221,23 +233,35 @@ class CPUInfo:
             'cpu_family': cpuinfo.get('cpu_family', 'Unknown'),
             'model_number': cpuinfo.get('model', 'Unknown'),
             'stepping': cpuinfo.get('stepping', 'Unknown'),
+            'microcode': cpuinfo.get('microcode', 'Unknown'),
             'cores': core_thread['cores'],
             'threads': core_thread['threads'],
             'sockets': core_thread['sockets'],
-            'flags': flags
+            'flags': flags,
+            # Fixed-index bitset, so fleet comparisons are one XOR instead of list diffs
+            'flag_bits': format_flag_bits(encode_flags(flags))
         }
+        data['isa'] = classify(flags, data['architecture'])
         
         # Add cache info
         data.update(cache)
         
+        self._static = data
+        return data
+    
+    def get_all_info(self) -> Dict:
+        """Get all CPU information"""
+        data = dict(self._get_static_info())
+        
         # Add frequency info
-        data.update(freq)
+        data.update(self._get_frequency_info())
         
         return data
     
-    def get_summary(self) -> Dict:
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
         """Get summary CPU information"""
-        info = self.get_all_info()
+        if info is None:
+            info = self.get_all_info()
         return {
             'Processor': info.get('model', 'Unknown'),
             'Cores': f"{info.get('cores', 'Unknown')} cores, {info.get('threads', 'Unknown')} threads",
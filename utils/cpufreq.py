@@ -0,0 +1,240 @@
+"""
+CPU Frequency Policy Module
+Reports cpufreq governors, EPP, boost and platform profile across all CPUs and checks them against power profiles
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attribute, read_attributes, format_cpulist
+
+POLICY_ATTRIBUTES = [
+    'affected_cpus',
+    'scaling_driver',
+    'scaling_governor',
+    'scaling_available_governors',
+    'energy_performance_preference',
+    'scaling_min_freq',
+    'scaling_max_freq',
+    'scaling_cur_freq',
+    'cpuinfo_min_freq',
+    'cpuinfo_max_freq',
+    'base_frequency',
+    'boost'
+]
+
+INTEL_PSTATE_ATTRIBUTES = ['status', 'no_turbo', 'max_perf_pct', 'min_perf_pct', 'hwp_dynamic_boost']
+
+# Settings that differ across CPUs are reported as mismatches
+PER_CPU_SETTINGS = ['driver', 'governor', 'epp', 'boost', 'energy_perf_bias']
+
+# Rules check a per-CPU or system-wide setting against a set of allowed values or a numeric min/max
+COMMON_RULES = [
+    {'setting': 'boost', 'expect': ['enabled'],
+     'reason': "Turbo is off, so even a single busy core stays at base frequency"},
+]
+
+PROFILES = {
+    'balanced': COMMON_RULES,
+    'performance': COMMON_RULES + [
+        {'setting': 'governor', 'expect': ['performance'],
+         'reason': "Other governors raise the frequency only after load arrives, bursts run slow"},
+        {'setting': 'epp', 'expect': ['performance'],
+         'reason': "Hardware P-states trade speed for energy at any other preference"},
+        {'setting': 'energy_perf_bias', 'max': 0,
+         'reason': "A non-zero bias lets the CPU favour energy over speed"},
+        {'setting': 'platform_profile', 'expect': ['performance'],
+         'reason': "Firmware lowers power limits outside its performance profile"},
+        {'setting': 'max_perf_pct', 'min': 100,
+         'reason': "intel_pstate caps every CPU below its highest P-state"},
+    ]
+}
+
+class FrequencyPolicyInfo:
+    """Handles cpufreq policy reporting and power profile checks"""
+
+    def __init__(self, profile: str = 'balanced'):
+        self.cpu_path = host_path('/sys/devices/system/cpu')
+        self.profile = profile
+
+    def _to_mhz(self, value: str) -> Optional[int]:
+        """Convert a cpufreq kHz value to MHz"""
+        return int(value) // 1000 if value.isdigit() else None
+
+    def _get_policies(self) -> List[Dict]:
+        """Get every cpufreq policy with its CPUs and settings"""
+        cpufreq_path = os.path.join(self.cpu_path, 'cpufreq')
+        try:
+            names = sorted((name for name in os.listdir(cpufreq_path) if name.startswith('policy')),
+                           key=lambda name: int(name[6:]) if name[6:].isdigit() else 0)
+        except OSError:
+            return []
+
+        policies = []
+        for name in names:
+            attrs = read_attributes(os.path.join(cpufreq_path, name), POLICY_ATTRIBUTES)
+            cpus = [int(cpu) for cpu in attrs['affected_cpus'].split() if cpu.isdigit()]
+            if not cpus:
+                continue
+
+            max_freq = self._to_mhz(attrs['scaling_max_freq'])
+            hw_max_freq = self._to_mhz(attrs['cpuinfo_max_freq'])
+            min_freq = self._to_mhz(attrs['scaling_min_freq'])
+            hw_min_freq = self._to_mhz(attrs['cpuinfo_min_freq'])
+            policies.append({
+                'policy': name,
+                'cpus': cpus,
+                'driver': attrs['scaling_driver'] or 'Unknown',
+                'governor': attrs['scaling_governor'] or 'Unknown',
+                'available_governors': attrs['scaling_available_governors'].split(),
+                'epp': attrs['energy_performance_preference'],
+                # Per-policy boost control (amd-pstate, acpi-cpufreq on newer kernels)
+                'boost': {'1': 'enabled', '0': 'disabled'}.get(attrs['boost'], ''),
+                'min_freq': min_freq,
+                'max_freq': max_freq,
+                'cur_freq': self._to_mhz(attrs['scaling_cur_freq']),
+                'hw_min_freq': hw_min_freq,
+                'hw_max_freq': hw_max_freq,
+                'base_freq': self._to_mhz(attrs['base_frequency']),
+                'capped': bool(max_freq and hw_max_freq and max_freq < hw_max_freq),
+                'raised': bool(min_freq and hw_min_freq and min_freq > hw_min_freq)
+            })
+
+        return policies
+
+    def _get_boost(self, intel_pstate: Dict) -> Dict:
+        """Get the system-wide turbo state and the knob that controls it"""
+        if intel_pstate.get('no_turbo'):
+            return {'state': 'disabled' if intel_pstate['no_turbo'] == '1' else 'enabled',
+                    'control': 'intel_pstate/no_turbo'}
+        boost = read_attribute(os.path.join(self.cpu_path, 'cpufreq', 'boost'))
+        if boost:
+            return {'state': 'enabled' if boost == '1' else 'disabled', 'control': 'cpufreq/boost'}
+        return {'state': 'Unknown', 'control': None}
+
+    def _get_energy_perf_bias(self, cpus: List[int]) -> Dict[int, str]:
+        """Get the energy/performance bias hint of every CPU that exposes one"""
+        bias = {}
+        for cpu in cpus:
+            value = read_attribute(os.path.join(self.cpu_path, f"cpu{cpu}", 'power', 'energy_perf_bias'))
+            if value:
+                bias[cpu] = value
+        return bias
+
+    def _distribute(self, values: Dict[int, str]) -> Dict[str, List[int]]:
+        """Group CPUs by the value of a setting"""
+        groups = {}
+        for cpu, value in sorted(values.items()):
+            if value:
+                groups.setdefault(value, []).append(cpu)
+        return groups
+
+    def _check_rule(self, rule: Dict, groups: Dict[str, Optional[List[int]]], all_cpus: List[int]) -> List[str]:
+        """Check the CPU groups of one setting, or a system-wide value mapped to None, against a rule"""
+        issues = []
+        for value, cpus in groups.items():
+            if 'expect' in rule:
+                if value in rule['expect'] or value == 'Unknown':
+                    continue
+                expected = ' or '.join(rule['expect'])
+            else:
+                if not value.isdigit():
+                    continue
+                number = int(value)
+                if 'min' in rule and number < rule['min']:
+                    expected = f">= {rule['min']}"
+                elif 'max' in rule and number > rule['max']:
+                    expected = f"<= {rule['max']}"
+                else:
+                    continue
+
+            if cpus is None:
+                scope = 'system-wide'
+            else:
+                scope = 'on all CPUs' if cpus == all_cpus else f"on CPUs {format_cpulist(cpus)}"
+            issues.append(f"{rule['setting']}={value} {scope} (expected {expected}): {rule['reason']}")
+        return issues
+
+    def _check(self, policies: List[Dict], groups: Dict[str, Dict[str, List[int]]],
+               system: Dict[str, str], all_cpus: List[int]) -> List[str]:
+        """Flag settings that differ across CPUs, overridden limits and profile violations"""
+        issues = []
+
+        for setting in PER_CPU_SETTINGS:
+            if len(groups[setting]) > 1:
+                issues.append(f"{setting} differs across CPUs: " + ', '.join(
+                    f"{value} on {format_cpulist(cpus)}" for value, cpus in groups[setting].items()))
+
+        for policy in policies:
+            if policy['capped']:
+                issues.append(f"{policy['policy']} (CPUs {format_cpulist(policy['cpus'])}): scaling_max_freq "
+                              f"{policy['max_freq']} MHz is below the hardware maximum of {policy['hw_max_freq']} MHz")
+            if policy['raised']:
+                issues.append(f"{policy['policy']} (CPUs {format_cpulist(policy['cpus'])}): scaling_min_freq "
+                              f"raised to {policy['min_freq']} MHz")
+
+        for rule in PROFILES[self.profile]:
+            if rule['setting'] in groups:
+                issues.extend(self._check_rule(rule, groups[rule['setting']], all_cpus))
+            elif system.get(rule['setting']):
+                issues.extend(self._check_rule(rule, {system[rule['setting']]: None}, all_cpus))
+
+        return issues
+
+    def get_all_info(self) -> Dict:
+        """Get all frequency policy information with issues for the active profile"""
+        policies = self._get_policies()
+        all_cpus = sorted(cpu for policy in policies for cpu in policy['cpus'])
+
+        intel_pstate = {}
+        intel_path = os.path.join(self.cpu_path, 'intel_pstate')
+        if os.path.isdir(intel_path):
+            intel_pstate = read_attributes(intel_path, INTEL_PSTATE_ATTRIBUTES)
+        amd_pstate = read_attribute(os.path.join(self.cpu_path, 'amd_pstate', 'status'))
+        boost = self._get_boost(intel_pstate)
+        platform_profile = read_attribute(host_path('/sys/firmware/acpi/platform_profile'))
+
+        per_cpu = {setting: {} for setting in PER_CPU_SETTINGS}
+        for policy in policies:
+            for cpu in policy['cpus']:
+                per_cpu['driver'][cpu] = policy['driver']
+                per_cpu['governor'][cpu] = policy['governor']
+                per_cpu['epp'][cpu] = policy['epp']
+                # The global knob wins over the per-policy one when both exist
+                per_cpu['boost'][cpu] = boost['state'] if boost['control'] else policy['boost']
+        per_cpu['energy_perf_bias'] = self._get_energy_perf_bias(all_cpus)
+        groups = {setting: self._distribute(values) for setting, values in per_cpu.items()}
+
+        system = {
+            'platform_profile': platform_profile,
+            'max_perf_pct': intel_pstate.get('max_perf_pct', '')
+        }
+
+        return {
+            'available': bool(policies),
+            'profile': self.profile,
+            'policies': policies,
+            'settings': {setting: {value: format_cpulist(cpus) for value, cpus in values.items()}
+                         for setting, values in groups.items()},
+            'boost': boost['state'],
+            'boost_control': boost['control'],
+            'intel_pstate': intel_pstate,
+            'amd_pstate': amd_pstate,
+            'platform_profile': platform_profile,
+            'platform_profile_choices': read_attribute(
+                host_path('/sys/firmware/acpi/platform_profile_choices')).split(),
+            'issues': self._check(policies, groups, system, all_cpus) if policies else []
+        }
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary frequency policy information"""
+        if info is None:
+            info = self.get_all_info()
+        if not info['available']:
+            return {'Frequency Policy': 'No cpufreq policies'}
+        return {
+            'Governor': ', '.join(info['settings']['governor']) or 'Unknown',
+            'Driver': ', '.join(info['settings']['driver']) or 'Unknown',
+            'Turbo': info['boost'],
+            'Policy Issues': str(len(info['issues']))
+        }
@@ -0,0 +1,200 @@
+"""
+Report Diff Module
+Compares exported reports and groups hosts into hardware equivalence classes
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterator, List, Tuple
+
+from .isa import encode_flags, format_flag_bits, parse_flag_bits, compare_flag_bits, classify
+from .sysctl import AUTO_SCALED_KEYS
+
+# Fields compared between reports, in display order
+FINGERPRINT_FIELDS = [
+    'cpu.model',
+    'cpu.microcode',
+    'cpu.isa_level',
+    'cpu.flags',
+    'kernel.mitigations',
+    'kernel.sysctl',
+    'cpu.l1d_cache',
+    'cpu.l1i_cache',
+    'cpu.l2_cache',
+    'cpu.l3_cache',
+    'memory.dimm_count',
+    'memory.dimms',
+    'memory.peak_bandwidth',
+    'bios.vendor',
+    'bios.version',
+    'gpu.count',
+    'gpu.models',
+    'gpu.drivers',
+    'gpu.firmware'
+]
+
+class ReportDiff:
+    """Handles structural comparison of exported reports"""
+
+    def __init__(self):
+        self.classes = {}
+        self.errors = []
+        self.report_count = 0
+
+    def _iter_reports(self, path: str) -> Iterator[Tuple[str, Dict]]:
+        """Yield (source, report) pairs from a JSON file, JSONL file or directory"""
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith('.json') or name.endswith('.jsonl'):
+                    yield from self._iter_reports(os.path.join(path, name))
+            return
+
+        try:
+            with open(path) as f:
+                if path.endswith('.jsonl'):
+                    # One report per line, read lazily
+                    for lineno, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield f"{path}:{lineno}", json.loads(line)
+                        except ValueError as e:
+                            self.errors.append(f"{path}:{lineno}: {e}")
+                else:
+                    yield path, json.load(f)
+        except (OSError, ValueError) as e:
+            self.errors.append(f"{path}: {e}")
+
+    def _get_hostname(self, source: str, report: Dict) -> str:
+        """Get the host a report belongs to"""
+        hostname = report.get('hostname')
+        if hostname:
+            return hostname
+        return os.path.splitext(os.path.basename(source))[0]
+
+    def fingerprint(self, report: Dict) -> Dict[str, str]:
+        """Extract the compared fields from a report"""
+        info = report.get('system_info', report)
+        cpu = info.get('cpu') or {}
+        memory = info.get('memory') or {}
+        motherboard = info.get('motherboard') or {}
+        gpus = (info.get('gpu') or {}).get('gpus') or []
+        mitigations = info.get('mitigations') or {}
+        topology = memory.get('topology') or {}
+        sysctl = (info.get('sysctl') or {}).get('values') or {}
+
+        modules = sorted(memory.get('modules') or [], key=lambda m: m.get('locator', ''))
+        dimms = [
+            f"{m.get('locator', '?')}={m.get('size', '?')} {m.get('type', '?')} {m.get('speed', '?')}"
+            for m in modules
+        ]
+
+        # Reports from before the bitset only carry the flag list
+        flags = cpu.get('flags') or []
+        flag_bits = cpu.get('flag_bits') or format_flag_bits(encode_flags(flags))
+        isa_level = (cpu.get('isa') or {}).get('level') or (
+            classify(flags, str(cpu.get('architecture', '')))['level'] if flags else 'Unknown')
+
+        return {
+            'cpu.model': str(cpu.get('model', 'Unknown')),
+            'cpu.microcode': str(cpu.get('microcode', 'Unknown')),
+            'cpu.isa_level': str(isa_level),
+            'cpu.flags': flag_bits,
+            # Costly mitigations explain most same-hardware, different-speed hosts
+            'kernel.mitigations': '; '.join(
+                cost['mitigation'] for cost in mitigations.get('costs') or []
+            ) or ('None' if mitigations else 'Unknown'),
+            # Tunables drift per host, the whole set is one field so drifted hosts split off. Defaults
+            # scaled from usable memory would split hosts that only differ in RAM, so they are left out
+            'kernel.sysctl': '; '.join(f"{key}={value}" for key, value in sorted(sysctl.items())
+                                       if value and key not in AUTO_SCALED_KEYS) or 'Unknown',
+            'cpu.l1d_cache': str(cpu.get('l1d_cache', 'Unknown')),
+            'cpu.l1i_cache': str(cpu.get('l1i_cache', 'Unknown')),
+            'cpu.l2_cache': str(cpu.get('l2_cache', 'Unknown')),
+            'cpu.l3_cache': str(cpu.get('l3_cache', 'Unknown')),
+            'memory.dimm_count': str(len(modules)),
+            'memory.dimms': '; '.join(dimms) if dimms else 'None',
+            # Same DIMMs in different slots or at a lower configured speed
+            'memory.peak_bandwidth': (
+                f"{topology['peak_gbps']} GB/s" if topology.get('peak_gbps') is not None else 'Unknown'),
+            'bios.vendor': str(motherboard.get('bios_vendor', 'Unknown')),
+            'bios.version': str(motherboard.get('bios_version', 'Unknown')),
+            'gpu.count': str(len(gpus)),
+            'gpu.models': '; '.join(str(g.get('model', 'Unknown')) for g in gpus) or 'None',
+            'gpu.drivers': '; '.join(str(g.get('driver_version', 'Unknown')) for g in gpus) or 'None',
+            'gpu.firmware': '; '.join(str(g.get('vbios', 'Unknown')) for g in gpus) or 'None'
+        }
+
+    def _hash_fingerprint(self, fingerprint: Dict[str, str]) -> str:
+        """Get a stable hash for a fingerprint"""
+        payload = json.dumps(fingerprint, sort_keys=True).encode()
+        return hashlib.sha256(payload).hexdigest()[:16]
+
+    def add_report(self, source: str, report: Dict):
+        """Add a single report to its equivalence class"""
+        fingerprint = self.fingerprint(report)
+        key = self._hash_fingerprint(fingerprint)
+
+        # Only one fingerprint is kept per class, reports are discarded
+        entry = self.classes.setdefault(key, {'fingerprint': fingerprint, 'hosts': []})
+        entry['hosts'].append(self._get_hostname(source, report))
+        self.report_count += 1
+
+    def compare(self, paths: List[str]) -> Dict:
+        """Stream all reports and compute the diff between equivalence classes"""
+        for path in paths:
+            for source, report in self._iter_reports(path):
+                if isinstance(report, dict):
+                    self.add_report(source, report)
+                else:
+                    self.errors.append(f"{source}: not a report object")
+
+        return self.get_result()
+
+    def _describe(self, field: str, baseline: str, value: str) -> str:
+        """Get how a field differs from the baseline, flag bitsets as added/missing flags and sysctls as drifted settings"""
+        if field == 'kernel.sysctl':
+            # Only the settings that drifted, not the whole set
+            baseline_items = set((baseline or '').split('; '))
+            return '; '.join(item for item in value.split('; ') if item not in baseline_items)
+        if field != 'cpu.flags':
+            return value
+        added, missing = compare_flag_bits(parse_flag_bits(baseline), parse_flag_bits(value))
+        return ' '.join([f"+{flag}" for flag in added] + [f"-{flag}" for flag in missing])
+
+    def get_result(self) -> Dict:
+        """Get the diff result for all reports added so far"""
+        ordered = sorted(
+            self.classes.items(),
+            key=lambda item: (-len(item[1]['hosts']), item[0])
+        )
+
+        differing_fields = [
+            field for field in FINGERPRINT_FIELDS
+            if len({entry['fingerprint'][field] for _, entry in ordered}) > 1
+        ]
+
+        classes = []
+        baseline = ordered[0][1]['fingerprint'] if ordered else {}
+        for key, entry in ordered:
+            classes.append({
+                'hash': key,
+                'count': len(entry['hosts']),
+                'hosts': sorted(entry['hosts']),
+                'fingerprint': entry['fingerprint'],
+                # Differences are relative to the largest class
+                'differences': {
+                    field: self._describe(field, baseline.get(field), entry['fingerprint'][field])
+                    for field in differing_fields
+                    if entry['fingerprint'][field] != baseline.get(field)
+                }
+            })
+
+        return {
+            'reports': self.report_count,
+            'classes': classes,
+            'differing_fields': differing_fields,
+            'errors': self.errors
+        }
@@ -0,0 +1,148 @@
+"""
+DIMMs Module
+Maps memory slots to sockets and channels and checks the population for balance and speed
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Socket from the bank locator or locator, e.g. "P0 CHANNEL A", "CPU1_DIMM_A1", "PROC 2 DIMM 3", "_Node0_"
+SOCKET_PATTERN = re.compile(r'(?<![A-Z])(CPU|PROC|SOCKET|NODE|P)[\s_-]?(\d+)')
+
+# Channel, tried in order, e.g. "P0 CHANNEL A", "ChannelB-DIMM0", "CPU1_DIMM_C2", "P1-DIMMD1"
+CHANNEL_PATTERNS = [
+    re.compile(r'CHANNEL[\s_-]?([A-Z0-9]+)'),
+    re.compile(r'(?<![A-Z])CH[\s_-]?([A-Z0-9]+)'),
+    re.compile(r'DIMM[\s_-]?([A-Z])\d')
+]
+
+def locate(slot: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """Get the socket and channel a slot sits on from its locators"""
+    text = f"{slot.get('bank_locator', '')} {slot.get('locator', '')}".upper()
+
+    match = SOCKET_PATTERN.search(text)
+    socket = f"{match.group(1)}{match.group(2)}" if match else None
+
+    for pattern in CHANNEL_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return socket, match.group(1)
+    return socket, None
+
+def _gbps(channels: int, rate_mts: int, width_bits: int) -> float:
+    """Get the peak bandwidth of channels running at a transfer rate"""
+    return channels * rate_mts * width_bits / 8 / 1000
+
+def _format_size(size_bytes: int) -> str:
+    """Format a DIMM size"""
+    return f"{size_bytes // 1024 ** 3} GB" if size_bytes >= 1024 ** 3 else f"{size_bytes // 1024 ** 2} MB"
+
+def analyze(slots: List[Dict]) -> Dict:
+    """Check the slot population for balance and speed and estimate the bandwidth it costs"""
+    populated = [slot for slot in slots if slot['populated']]
+    info = {
+        'slots': len(slots),
+        'populated': len(populated),
+        'sockets': [],
+        'unmapped': [],
+        'peak_gbps': None,
+        'potential_gbps': None,
+        'lost_gbps': None,
+        'lost_percent': None,
+        'issues': []
+    }
+    if not populated:
+        return info
+
+    # socket -> channel -> slots, in slot order
+    sockets = {}
+    for slot in slots:
+        socket, channel = locate(slot)
+        slot['socket'] = socket
+        slot['channel'] = channel
+        if channel is None:
+            info['unmapped'].append(slot.get('locator', 'Unknown'))
+            continue
+        sockets.setdefault(socket or '-', {}).setdefault(channel, []).append(slot)
+
+    # Potential bandwidth assumes every channel filled with modules at the best rated speed seen
+    rated = max(slot['speed_mts'] for slot in populated)
+    width = max(slot['data_width_bits'] for slot in populated) or 64
+    peak_total = 0.0
+    potential_total = 0.0
+
+    for socket, channels in sockets.items():
+        rows = []
+        for channel, channel_slots in channels.items():
+            dimms = [slot for slot in channel_slots if slot['populated']]
+            rows.append({
+                'channel': channel,
+                'slots': len(channel_slots),
+                'dimms': len(dimms),
+                'capacity_bytes': sum(slot['size_bytes'] for slot in dimms),
+                # A channel runs at the pace of its slowest module
+                'speed_mts': min((slot['configured_speed_mts'] for slot in dimms), default=0),
+                'locators': [slot.get('locator', 'Unknown') for slot in dimms]
+            })
+
+        used = [row for row in rows if row['dimms']]
+        peak = sum(_gbps(1, row['speed_mts'], width) for row in used)
+        potential = _gbps(len(rows), rated, width)
+        peak_total += peak
+        potential_total += potential
+        info['sockets'].append({
+            'socket': socket,
+            'channels': rows,
+            'populated_channels': len(used),
+            'capacity_bytes': sum(row['capacity_bytes'] for row in rows),
+            'peak_gbps': round(peak, 1),
+            'potential_gbps': round(potential, 1)
+        })
+
+        label = f"{socket}: " if socket != '-' else ''
+        empty = [row['channel'] for row in rows if not row['dimms']]
+        if used and empty:
+            info['issues'].append(
+                f"{label}channel{'s' if len(empty) > 1 else ''} {', '.join(empty)} empty: memory runs on "
+                f"{len(used)} of {len(rows)} channels")
+        counts = {row['dimms'] for row in used}
+        if len(counts) > 1:
+            info['issues'].append(
+                f"{label}channels hold {min(counts)} to {max(counts)} DIMMs, interleaving is uneven")
+        elif len({row['capacity_bytes'] for row in used}) > 1:
+            info['issues'].append(f"{label}channel capacities differ, interleaving is uneven")
+
+    sizes = {}
+    for slot in populated:
+        sizes[slot['size_bytes']] = sizes.get(slot['size_bytes'], 0) + 1
+    if len(sizes) > 1:
+        info['issues'].append("Mixed DIMM sizes: " + ', '.join(
+            f"{count} x {_format_size(size)}" for size, count in sorted(sizes.items())))
+
+    ranks = {slot['rank'] for slot in populated if slot.get('rank', 'Unknown') != 'Unknown'}
+    if len(ranks) > 1:
+        info['issues'].append(f"Mixed DIMM ranks: {', '.join(sorted(ranks))}")
+
+    slow = [slot for slot in populated if 0 < slot['configured_speed_mts'] < slot['speed_mts']]
+    if slow:
+        info['issues'].append(
+            f"{len(slow)} DIMM{'s run' if len(slow) > 1 else ' runs'} below rated speed: " + ', '.join(
+                f"{slot.get('locator', 'Unknown')} at {slot['configured_speed_mts']} of {slot['speed_mts']} MT/s"
+                for slot in slow))
+
+    capacities = {socket['capacity_bytes'] for socket in info['sockets'] if socket['socket'] != '-'}
+    if len(capacities) > 1:
+        info['issues'].append("Sockets hold different amounts of memory: " + ', '.join(
+            f"{socket['socket']} {_format_size(socket['capacity_bytes'])}" for socket in info['sockets']))
+
+    if info['unmapped']:
+        info['issues'].append(f"Could not map {len(info['unmapped'])} slot(s) to a channel: "
+                              f"{', '.join(info['unmapped'])}")
+
+    if sockets and rated:
+        info['peak_gbps'] = round(peak_total, 1)
+        info['potential_gbps'] = round(potential_total, 1)
+        info['lost_gbps'] = round(potential_total - peak_total, 1)
+        info['lost_percent'] = round((potential_total - peak_total) / potential_total * 100, 1)
+
+    return info
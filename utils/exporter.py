@@ -5,8 +5,9 @@ Handles exporting system information to various formats
 
 import json
 import os
+import socket
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
 class ExportReport:
     """Handles report export functionality"""
@@ -26,6 +27,7 @@ class ExportReport:
         export_data = {
             'generated_at': datetime.now().isoformat(),
             'generator': 'LX-Z v1.0',
+            'hostname': socket.gethostname(),
             'system_info': data
         }
         
@@ -34,6 +36,20 @@ class ExportReport:
         
         return filepath
     
+    def export_jsonl(self, reports: List[Dict], filename: str = None) -> str:
+        """Export already wrapped reports as JSON Lines, one report per line"""
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"lxz_fleet_{timestamp}.jsonl"
+        
+        filepath = os.path.join(self.output_dir, filename)
+        
+        with open(filepath, 'w') as f:
+            for report in reports:
+                f.write(json.dumps(report, separators=(',', ':')) + "\n")
+        
+        return filepath
+    
     def export_txt(self, data: Dict, filename: str = None) -> str:
         """Export data as formatted text"""
         if filename is None:
@@ -61,6 +77,7 @@ class ExportReport:
                 f.write(f"Architecture: {cpu.get('architecture', 'Unknown')}\n")
                 f.write(f"Vendor ID: {cpu.get('vendor_id', 'Unknown')}\n")
                 f.write(f"CPU Family: {cpu.get('cpu_family', 'Unknown')}\n")
+                f.write(f"Microcode: {cpu.get('microcode', 'Unknown')}\n")
                 f.write(f"Cores: {cpu.get('cores', 'Unknown')}\n")
                 f.write(f"Threads: {cpu.get('threads', 'Unknown')}\n")
                 f.write(f"Current Frequency: {cpu.get('current_freq', 'Unknown')}\n")
@@ -70,6 +87,21 @@ class ExportReport:
                 f.write(f"L2 Cache: {cpu.get('l2_cache', 'Unknown')}\n")
                 f.write(f"L3 Cache: {cpu.get('l3_cache', 'Unknown')}\n")
                 
+                isa = cpu.get('isa')
+                if isa:
+                    f.write(f"ISA Level: {isa['level']}\n")
+                    if isa.get('next_level'):
+                        f.write(f"Missing for {isa['next_level']}: {', '.join(isa['missing_for_next'])}\n")
+                    if isa.get('avx512'):
+                        f.write(f"AVX-512: {isa.get('avx512_generation') or 'partial'} "
+                                f"({', '.join(isa['avx512'])})\n")
+                    if isa.get('amx'):
+                        f.write(f"AMX: {', '.join(isa['amx'])}\n")
+                    if isa.get('vector'):
+                        f.write(f"Vector Extensions: {', '.join(isa['vector'])}\n")
+                    f.write(f"Crypto: {', '.join(isa['crypto']) or 'None'}\n")
+                    f.write(f"Flag Bitset: {cpu.get('flag_bits', '')}\n")
+                
                 if cpu.get('flags'):
                     f.write(f"\nCPU Flags ({len(cpu['flags'])} total):\n")
                     flags_text = ', '.join(cpu['flags'])
@@ -102,6 +134,21 @@ class ExportReport:
                         f.write(f"    Type: {module.get('type', 'N/A')}\n")
                         f.write(f"    Speed: {module.get('speed', 'N/A')}\n")
                         f.write(f"    Manufacturer: {module.get('manufacturer', 'N/A')}\n")
+                
+                topology = mem.get('topology') or {}
+                if topology.get('sockets'):
+                    f.write(f"\nDIMM Population: {topology['populated']} of {topology['slots']} slots\n")
+                    for socket in topology['sockets']:
+                        channels = ', '.join(f"{channel['channel']}={channel['dimms']}" for channel in socket['channels'])
+                        f.write(f"  {socket['socket']}: {socket['populated_channels']} of {len(socket['channels'])} "
+                                f"channels ({channels}), {socket['peak_gbps']} GB/s peak\n")
+                    if topology.get('potential_gbps'):
+                        f.write(f"Peak Bandwidth: {topology['peak_gbps']} of {topology['potential_gbps']} GB/s "
+                                f"({topology['lost_percent']}% lost to population and speed)\n")
+                    if topology['issues']:
+                        f.write("DIMM Issues:\n")
+                        for issue in topology['issues']:
+                            f.write(f"  - {issue}\n")
             
             # Storage Information
             if 'storage' in data:
@@ -129,6 +176,12 @@ class ExportReport:
                         f.write(f"    Used: {part.get('used', 'Unknown')}\n")
                         f.write(f"    Free: {part.get('free', 'Unknown')}\n")
                         f.write(f"    Usage: {part.get('percent', 'Unknown')}\n")
+                        f.write(f"    Inodes: {part.get('inodes', 'Unknown')}\n")
+                        f.write(f"    Options: {','.join(part.get('options', [])) or 'None'}\n")
+                        if part.get('backing'):
+                            f.write(f"    Backing Devices: {part['backing']}\n")
+                        for issue in part.get('issues', []):
+                            f.write(f"    Issue: {issue}\n")
             
             # GPU Information
             if 'gpu' in data:
@@ -146,6 +199,8 @@ class ExportReport:
                         f.write(f"  Driver Version: {gpu.get('driver_version', 'Unknown')}\n")
                         if gpu.get('vram'):
                             f.write(f"  VRAM: {gpu.get('vram', 'Unknown')}\n")
+                        if gpu.get('vbios'):
+                            f.write(f"  VBIOS: {gpu.get('vbios', 'Unknown')}\n")
                 
                 if gpu_data.get('opengl') or gpu_data.get('vulkan'):
                     f.write("\nGraphics API Support:\n")
@@ -186,11 +241,235 @@ class ExportReport:
                     for fan, speed in sensors['fans'].items():
                         f.write(f"  {fan}: {speed}\n")
                 
+                for key, title in [('voltages', 'Voltages'), ('currents', 'Currents'), ('power', 'Power'),
+                                   ('energy', 'Energy')]:
+                    if sensors.get(key):
+                        f.write(f"\n{title}:\n")
+                        for sensor, value in sensors[key].items():
+                            f.write(f"  {sensor}: {value}\n")
+                
+                if sensors.get('alarms'):
+                    f.write("\nSensor Alarms:\n")
+                    for alarm in sensors['alarms']:
+                        f.write(f"  - {alarm}\n")
+                
                 if sensors.get('battery'):
                     f.write("\nBattery:\n")
                     for key, value in sensors['battery'].items():
                         f.write(f"  {key}: {value}\n")
             
+            # NVMe Information
+            if 'nvme' in data and data['nvme'].get('controllers'):
+                f.write("\n" + "="*80 + "\n")
+                f.write("NVME CONTROLLERS\n")
+                f.write("="*80 + "\n")
+                nvme = data['nvme']
+                
+                for controller in nvme['controllers']:
+                    f.write(f"\n  {controller.get('name', 'Unknown')}:\n")
+                    f.write(f"    Model: {controller.get('model', 'Unknown')}\n")
+                    f.write(f"    Firmware: {controller.get('firmware', 'Unknown')}\n")
+                    f.write(f"    Transport: {controller.get('transport', 'Unknown')}\n")
+                    f.write(f"    NUMA Node: {controller.get('numa_node', 'N/A')}\n")
+                    for namespace in controller.get('namespaces', []):
+                        f.write(f"    Namespace {namespace.get('name', 'Unknown')}:"
+                                f" scheduler={namespace.get('scheduler', 'Unknown')}"
+                                f" hw_queues={namespace.get('hw_queues', 'Unknown')}"
+                                f" nr_requests={namespace.get('nr_requests', 'Unknown')}"
+                                f" max_hw_sectors_kb={namespace.get('max_hw_sectors_kb', 'Unknown')}\n")
+                
+                if nvme.get('issues'):
+                    f.write("\nNVMe Issues:\n")
+                    for issue in nvme['issues']:
+                        f.write(f"  - {issue}\n")
+            
+            # Block Queue Information
+            if 'blockqueue' in data:
+                f.write("\n" + "="*80 + "\n")
+                f.write(f"BLOCK QUEUE TUNING (profile: {data['blockqueue'].get('profile', 'Unknown')})\n")
+                f.write("="*80 + "\n")
+                blockqueue = data['blockqueue']
+                
+                for device in blockqueue.get('devices', []):
+                    f.write(f"\n  {device.get('name', 'Unknown')} ({device.get('media', 'Unknown')}):\n")
+                    f.write(f"    Scheduler: {device.get('scheduler', 'Unknown')}\n")
+                    f.write(f"    nr_requests: {device.get('nr_requests', 'Unknown')}\n")
+                    f.write(f"    read_ahead_kb: {device.get('read_ahead_kb', 'Unknown')}\n")
+                    f.write(f"    Write Cache: {device.get('write_cache', 'Unknown')}\n")
+                    f.write(f"    discard_max_bytes: {device.get('discard_max_bytes', 'Unknown')}\n")
+                    f.write(f"    Block Size (logical/physical): {device.get('logical_block_size', 'Unknown')}"
+                            f"/{device.get('physical_block_size', 'Unknown')}\n")
+                
+                if blockqueue.get('issues'):
+                    f.write("\nQueue Issues:\n")
+                    for issue in blockqueue['issues']:
+                        f.write(f"  - {issue['device']}: {issue['attribute']}={issue['value']}"
+                                f" (expected {issue['expected']}) - {issue['reason']}\n")
+            
+            # PCIe Link Information
+            if 'pcie' in data:
+                f.write("\n" + "="*80 + "\n")
+                f.write("PCIE LINK HEALTH\n")
+                f.write("="*80 + "\n")
+                pcie = data['pcie']
+                
+                f.write(f"Links Checked: {len(pcie.get('links', []))}\n")
+                f.write(f"Downgraded Links: {len(pcie.get('downgraded', []))}\n")
+                
+                for link in pcie.get('downgraded', []):
+                    identity = ', '.join(link.get('identity', []))
+                    f.write(f"\n  {link.get('address', 'Unknown')} ({link.get('role', 'Unknown')}"
+                            f"{': ' + identity if identity else ''}):\n")
+                    f.write(f"    Current Link: {link.get('current_link', 'Unknown')}\n")
+                    f.write(f"    Maximum Link: {link.get('max_link', 'Unknown')}\n")
+                    f.write(f"    NUMA Node: {link.get('numa_node', 'N/A')}\n")
+                    if link.get('note'):
+                        f.write(f"    Note: {link['note']}\n")
+            
+            # Interrupt Distribution
+            if 'interrupts' in data:
+                f.write("\n" + "="*80 + "\n")
+                f.write("INTERRUPT DISTRIBUTION\n")
+                f.write("="*80 + "\n")
+                interrupts = data['interrupts']
+                
+                f.write(f"Total Rate: {interrupts.get('total_rate', 0):.0f}/s over "
+                        f"{interrupts.get('interval', 0):.1f}s on {len(interrupts.get('cpus', []))} CPUs\n")
+                
+                for device in [d for d in interrupts.get('devices', []) if d.get('rate', 0) > 0][:20]:
+                    top = sorted(range(len(device['per_cpu'])), key=lambda i: device['per_cpu'][i], reverse=True)[:4]
+                    busiest = ', '.join(f"CPU{interrupts['cpus'][i]}={device['per_cpu'][i]:.0f}/s"
+                                        for i in top if device['per_cpu'][i] > 0)
+                    f.write(f"\n  {device['device']} ({device['irqs']} IRQs, node "
+                            f"{device['node'] if device['node'] is not None else 'N/A'}):\n")
+                    f.write(f"    Rate: {device['rate']:.0f}/s\n")
+                    f.write(f"    Busiest CPUs: {busiest}\n")
+                
+                if interrupts.get('issues'):
+                    f.write("\nInterrupt Issues:\n")
+                    for issue in interrupts['issues']:
+                        f.write(f"  - {issue}\n")
+
+            # Vulnerability Mitigations
+            if 'mitigations' in data:
+                f.write("\n" + "="*80 + "\n")
+                f.write("CPU VULNERABILITIES & MITIGATIONS\n")
+                f.write("="*80 + "\n")
+                mitigations = data['mitigations']
+                
+                f.write(f"Microcode: {mitigations['microcode']['revision']}\n")
+                f.write(f"SMT: {mitigations['smt']['control']}\n")
+                f.write(f"Kernel Command Line: {mitigations['cmdline']}\n")
+                
+                f.write("\nVulnerabilities:\n")
+                for vulnerability in mitigations['vulnerabilities']:
+                    f.write(f"  {vulnerability['name']}: {vulnerability['status']}\n")
+                
+                if mitigations['costs']:
+                    f.write("\nMitigations With a Performance Cost:\n")
+                    for cost in mitigations['costs']:
+                        f.write(f"  - {cost['mitigation']} ({cost['vulnerability']}): {cost['cost']}\n")
+                
+                if mitigations['issues']:
+                    f.write("\nMitigation Issues:\n")
+                    for issue in mitigations['issues']:
+                        f.write(f"  - {issue}\n")
+            
+            # CPU Frequency Policy
+            if 'cpufreq' in data and data['cpufreq'].get('available'):
+                f.write("\n" + "="*80 + "\n")
+                f.write(f"CPU FREQUENCY POLICY (profile: {data['cpufreq']['profile']})\n")
+                f.write("="*80 + "\n")
+                cpufreq = data['cpufreq']
+                
+                for setting, groups in cpufreq['settings'].items():
+                    if groups:
+                        f.write(f"{setting}: {', '.join(f'{value} on {cpus}' for value, cpus in groups.items())}\n")
+                if cpufreq['platform_profile']:
+                    f.write(f"Platform Profile: {cpufreq['platform_profile']}\n")
+                
+                f.write("\nPolicies:\n")
+                for policy in cpufreq['policies']:
+                    f.write(f"  {policy['policy']}: {policy['governor']}, {policy['min_freq']}-{policy['max_freq']} MHz "
+                            f"(hardware {policy['hw_min_freq']}-{policy['hw_max_freq']} MHz)\n")
+                
+                if cpufreq['issues']:
+                    f.write("\nFrequency Policy Issues:\n")
+                    for issue in cpufreq['issues']:
+                        f.write(f"  - {issue}\n")
+            
+            # Kernel Tunables
+            if 'sysctl' in data and data['sysctl'].get('available'):
+                f.write("\n" + "="*80 + "\n")
+                f.write(f"KERNEL TUNABLES (profile: {data['sysctl']['profile']})\n")
+                f.write("="*80 + "\n")
+                sysctl = data['sysctl']
+                
+                for setting, value in sysctl['values'].items():
+                    if value:
+                        f.write(f"{setting} = {value}\n")
+                
+                if sysctl['deviations']:
+                    f.write("\nDeviations:\n")
+                    for deviation in sysctl['deviations']:
+                        f.write(f"  - {deviation['setting']}={deviation['value']} (expected {deviation['expected']})"
+                                f" - {deviation['reason']}\n")
+            
+            # CPU Isolation
+            if 'isolation' in data and data['isolation'].get('isolated_cpus'):
+                f.write("\n" + "="*80 + "\n")
+                f.write("CPU ISOLATION\n")
+                f.write("="*80 + "\n")
+                isolation = data['isolation']
+                
+                f.write(f"Isolated CPUs: {isolation['isolated']}\n")
+                f.write(f"Housekeeping CPUs: {isolation['housekeeping'] or 'None'}\n")
+                for source, cpus in isolation['sources'].items():
+                    if cpus:
+                        f.write(f"{source}: {cpus}\n")
+                f.write(f"Default IRQ Affinity: {isolation['default_irq_affinity'] or 'Unknown'}\n")
+                f.write(f"Workqueue CPU Mask: {isolation['workqueue_cpumask'] or 'Unknown'}\n")
+                f.write(f"irqbalance: {'running' if isolation['irqbalance']['running'] else 'not running'}\n")
+                
+                f.write(f"\nIsolated CPUs (sampled over {isolation['interval']:.1f}s):\n")
+                for entry in isolation['cpus']:
+                    threads = ', '.join(f"{task['comm']} {task['cpu_percent']:.0f}%" for task in entry['tasks']
+                                        if task['kind'] != 'per-cpu kthread')
+                    f.write(f"  CPU {entry['cpu']}: {entry['irq_rate']:.0f} IRQs/s, tick {entry['tick_rate']:.0f}/s, "
+                            f"{entry['ipi_rate']:.0f} IPIs/s, threads: {threads or 'idle'}\n")
+                
+                if isolation['issues']:
+                    f.write("\nIsolation Issues:\n")
+                    for issue in isolation['issues']:
+                        f.write(f"  - {issue}\n")
+            
+            # Cgroup Limits
+            if 'cgroup' in data and data['cgroup'].get('available'):
+                f.write("\n" + "="*80 + "\n")
+                f.write("CGROUP & CONTAINER LIMITS\n")
+                f.write("="*80 + "\n")
+                cgroup = data['cgroup']
+                effective = cgroup['effective']
+                group = cgroup['group']
+
+                f.write(f"Cgroup: {cgroup['path']}\n")
+                f.write(f"Container: {cgroup['container'] or 'None'}\n")
+                f.write(f"Effective CPUs: {effective['cpus']:.2f} of {cgroup['host']['cpus']}\n")
+                f.write(f"Memory Limit: {effective['memory_max'] or 'none'}\n")
+                f.write(f"Memory High: {effective['memory_high'] or 'none'}\n")
+                f.write(f"Memory Usage: {group['memory_current'] if group['memory_current'] is not None else 'N/A'}\n")
+                f.write(f"Pids Limit: {effective['pids_max'] or 'none'}\n")
+
+                for resource, pressure in group['pressure'].items():
+                    some = pressure.get('some', {})
+                    f.write(f"{resource.upper()} Pressure (some avg10/60/300): {some.get('avg10', 0):.2f}% / "
+                            f"{some.get('avg60', 0):.2f}% / {some.get('avg300', 0):.2f}%\n")
+
+                if cgroup['issues']:
+                    f.write("\nCgroup Issues:\n")
+                    for issue in cgroup['issues']:
+                        f.write(f"  - {issue}\n")
+
             # Footer
             f.write("\n" + "="*80 + "\n")
             f.write("End of Report\n")
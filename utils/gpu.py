@@ -5,16 +5,20 @@ Gathers detailed GPU and graphics information
 
 import subprocess
 import re
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 
 class GPUInfo:
     """Handles GPU information gathering"""
     
-    def __init__(self):
+    def __init__(self, inventory=None):
         self.lspci_available = self._check_command("lspci")
         self.nvidia_smi_available = self._check_command("nvidia-smi")
         self.glxinfo_available = self._check_command("glxinfo")
         self.vulkaninfo_available = self._check_command("vulkaninfo")
+        self.inventory = inventory
+        self._gpus_cache = None
+        self._gpus_generation = None
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available"""
@@ -32,6 +36,14 @@ class GPUInfo:
         except Exception:
             return ""
     
+    def _normalize_pci_address(self, address: str) -> str:
+        """Normalize lspci/nvidia-smi bus ids to the sysfs form, e.g. 0000:01:00.0"""
+        address = address.strip().lower()
+        if address.count(':') == 1:
+            return f"0000:{address}"
+        domain, rest = address.split(':', 1)
+        return f"{domain[-4:]}:{rest}"
+    
     def _get_pci_gpus(self) -> List[Dict]:
         """Get GPU information from lspci"""
         gpus = []
@@ -69,6 +81,7 @@ class GPUInfo:
                         
                         gpus.append({
                             'device': device_id,
+                            'pci_address': self._normalize_pci_address(device_id),
                             'vendor': vendor,
                             'model': model,
                             'driver': driver_info.get('driver', 'Unknown'),
@@ -157,7 +170,7 @@ class GPUInfo:
         try:
             output = self._run_command([
                 'nvidia-smi',
-                '--query-gpu=name,memory.total,driver_version',
+                '--query-gpu=name,memory.total,driver_version,vbios_version,pci.bus_id',
                 '--format=csv,noheader'
             ])
             
@@ -171,7 +184,9 @@ class GPUInfo:
                             'model': parts[0],
                             'vram': parts[1],
                             'driver': 'nvidia',
-                            'driver_version': parts[2]
+                            'driver_version': parts[2],
+                            'vbios': parts[3] if len(parts) >= 4 else 'Unknown',
+                            'pci_address': self._normalize_pci_address(parts[4]) if len(parts) >= 5 else None
                         })
         except Exception:
             pass
@@ -210,8 +225,8 @@ class GPUInfo:
         
         return 'Unknown'
     
-    def get_all_info(self) -> Dict:
-        """Get all GPU information"""
+    def _get_gpus(self) -> List[Dict]:
+        """Get the GPU list from nvidia-smi or lspci"""
         # Try NVIDIA first (provides more detailed info)
         nvidia_gpus = self._get_nvidia_info()
         
@@ -219,19 +234,44 @@ class GPUInfo:
         pci_gpus = self._get_pci_gpus()
         
         # Merge results (prefer NVIDIA detailed info)
-        gpus = nvidia_gpus if nvidia_gpus else pci_gpus
+        return nvidia_gpus if nvidia_gpus else pci_gpus
+    
+    def _get_cached_gpus(self) -> List[Dict]:
+        """Get the GPU list, re-scanning only after a PCI hot-plug event"""
+        if self.inventory is None or not self.inventory.is_active():
+            return self._get_gpus()
         
-        data = {
-            'gpus': gpus,
-            'opengl': self._get_opengl_info(),
-            'vulkan': self._get_vulkan_info()
-        }
+        generation = self.inventory.get_generation('pci')
+        if self._gpus_cache is None or generation != self._gpus_generation:
+            self._gpus_cache = self._get_gpus()
+            self._gpus_generation = generation
+        
+        return [dict(gpu) for gpu in self._gpus_cache]
+    
+    def stream_info(self) -> Iterator[Tuple[str, object]]:
+        """Yield the GPU list first, then each graphics API as its probe returns"""
+        yield 'gpus', self._get_cached_gpus()
+        
+        # glxinfo and vulkaninfo can each take seconds, so they run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            probes = {
+                executor.submit(self._get_opengl_info): 'opengl',
+                executor.submit(self._get_vulkan_info): 'vulkan'
+            }
+            for future in as_completed(probes):
+                yield probes[future], future.result()
+    
+    def get_all_info(self) -> Dict:
+        """Get all GPU information"""
+        data = {'gpus': [], 'opengl': 'Unknown', 'vulkan': 'Unknown'}
+        data.update(self.stream_info())
         
         return data
     
-    def get_summary(self) -> Dict:
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
         """Get summary GPU information"""
-        info = self.get_all_info()
+        if info is None:
+            info = self.get_all_info()
         
         gpu_count = len(info.get('gpus', []))
         gpu_names = [gpu.get('model', 'Unknown') for gpu in info.get('gpus', [])]
@@ -0,0 +1,332 @@
+"""
+Hot-plug Inventory Module
+Keeps block, PCI and USB device tables current from kernel uevents
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import socket
+import threading
+from typing import Callable, Dict, List, Optional
+
+# Kernel uevent multicast group on NETLINK_KOBJECT_UEVENT
+UEVENT_KERNEL_GROUP = 1
+
+# inotify constants from <sys/inotify.h>
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+SUBSYSTEMS = ['block', 'pci', 'usb']
+
+class DeviceInventory:
+    """Handles incremental device tables driven by hot-plug events"""
+
+    def __init__(self, poll_interval: float = 5.0):
+        self.poll_interval = poll_interval
+        self.tables = {subsystem: {} for subsystem in SUBSYSTEMS}
+        self.generation = {subsystem: 0 for subsystem in SUBSYSTEMS}
+        self.backend = None
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._thread = None
+        self._source = None
+        self._wake_read, self._wake_write = None, None
+
+    def _read_file(self, path: str, default: str = '') -> str:
+        """Read a single sysfs attribute"""
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except Exception:
+            return default
+
+    def _read_block_device(self, name: str) -> Optional[Dict]:
+        """Read a single block device entry from /sys/block"""
+        device_path = f'/sys/block/{name}'
+        if not os.path.isdir(device_path):
+            return None
+
+        size = self._read_file(os.path.join(device_path, 'size'), '0')
+        return {
+            'name': name,
+            'size_bytes': int(size) * 512 if size.isdigit() else 0,
+            'removable': self._read_file(os.path.join(device_path, 'removable')) == '1',
+            'rotational': self._read_file(os.path.join(device_path, 'queue/rotational')) == '1',
+            'model': self._read_file(os.path.join(device_path, 'device/model'), 'Unknown')
+        }
+
+    def _read_pci_device(self, slot: str) -> Optional[Dict]:
+        """Read a single PCI device entry from /sys/bus/pci/devices"""
+        device_path = f'/sys/bus/pci/devices/{slot}'
+        if not os.path.isdir(device_path):
+            return None
+
+        driver_link = os.path.join(device_path, 'driver')
+        driver = os.path.basename(os.readlink(driver_link)) if os.path.islink(driver_link) else None
+        return {
+            'slot': slot,
+            'class': self._read_file(os.path.join(device_path, 'class')),
+            'vendor': self._read_file(os.path.join(device_path, 'vendor')),
+            'device': self._read_file(os.path.join(device_path, 'device')),
+            'driver': driver
+        }
+
+    def _read_usb_device(self, name: str) -> Optional[Dict]:
+        """Read a single USB device entry from /sys/bus/usb/devices"""
+        device_path = f'/sys/bus/usb/devices/{name}'
+        if not os.path.exists(os.path.join(device_path, 'idVendor')):
+            return None
+
+        return {
+            'name': name,
+            'vendor': self._read_file(os.path.join(device_path, 'idVendor')),
+            'product': self._read_file(os.path.join(device_path, 'idProduct')),
+            'manufacturer': self._read_file(os.path.join(device_path, 'manufacturer'), 'Unknown'),
+            'product_name': self._read_file(os.path.join(device_path, 'product'), 'Unknown')
+        }
+
+    def _scan_subsystem(self, subsystem: str) -> Dict[str, Dict]:
+        """Fully scan one subsystem"""
+        readers = {
+            'block': ('/sys/block', self._read_block_device),
+            'pci': ('/sys/bus/pci/devices', self._read_pci_device),
+            'usb': ('/sys/bus/usb/devices', self._read_usb_device)
+        }
+        base_path, reader = readers[subsystem]
+
+        table = {}
+        try:
+            for name in os.listdir(base_path):
+                entry = reader(name)
+                if entry:
+                    table[name] = entry
+        except Exception:
+            pass
+
+        return table
+
+    def _notify(self, subsystem: str, action: str, name: str):
+        """Bump the subsystem generation and call listeners"""
+        with self._lock:
+            self.generation[subsystem] += 1
+            listeners = list(self._listeners)
+
+        for callback in listeners:
+            try:
+                callback(subsystem, action, name)
+            except Exception:
+                pass
+
+    def _rescan(self):
+        """Rescan every subsystem and notify about changed tables"""
+        for subsystem in SUBSYSTEMS:
+            table = self._scan_subsystem(subsystem)
+            with self._lock:
+                changed = table != self.tables[subsystem]
+                self.tables[subsystem] = table
+            if changed:
+                self._notify(subsystem, 'change', '*')
+
+    def parse_uevent(self, message: bytes) -> Dict[str, str]:
+        """Parse a kernel uevent message (ACTION@DEVPATH\\0KEY=VALUE\\0...)"""
+        event = {}
+        fields = message.split(b'\0')
+
+        # Kernel messages start with a summary header, udev ones do not
+        if fields and b'@' in fields[0] and b'=' not in fields[0]:
+            fields = fields[1:]
+
+        for field in fields:
+            if b'=' in field:
+                key, value = field.split(b'=', 1)
+                event[key.decode(errors='replace')] = value.decode(errors='replace')
+
+        return event
+
+    def handle_uevent(self, event: Dict[str, str]):
+        """Apply a single uevent to the device tables"""
+        subsystem = event.get('SUBSYSTEM')
+        action = event.get('ACTION')
+        devpath = event.get('DEVPATH', '')
+        name = os.path.basename(devpath)
+
+        if action not in ('add', 'remove', 'change', 'bind', 'unbind'):
+            return
+
+        if subsystem == 'block':
+            # Partitions are not tracked, only whole disks
+            if event.get('DEVTYPE') != 'disk':
+                return
+            name = event.get('DEVNAME', name)
+            reader = self._read_block_device
+        elif subsystem == 'pci':
+            name = event.get('PCI_SLOT_NAME', name)
+            reader = self._read_pci_device
+        elif subsystem == 'usb':
+            if event.get('DEVTYPE') != 'usb_device':
+                return
+            reader = self._read_usb_device
+        else:
+            return
+
+        entry = None if action == 'remove' else reader(name)
+        with self._lock:
+            if entry:
+                self.tables[subsystem][name] = entry
+            else:
+                self.tables[subsystem].pop(name, None)
+
+        self._notify(subsystem, action, name)
+
+    def _open_netlink(self) -> Optional[socket.socket]:
+        """Subscribe to kernel uevents"""
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, socket.NETLINK_KOBJECT_UEVENT)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
+            sock.bind((0, UEVENT_KERNEL_GROUP))
+            return sock
+        except (AttributeError, OSError):
+            return None
+
+    def _open_inotify(self) -> Optional[int]:
+        """Watch /dev for device nodes appearing or disappearing"""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return None
+
+            # sysfs does not emit inotify events, devtmpfs does
+            watched = 0
+            for path in ['/dev', '/dev/bus/usb']:
+                if os.path.isdir(path):
+                    if libc.inotify_add_watch(fd, path.encode(), IN_CREATE | IN_DELETE) >= 0:
+                        watched += 1
+
+            if not watched:
+                os.close(fd)
+                return None
+            return fd
+        except Exception:
+            return None
+
+    def _watch_netlink(self, sock: socket.socket):
+        """Event loop for the netlink backend"""
+        while True:
+            readable, _, _ = select.select([sock, self._wake_read], [], [])
+            if self._wake_read in readable:
+                return
+
+            try:
+                message = sock.recv(65536)
+            except OSError as e:
+                # A uevent storm overflowed the socket buffer, the lost events are recovered by rescanning
+                if e.errno == errno.ENOBUFS:
+                    self._rescan()
+                continue
+            self.handle_uevent(self.parse_uevent(message))
+
+    def _watch_inotify(self, fd: int):
+        """Event loop for the inotify backend"""
+        while True:
+            readable, _, _ = select.select([fd, self._wake_read], [], [])
+            if self._wake_read in readable:
+                return
+
+            try:
+                # Drain the queue, the events only tell us to rescan
+                while os.read(fd, 65536):
+                    pass
+            except OSError:
+                pass
+            self._rescan()
+
+    def _watch_poll(self):
+        """Event loop for the polling backend"""
+        while True:
+            readable, _, _ = select.select([self._wake_read], [], [], self.poll_interval)
+            if readable:
+                return
+            self._rescan()
+
+    def start(self) -> str:
+        """Scan all devices and start following hot-plug events"""
+        if self._thread:
+            return self.backend
+
+        for subsystem in SUBSYSTEMS:
+            table = self._scan_subsystem(subsystem)
+            with self._lock:
+                self.tables[subsystem] = table
+
+        self._wake_read, self._wake_write = os.pipe()
+
+        sock = self._open_netlink()
+        if sock:
+            self.backend, self._source = 'netlink', sock
+            target, args = self._watch_netlink, (sock,)
+        else:
+            fd = self._open_inotify()
+            if fd is not None:
+                self.backend, self._source = 'inotify', fd
+                target, args = self._watch_inotify, (fd,)
+            else:
+                self.backend = 'poll'
+                target, args = self._watch_poll, ()
+
+        self._thread = threading.Thread(target=target, args=args, name='lxz-hotplug', daemon=True)
+        self._thread.start()
+        return self.backend
+
+    def stop(self):
+        """Stop following hot-plug events"""
+        if not self._thread:
+            return
+
+        os.write(self._wake_write, b'x')
+        self._thread.join(timeout=2)
+        self._thread = None
+
+        if isinstance(self._source, socket.socket):
+            self._source.close()
+        elif isinstance(self._source, int):
+            os.close(self._source)
+        self._source = None
+
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+        self._wake_read, self._wake_write = None, None
+
+    def is_active(self) -> bool:
+        """Check whether the tables are being kept current"""
+        return self._thread is not None
+
+    def add_listener(self, callback: Callable[[str, str, str], None]):
+        """Register a callback(subsystem, action, name) for device changes"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def get_generation(self, subsystem: str) -> int:
+        """Get the change counter of a subsystem"""
+        with self._lock:
+            return self.generation[subsystem]
+
+    def get_devices(self, subsystem: str) -> List[Dict]:
+        """Get a snapshot of a device table"""
+        with self._lock:
+            return [dict(entry) for _, entry in sorted(self.tables[subsystem].items())]
+
+    def get_summary(self) -> Dict:
+        """Get summary inventory information"""
+        with self._lock:
+            return {
+                'Backend': self.backend or 'Inactive',
+                'Block Devices': str(len(self.tables['block'])),
+                'PCI Devices': str(len(self.tables['pci'])),
+                'USB Devices': str(len(self.tables['usb']))
+            }
@@ -0,0 +1,200 @@
+"""
+Hwmon Module
+Reads every hwmon channel natively from sysfs, or from lm-sensors JSON, with labels, limits and alarms
+"""
+
+import os
+import re
+import json
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attribute, read_attributes
+
+# Channel type -> (unit, divisor from the sysfs integer)
+CHANNEL_TYPES = {
+    'temp': ('°C', 1000),
+    'fan': ('RPM', 1),
+    'in': ('V', 1000),
+    'curr': ('A', 1000),
+    'power': ('W', 1000000),
+    'energy': ('J', 1000000)
+}
+
+# Value attributes in order of preference, some drivers (amdgpu) only report power*_average
+VALUE_ATTRIBUTES = ['input', 'average']
+
+LIMIT_ATTRIBUTES = ['min', 'max', 'lcrit', 'crit', 'emergency', 'cap']
+
+ALARM_ATTRIBUTES = ['alarm', 'min_alarm', 'max_alarm', 'lcrit_alarm', 'crit_alarm', 'emergency_alarm',
+                    'cap_alarm', 'fault']
+
+ATTRIBUTE_PATTERN = re.compile(r'^(temp|fan|in|curr|power|energy)(\d+)_([a-z_]+)$')
+
+def _scale(value: str, divisor: int) -> Optional[float]:
+    """Convert a sysfs integer into its unit"""
+    try:
+        return int(value) / divisor
+    except ValueError:
+        return None
+
+def format_value(channel: Dict) -> str:
+    """Format a channel reading with its unit"""
+    value = channel['value']
+    if value is None:
+        return 'N/A'
+    if channel['type'] == 'temp':
+        return f"{value:.1f}°C"
+    if channel['type'] == 'fan':
+        return f"{value:.0f} RPM"
+    if channel['type'] == 'in':
+        return f"{value:.3f} V"
+    return f"{value:.2f} {channel['unit']}"
+
+class HwmonScanner:
+    """Handles hwmon channel discovery, done once, and cheap reads of the values"""
+
+    def __init__(self):
+        self.hwmon_path = host_path('/sys/class/hwmon')
+        self._index = None
+
+    def _attribute_directory(self, hwmon_dir: str) -> str:
+        """Get the directory holding the attributes, older drivers keep them under device/"""
+        if os.path.exists(os.path.join(hwmon_dir, 'name')):
+            return hwmon_dir
+        return os.path.join(hwmon_dir, 'device')
+
+    def _build_index(self) -> List[Dict]:
+        """Find every channel with its label and limits"""
+        devices = []
+        try:
+            hwmons = sorted(os.listdir(self.hwmon_path), key=lambda name: int(name[5:]) if name[5:].isdigit() else 0)
+        except OSError:
+            return []
+
+        for hwmon in hwmons:
+            directory = self._attribute_directory(os.path.join(self.hwmon_path, hwmon))
+            try:
+                entries = os.listdir(directory)
+            except OSError:
+                continue
+
+            channels = {}
+            for entry in entries:
+                match = ATTRIBUTE_PATTERN.match(entry)
+                if match:
+                    kind, number, attribute = match.groups()
+                    channels.setdefault((kind, int(number)), set()).add(attribute)
+
+            devices.append((hwmon, directory, read_attribute(os.path.join(directory, 'name'), hwmon), channels))
+
+        # Two sockets give two k10temp devices, the hwmon name keeps their channels apart
+        names = [name for _, _, name, _ in devices]
+        index = []
+        for hwmon, directory, name, channels in devices:
+            device = name if names.count(name) == 1 else f"{name} {hwmon}"
+
+            for (kind, number), attributes in sorted(channels.items(), key=lambda item: (
+                    list(CHANNEL_TYPES).index(item[0][0]), item[0][1])):
+                value_attribute = next((a for a in VALUE_ATTRIBUTES if a in attributes), None)
+                if value_attribute is None:
+                    continue
+
+                prefix = f"{kind}{number}"
+                unit, divisor = CHANNEL_TYPES[kind]
+                static = read_attributes(directory, [f"{prefix}_label"] + [
+                    f"{prefix}_{limit}" for limit in LIMIT_ATTRIBUTES if limit in attributes])
+                label = static.pop(f"{prefix}_label") or prefix
+
+                limits = {}
+                for key, value in static.items():
+                    value = _scale(value, divisor) if value else None
+                    # Unset limits read as 0 on many drivers
+                    if value:
+                        limits[key[len(prefix) + 1:]] = value
+
+                index.append({
+                    'name': f"{device} - {label}",
+                    'device': device,
+                    'type': kind,
+                    'channel': prefix,
+                    'label': label,
+                    'unit': unit,
+                    'limits': limits,
+                    '_directory': directory,
+                    '_divisor': divisor,
+                    '_value': f"{prefix}_{value_attribute}",
+                    '_alarms': [f"{prefix}_{alarm}" for alarm in ALARM_ATTRIBUTES if alarm in attributes]
+                })
+
+        return index
+
+    def index(self) -> List[Dict]:
+        """Get the channel index, built on first use"""
+        if self._index is None:
+            self._index = self._build_index()
+        return self._index
+
+    def read(self) -> List[Dict]:
+        """Read the current value and alarms of every indexed channel"""
+        # One directory fd per device instead of a path walk per attribute
+        by_directory = {}
+        for channel in self.index():
+            by_directory.setdefault(channel['_directory'], []).append(channel)
+
+        channels = []
+        for directory, indexed in by_directory.items():
+            values = read_attributes(directory, [name for channel in indexed
+                                                 for name in [channel['_value']] + channel['_alarms']])
+            for channel in indexed:
+                raw = values[channel['_value']]
+                channels.append({
+                    **{key: value for key, value in channel.items() if not key.startswith('_')},
+                    'value': _scale(raw, channel['_divisor']) if raw else None,
+                    'alarms': [name[len(channel['channel']) + 1:] for name in channel['_alarms']
+                               if values[name] not in ('', '0')]
+                })
+
+        return channels
+
+def parse_sensors_json(text: str) -> List[Dict]:
+    """Get channels from `sensors -j` output, whose values are already scaled"""
+    try:
+        chips = json.loads(text)
+    except ValueError:
+        return []
+
+    channels = []
+    for chip, features in chips.items():
+        if not isinstance(features, dict):
+            continue
+        for label, subfeatures in features.items():
+            if not isinstance(subfeatures, dict):
+                # "Adapter": "ISA adapter"
+                continue
+
+            attributes = {}
+            for key, value in subfeatures.items():
+                match = ATTRIBUTE_PATTERN.match(key)
+                if match:
+                    kind, number, attribute = match.groups()
+                    attributes[attribute] = value
+            if not attributes:
+                continue
+
+            value = next((attributes[a] for a in VALUE_ATTRIBUTES if a in attributes), None)
+            if value is None:
+                continue
+
+            channels.append({
+                'name': f"{chip} - {label}",
+                'device': chip,
+                'type': kind,
+                'channel': f"{kind}{number}",
+                'label': label,
+                'unit': CHANNEL_TYPES[kind][0],
+                'limits': {key: attributes[key] for key in LIMIT_ATTRIBUTES if attributes.get(key)},
+                'value': float(value),
+                'alarms': [key for key in ALARM_ATTRIBUTES if attributes.get(key)]
+            })
+
+    return channels
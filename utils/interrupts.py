@@ -0,0 +1,241 @@
+"""
+Interrupts Module
+Samples /proc/interrupts and /proc/softirqs deltas and maps IRQs to devices, CPUs and NUMA nodes
+"""
+
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .sysfs import host_path, read_attributes, parse_cpulist, format_cpulist, get_numa_nodes
+
+# Softirqs worth showing, the rest are rarely a bottleneck
+SOFTIRQ_TYPES = ['NET_RX', 'NET_TX', 'BLOCK', 'TIMER', 'SCHED', 'RCU', 'TASKLET', 'HRTIMER']
+
+# Interrupts per second below which imbalance is not worth reporting
+MIN_RATE = 100.0
+
+class InterruptInfo:
+    """Handles interrupt and softirq distribution analysis"""
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._previous = None
+
+    def _parse_table(self, path: str) -> Tuple[List[int], Dict[str, Tuple[List[int], str]]]:
+        """Parse a per-CPU counter table into CPU ids and {label: (counts, description)}"""
+        rows = {}
+        try:
+            with open(host_path(path)) as f:
+                header = f.readline().split()
+                cpus = [int(column[3:]) for column in header if column.startswith('CPU')]
+                columns = len(cpus)
+
+                for line in f:
+                    label, _, rest = line.partition(':')
+                    if not rest:
+                        continue
+                    # At most one split per CPU column, the description stays in one piece
+                    fields = rest.split(None, columns)
+                    try:
+                        counts = list(map(int, fields[:columns]))
+                    except ValueError:
+                        counts = []
+                        for field in fields[:columns]:
+                            if not field.isdigit():
+                                break
+                            counts.append(int(field))
+                    description = ' '.join(fields[len(counts):])
+                    rows[label.strip()] = (counts, description)
+        except (OSError, ValueError):
+            return [], {}
+
+        return cpus, rows
+
+    def _snapshot(self) -> Dict:
+        """Read both counter tables once"""
+        cpus, interrupts = self._parse_table('/proc/interrupts')
+        _, softirqs = self._parse_table('/proc/softirqs')
+        return {'time': time.monotonic(), 'cpus': cpus, 'interrupts': interrupts, 'softirqs': softirqs}
+
+    def _split_description(self, description: str) -> Tuple[str, str]:
+        """Split an interrupt description into the chip part and the handler names"""
+        tokens = description.split()
+        for index in range(len(tokens) - 1, -1, -1):
+            if tokens[index].endswith(('-edge', '-level', '-fasteoi')) or tokens[index] in ('edge', 'level'):
+                return ' '.join(tokens[:index + 1]), ' '.join(tokens[index + 1:])
+        if len(tokens) > 1:
+            return ' '.join(tokens[:-1]), tokens[-1]
+        return '', tokens[0] if tokens else ''
+
+    def _get_device(self, actions: str) -> str:
+        """Group per-queue handlers such as nvme0q3 or eth0-TxRx-3 by device"""
+        name = actions.split(',')[0].strip()
+        name = name.split('@')[0]
+        match = re.match(r'^(nvme\d+)q\d+$', name)
+        if match:
+            return match.group(1)
+        return re.sub(r'[-_:](?:txrx|rx|tx|fp|comp|queue|q|input|output|config)?[-_.]?\d*$', '', name,
+                      flags=re.IGNORECASE) or name
+
+    def _delta(self, before: Dict, after: Dict, table: str, elapsed: float) -> Dict[str, Tuple[List[float], str]]:
+        """Get per-CPU rates for every row of a table"""
+        rates = {}
+        previous = before[table]
+        for label, (counts, description) in after[table].items():
+            old = previous.get(label)
+            if not old or len(old[0]) != len(counts):
+                continue
+            rates[label] = ([max(0, new - prev) / elapsed for new, prev in zip(counts, old[0])], description)
+        return rates
+
+    def _node_of(self, cpu: int, numa_nodes: Dict[int, List[int]]) -> Optional[int]:
+        """Get the NUMA node of a CPU"""
+        for node, cpus in numa_nodes.items():
+            if cpu in cpus:
+                return node
+        return None
+
+    def _check(self, devices: List[Dict], softirqs: Dict, cpus: List[int],
+               numa_nodes: Dict[int, List[int]]) -> List[str]:
+        """Flag wrong-NUMA IRQs and interrupts concentrated on one CPU"""
+        issues = []
+
+        # Per-CPU queues on every node are normal, so placement is judged per device
+        if len(numa_nodes) > 1:
+            for device in devices:
+                node = device['node']
+                if node is None or node not in numa_nodes:
+                    continue
+                local = set(numa_nodes[node])
+                if device['affinity'] and not set(device['affinity']) & local:
+                    issues.append(f"{device['device']}: device is on node {node} but its "
+                                  f"{device['irqs']} IRQ(s) are pinned to CPUs {format_cpulist(device['affinity'])} "
+                                  f"on another node")
+                elif device['irqs'] == 1 and device['rate'] >= MIN_RATE and device['remote_share'] > 0.5:
+                    issues.append(f"{device['device']}: {device['remote_share'] * 100:.0f}% of interrupts "
+                                  f"handled off node {node}")
+
+        for device in devices:
+            if device['irqs'] < 2 or device['rate'] < MIN_RATE:
+                continue
+            top = max(range(len(device['per_cpu'])), key=lambda i: device['per_cpu'][i])
+            share = device['per_cpu'][top] / device['rate']
+            if share > 0.5:
+                issues.append(f"{device['device']}: {share * 100:.0f}% of {device['irqs']} queue interrupts "
+                              f"land on CPU {cpus[top]} (check irqbalance / smp_affinity)")
+
+        net_rx = softirqs.get('NET_RX')
+        if net_rx and net_rx['rate'] >= MIN_RATE * 10 and len(cpus) > 1:
+            top = max(range(len(net_rx['per_cpu'])), key=lambda i: net_rx['per_cpu'][i])
+            share = net_rx['per_cpu'][top] / net_rx['rate']
+            if share > 0.5:
+                issues.append(f"NET_RX softirq: {share * 100:.0f}% on CPU {cpus[top]} "
+                              f"(consider RSS/RPS to spread packet processing)")
+
+        return issues
+
+    def sample(self, interval: Optional[float] = None) -> Dict:
+        """Sample interrupt rates, reusing the previous snapshot when it is recent enough"""
+        interval = self.interval if interval is None else interval
+        before = self._previous
+        age = time.monotonic() - before['time'] if before else None
+        if age is None or not interval / 4 <= age <= interval * 10:
+            before = self._snapshot()
+            time.sleep(interval)
+        after = self._snapshot()
+        self._previous = after
+
+        elapsed = max(after['time'] - before['time'], 1e-6)
+        cpus = after['cpus']
+        numa_nodes = get_numa_nodes(host_path('/sys/devices/system/node'))
+        cpu_nodes = [self._node_of(cpu, numa_nodes) for cpu in cpus]
+
+        irqs = []
+        device_rates = {}
+        local_interrupts = {}
+        cpu_totals = [0.0] * len(cpus)
+        for label, (rates, description) in self._delta(before, after, 'interrupts', elapsed).items():
+            if not label.isdigit():
+                # Per-CPU sources such as LOC (timer tick), RES and CAL (IPIs), ERR/MIS have a single count
+                if len(rates) == len(cpus):
+                    local_interrupts[label] = {'rate': sum(rates), 'per_cpu': rates, 'description': description}
+                continue
+            for index, rate in enumerate(rates):
+                cpu_totals[index] += rate
+
+            attrs = read_attributes(host_path(f'/proc/irq/{label}'),
+                                    ['smp_affinity_list', 'effective_affinity_list', 'node'])
+            node = int(attrs['node']) if attrs['node'].lstrip('-').isdigit() else None
+            node = node if node is not None and node >= 0 else None
+            chip, actions = self._split_description(description)
+            total = sum(rates)
+            remote = sum(rate for rate, cpu_node in zip(rates, cpu_nodes)
+                         if node is not None and cpu_node is not None and cpu_node != node)
+
+            irq = {
+                'irq': label,
+                'actions': actions or 'unknown',
+                'device': self._get_device(actions) if actions else 'unknown',
+                'chip': chip,
+                'rate': total,
+                'top_cpus': sorted(((cpus[i], rate) for i, rate in enumerate(rates) if rate > 0),
+                                   key=lambda item: item[1], reverse=True)[:4],
+                'affinity': attrs['smp_affinity_list'] or 'Unknown',
+                'affinity_cpus': parse_cpulist(attrs['smp_affinity_list']) if attrs['smp_affinity_list'] else [],
+                'effective_cpus': (parse_cpulist(attrs['effective_affinity_list'])
+                                   if attrs['effective_affinity_list'] else []),
+                'node': node,
+                'remote_share': remote / total if total > 0 else 0.0
+            }
+            irqs.append(irq)
+
+            device = device_rates.setdefault(irq['device'], {
+                'device': irq['device'], 'irqs': 0, 'rate': 0.0, 'node': node,
+                'per_cpu': [0.0] * len(cpus), 'affinity': set()
+            })
+            device['irqs'] += 1
+            device['rate'] += total
+            device['affinity'].update(irq['effective_cpus'] or irq['affinity_cpus'])
+            for index, rate in enumerate(rates):
+                device['per_cpu'][index] += rate
+
+        devices = sorted(device_rates.values(), key=lambda device: device['rate'], reverse=True)
+        for device in devices:
+            device['affinity'] = sorted(device['affinity'])
+            remote = sum(rate for rate, cpu_node in zip(device['per_cpu'], cpu_nodes)
+                         if device['node'] is not None and cpu_node is not None and cpu_node != device['node'])
+            device['remote_share'] = remote / device['rate'] if device['rate'] > 0 else 0.0
+
+        softirqs = {}
+        for label, (rates, _) in self._delta(before, after, 'softirqs', elapsed).items():
+            if label in SOFTIRQ_TYPES:
+                softirqs[label] = {'rate': sum(rates), 'per_cpu': rates}
+
+        irqs.sort(key=lambda irq: irq['rate'], reverse=True)
+        return {
+            'interval': elapsed,
+            'cpus': cpus,
+            'cpu_nodes': cpu_nodes,
+            'numa_nodes': len(numa_nodes),
+            'cpu_totals': cpu_totals,
+            'total_rate': sum(cpu_totals),
+            'irqs': irqs,
+            'devices': devices,
+            'softirqs': softirqs,
+            'local_interrupts': local_interrupts,
+            'issues': self._check(devices, softirqs, cpus, numa_nodes)
+        }
+
+    def get_all_info(self) -> Dict:
+        """Get all interrupt distribution information"""
+        return self.sample()
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary interrupt information"""
+        if info is None:
+            info = self.get_all_info()
+        return {
+            'IRQ Rate': f"{info['total_rate']:.0f}/s on {len(info['cpus'])} CPUs",
+            'Interrupt Issues': str(len(info['issues']))
+        }
@@ -0,0 +1,244 @@
+"""
+Inventory Module
+Headless one-shot inventory records for DaemonSets and cron jobs, without Rich or the UI
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import hashlib
+import argparse
+import resource
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .registry import create_default_registry, VOLATILITY_LIVE
+
+# Bumped when the record layout changes
+SCHEMA_VERSION = 1
+
+# Fields that change from run to run on an unchanged host, left out of the content hash.
+# A '*' step walks every element of a list.
+VOLATILE_FIELDS = {
+    'cpu': ['current_freq'],
+    'memory': ['available', 'used', 'free', 'percent', 'swap_used', 'swap_free', 'swap_percent'],
+    'storage': ['partitions.*.used', 'partitions.*.free', 'partitions.*.percent', 'partitions.*.inodes',
+                'partitions.*.status', 'partitions.*.issues'],
+    'cgroup': ['group', 'issues'],
+    'cpufreq': ['policies.*.cur_freq'],
+    'isolation': ['interval', 'cpus.*.irq_rate', 'cpus.*.irqs', 'cpus.*.tick_rate', 'cpus.*.ipis', 'cpus.*.ipi_rate',
+                  'cpus.*.tasks', 'cpus.*.contamination', 'contaminated', 'issues', 'irqbalance'],
+    'pcie': ['links.*.current_link', 'links.*.speed_downgraded', 'links.*.width_downgraded',
+             'links.*.downgraded', 'links.*.note', 'downgraded']
+}
+
+# Sections that are measurements only, recorded but never hashed
+UNHASHED_SECTIONS = ['sensors', 'interrupts']
+
+# Seconds volatile collectors sample for, the interactive views use a full second
+DEFAULT_SAMPLE = 0.2
+
+DEFAULT_MAX_RUNTIME = 10.0
+DEFAULT_MAX_RSS_MB = 64.0
+
+def _drop_path(value, steps: List[str]):
+    """Remove one dotted field path from nested dicts and lists in place"""
+    if not steps:
+        return
+    step, rest = steps[0], steps[1:]
+    if step == '*':
+        for item in value if isinstance(value, list) else []:
+            _drop_path(item, rest)
+    elif isinstance(value, dict) and step in value:
+        if rest:
+            _drop_path(value[step], rest)
+        else:
+            del value[step]
+
+def canonical_json(value) -> str:
+    """Serialize with sorted keys and no whitespace so equal data gives equal text"""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
+def content_hash(sections: Dict[str, Dict]) -> str:
+    """Hash the stable part of the collected sections"""
+    stable = {}
+    for name, value in sections.items():
+        if name in UNHASHED_SECTIONS:
+            continue
+        # Round-trip copy, so dropping fields never touches the record itself
+        value = json.loads(canonical_json(value))
+        for path in VOLATILE_FIELDS.get(name, []):
+            _drop_path(value, path.split('.'))
+        stable[name] = value
+    return 'sha256:' + hashlib.sha256(canonical_json(stable).encode()).hexdigest()
+
+def get_max_rss_mb() -> float:
+    """Get the peak resident set size of this process"""
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+class BatchInventory:
+    """Handles one bounded collection pass over the registry"""
+
+    def __init__(self, sections: Optional[List[str]] = None, sample: float = DEFAULT_SAMPLE,
+                 max_runtime: float = DEFAULT_MAX_RUNTIME, max_rss_mb: float = DEFAULT_MAX_RSS_MB,
+                 cache_path: Optional[str] = None, registry=None):
+        # Static and per-boot results are reused from the registry disk cache until reboot
+        self.registry = registry or create_default_registry(cache_path=cache_path)
+        self.sections = [name for name in (sections or self.registry.names()) if name in self.registry.collectors]
+        self.sample = sample
+        self.max_runtime = max_runtime
+        self.max_rss_mb = max_rss_mb
+
+        if 'interrupts' in self.registry.collectors:
+            self.registry.get('interrupts').source.interval = sample
+
+    def _collect_section(self, name: str, timeout: float):
+        """Collect one section in a daemon thread so a hung collector cannot blow the budget"""
+        result = {}
+
+        def worker():
+            try:
+                result['value'] = self.registry.get_data(name)
+            except Exception as e:
+                result['error'] = f"{type(e).__name__}: {e}"
+
+        thread = threading.Thread(target=worker, name=f"inventory-{name}", daemon=True)
+        thread.start()
+        thread.join(max(timeout, 0.0))
+        if thread.is_alive():
+            return None, f"timed out after {timeout:.1f}s"
+        return result.get('value'), result.get('error')
+
+    def collect(self, previous_hash: Optional[str] = None) -> Dict:
+        """Collect every section once and build the record"""
+        start = time.monotonic()
+        sections = {}
+        durations = {}
+        errors = {}
+
+        for name in self.sections:
+            remaining = self.max_runtime - (time.monotonic() - start)
+            if remaining <= 0:
+                errors[name] = 'skipped, runtime budget spent'
+                continue
+
+            section_start = time.monotonic()
+            value, error = self._collect_section(name, remaining)
+            durations[name] = round(time.monotonic() - section_start, 4)
+            if error:
+                errors[name] = error
+            else:
+                sections[name] = value
+
+        digest = content_hash(sections)
+        runtime = time.monotonic() - start
+        rss = get_max_rss_mb()
+        exceeded = []
+        if runtime > self.max_runtime or any(error.startswith(('skipped', 'timed out')) for error in errors.values()):
+            exceeded.append('runtime')
+        if rss > self.max_rss_mb:
+            exceeded.append('rss')
+
+        record = {
+            'schema': SCHEMA_VERSION,
+            'generated_at': datetime.now().isoformat(),
+            'generator': 'LX-Z v1.0',
+            'hostname': socket.gethostname(),
+            'boot_id': self.registry.boot_id,
+            'content_hash': digest,
+            'changed': digest != previous_hash,
+            'live_sections': [name for name in sections
+                              if self.registry.get(name).volatility == VOLATILITY_LIVE],
+            'durations': durations,
+            'errors': errors,
+            'runtime': round(runtime, 4),
+            'max_rss_mb': round(rss, 1),
+            'budget': {
+                'max_runtime': self.max_runtime,
+                'max_rss_mb': self.max_rss_mb,
+                'exceeded': exceeded
+            }
+        }
+        # Unchanged hosts send only the hash and the budget check
+        if record['changed']:
+            record['system_info'] = sections
+
+        return record
+
+def _read_state(path: Optional[str]) -> Optional[str]:
+    """Get the content hash of the last record written"""
+    if not path:
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f).get('content_hash')
+    except Exception:
+        return None
+
+def _write_state(path: str, record: Dict):
+    """Remember the content hash for the next run"""
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'content_hash': record['content_hash'], 'generated_at': record['generated_at']}, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Add the inventory options to a parser"""
+    parser.add_argument('--sections', help='Comma-separated sections to collect (default: all)')
+    parser.add_argument('--sample', type=float, default=DEFAULT_SAMPLE,
+                        help=f'Seconds volatile collectors sample for (default: {DEFAULT_SAMPLE})')
+    parser.add_argument('--max-runtime', type=float, default=DEFAULT_MAX_RUNTIME,
+                        help=f'Runtime budget in seconds, later sections are skipped (default: {DEFAULT_MAX_RUNTIME:.0f})')
+    parser.add_argument('--max-rss', type=float, default=DEFAULT_MAX_RSS_MB,
+                        help=f'Peak RSS budget in MB (default: {DEFAULT_MAX_RSS_MB:.0f})')
+    parser.add_argument('--cache', default=os.path.expanduser("~/.cache/lxz/collectors.json"),
+                        help='Collector cache reused for static sections until reboot')
+    parser.add_argument('--no-cache', action='store_true', help='Collect static sections again')
+    parser.add_argument('--state', metavar='FILE',
+                        help='Remember the content hash here and omit system_info when it is unchanged')
+    parser.add_argument('--output', metavar='FILE', help='Write the record to a file instead of stdout')
+
+def run_inventory(args) -> int:
+    """Collect and emit one record, returning 1 when the budget was exceeded"""
+    inventory = BatchInventory(
+        sections=args.sections.split(',') if args.sections else None,
+        sample=args.sample,
+        max_runtime=args.max_runtime,
+        max_rss_mb=args.max_rss,
+        cache_path=None if args.no_cache else args.cache
+    )
+    record = inventory.collect(_read_state(args.state))
+    line = canonical_json(record) + "\n"
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(line)
+    else:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+    if args.state:
+        _write_state(args.state, record)
+
+    if record['budget']['exceeded']:
+        sys.stderr.write(f"lxz inventory: budget exceeded ({', '.join(record['budget']['exceeded'])}): "
+                         f"{record['runtime']:.2f}s, {record['max_rss_mb']:.1f} MB\n")
+        return 1
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point used by lxz before Rich is imported"""
+    parser = argparse.ArgumentParser(prog='lxz inventory',
+                                     description='Print one compact inventory record without the UI')
+    add_arguments(parser)
+    return run_inventory(parser.parse_args(argv))
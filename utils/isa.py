@@ -0,0 +1,170 @@
+"""
+ISA Module
+Encodes CPU flags as a fixed-index bitset and classifies x86-64 levels and ARM feature tiers
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+# Bit positions of known flags. Append only: reordering would change every stored bitset.
+FLAG_INDEX = (
+    # x86 baseline and x86-64-v2
+    'fpu', 'vme', 'de', 'pse', 'tsc', 'msr', 'pae', 'mce', 'cx8', 'apic', 'sep', 'mtrr', 'pge',
+    'mca', 'cmov', 'pat', 'pse36', 'clflush', 'mmx', 'fxsr', 'sse', 'sse2', 'ss', 'ht', 'syscall',
+    'nx', 'pdpe1gb', 'rdtscp', 'lm', 'constant_tsc', 'nonstop_tsc', 'pni', 'pclmulqdq', 'ssse3',
+    'cx16', 'sse4_1', 'sse4_2', 'x2apic', 'movbe', 'popcnt', 'aes', 'xsave', 'lahf_lm',
+    # x86-64-v3
+    'avx', 'f16c', 'fma', 'rdrand', 'abm', 'bmi1', 'avx2', 'bmi2', 'erms', 'invpcid', 'rdseed',
+    'adx', 'smap', 'smep', 'clflushopt', 'clwb', 'sha_ni', 'xsaveopt', 'xsavec', 'xsaves',
+    'fsgsbase', 'pcid', 'hypervisor',
+    # AVX-512 and AVX extensions
+    'avx512f', 'avx512dq', 'avx512cd', 'avx512bw', 'avx512vl', 'avx512ifma', 'avx512vbmi',
+    'avx512_vbmi2', 'avx512_vnni', 'avx512_bitalg', 'avx512_vpopcntdq', 'avx512_bf16',
+    'avx512_fp16', 'avx512_vp2intersect', 'avx512pf', 'avx512er', 'avx512_4vnniw',
+    'avx512_4fmaps', 'avx_vnni', 'avx_vnni_int8', 'avx_ifma', 'avx_ne_convert',
+    # Crypto and bit manipulation
+    'gfni', 'vaes', 'vpclmulqdq', 'rdpid', 'sha512', 'sm3', 'sm4',
+    # AMX
+    'amx_tile', 'amx_int8', 'amx_bf16', 'amx_fp16', 'amx_complex',
+    # Misc x86
+    'movdiri', 'movdir64b', 'serialize', 'tsxldtrk', 'waitpkg', 'cldemote', 'fsrm', 'md_clear',
+    'ibt', 'ibrs', 'ibpb', 'stibp', 'ibrs_enhanced', 'ssbd', 'arch_capabilities', 'flush_l1d',
+    'hle', 'rtm', 'mpx', 'pku', 'ospke', 'umip', 'wbnoinvd', 'arat', 'tsc_deadline_timer',
+    'tsc_adjust', 'cpuid', 'rep_good', 'nopl', 'xtopology', 'aperfmperf', 'est', 'tm2', 'vmx',
+    'smx', 'monitor', 'dca', 'dtes64', 'pdcm', 'xtpr', 'pbe', 'tm', 'acpi', 'dts', 'pln', 'pts',
+    'hwp', 'hwp_epp', 'intel_pt', 'sgx', 'tme', 'pconfig', 'enqcmd', 'uintr',
+    # AMD
+    'svm', 'sse4a', 'misalignsse', '3dnowprefetch', 'xop', 'fma4', 'tbm', 'topoext', 'perfctr_core',
+    'clzero', 'irperf', 'xsaveerptr', 'rdpru', 'amd_ppin', 'cppc', 'sev', 'sev_es',
+    'sme', 'npt', 'nrip_save', 'avic', 'v_vmsave_vmload', 'vgif',
+    # ARM (Features line of /proc/cpuinfo), 'sme' shares the AMD bit above
+    'fp', 'asimd', 'evtstrm', 'pmull', 'sha1', 'sha2', 'crc32', 'atomics', 'fphp', 'asimdhp',
+    'asimdrdm', 'jscvt', 'fcma', 'lrcpc', 'dcpop', 'sha3', 'asimddp', 'asimdfhm', 'dit', 'uscat',
+    'ilrcpc', 'flagm', 'sb', 'paca', 'pacg', 'dcpodp', 'sve', 'sve2', 'sveaes', 'svepmull',
+    'svebitperm', 'svesha3', 'svesm4', 'flagm2', 'frint', 'svei8mm', 'svef32mm', 'svef64mm',
+    'svebf16', 'i8mm', 'bf16', 'dgh', 'rng', 'bti', 'mte', 'ecv', 'afp', 'rpres', 'sme2',
+    'lse128', 'cssc', 'mops', 'hbc'
+)
+
+_BIT = {flag: position for position, flag in enumerate(FLAG_INDEX)}
+
+# x86-64 micro-architecture levels (x86-64 psABI), each level includes the ones below it
+X86_LEVELS = [
+    ('x86-64', ['cmov', 'cx8', 'fpu', 'fxsr', 'mmx', 'syscall', 'sse', 'sse2', 'lm']),
+    ('x86-64-v2', ['cx16', 'lahf_lm', 'popcnt', 'pni', 'sse4_1', 'sse4_2', 'ssse3']),
+    ('x86-64-v3', ['avx', 'avx2', 'bmi1', 'bmi2', 'f16c', 'fma', 'abm', 'movbe', 'xsave']),
+    ('x86-64-v4', ['avx512f', 'avx512bw', 'avx512cd', 'avx512dq', 'avx512vl'])
+]
+
+# AVX-512 feature groups by the first server generation that shipped them
+AVX512_GENERATIONS = [
+    ('Skylake-SP', ['avx512f', 'avx512cd', 'avx512bw', 'avx512dq', 'avx512vl']),
+    ('Cascade Lake', ['avx512_vnni']),
+    ('Ice Lake / Zen 4', ['avx512ifma', 'avx512vbmi', 'avx512_vbmi2', 'avx512_bitalg',
+                          'avx512_vpopcntdq']),
+    ('Sapphire Rapids', ['avx512_bf16', 'avx512_fp16'])
+]
+
+AMX_FLAGS = ['amx_tile', 'amx_int8', 'amx_bf16', 'amx_fp16', 'amx_complex']
+
+# (label, flags any of which provides it)
+CRYPTO_FEATURES = [
+    ('AES', ['aes']),
+    ('VAES', ['vaes']),
+    ('CLMUL', ['pclmulqdq', 'pmull']),
+    ('VPCLMULQDQ', ['vpclmulqdq']),
+    ('SHA', ['sha_ni', 'sha2']),
+    ('SHA-512', ['sha512']),
+    ('SHA-3', ['sha3']),
+    ('GFNI', ['gfni']),
+    ('SM3/SM4', ['sm3', 'sm4']),
+    ('RDRAND/RNG', ['rdrand', 'rng'])
+]
+
+# Architecture levels an arm64 build can target, judged by the hwcaps they need
+ARM_LEVELS = [
+    ('armv8-a', ['fp', 'asimd']),
+    ('armv8.1-a', ['atomics', 'asimdrdm', 'crc32']),
+    ('armv8.2-a', ['fphp', 'asimdhp', 'dcpop']),
+    ('armv8.3-a', ['jscvt', 'fcma', 'lrcpc']),
+    ('armv8.4-a', ['dit', 'uscat', 'ilrcpc', 'flagm']),
+    ('armv8.5-a', ['sb', 'flagm2', 'frint', 'dcpodp'])
+]
+
+ARM_VECTOR_FEATURES = ['asimddp', 'asimdfhm', 'i8mm', 'bf16', 'sve', 'sve2', 'sme', 'sme2']
+
+def encode_flags(flags: Iterable[str]) -> int:
+    """Get the bitset of the known flags in a flag list"""
+    bits = 0
+    for flag in flags:
+        position = _BIT.get(flag)
+        if position is not None:
+            bits |= 1 << position
+    return bits
+
+def decode_flags(bits: int) -> List[str]:
+    """Get the flag names set in a bitset, in index order"""
+    return [flag for flag, position in _BIT.items() if bits >> position & 1]
+
+def format_flag_bits(bits: int) -> str:
+    """Format a bitset for JSON, which has no integers this wide"""
+    return f"{bits:x}"
+
+def parse_flag_bits(text: str) -> int:
+    """Parse a bitset written by format_flag_bits"""
+    try:
+        return int(text, 16)
+    except (TypeError, ValueError):
+        return 0
+
+def compare_flag_bits(baseline: int, other: int) -> Tuple[List[str], List[str]]:
+    """Get the flags other has on top of baseline and the ones it lacks"""
+    changed = baseline ^ other
+    return decode_flags(changed & other), decode_flags(changed & baseline)
+
+def _has_all(bits: int, flags: List[str]) -> bool:
+    """Check that every flag of a list is set"""
+    mask = encode_flags(flags)
+    return bits & mask == mask
+
+def classify(flags: List[str], architecture: str = '') -> Dict:
+    """Classify a CPU by the optimized builds its flags can run"""
+    bits = encode_flags(flags)
+    arm = architecture.startswith(('aarch64', 'arm')) or (
+        not architecture.startswith('x86') and _has_all(bits, ['asimd']))
+    levels = ARM_LEVELS if arm else X86_LEVELS
+
+    supported = []
+    missing = []
+    for name, required in levels:
+        absent = [flag for flag in required if not bits >> _BIT[flag] & 1]
+        # Levels are cumulative, so the first gap ends the list
+        if absent:
+            missing = absent
+            next_level = name
+            break
+        supported.append(name)
+    else:
+        next_level = None
+
+    info = {
+        'family': 'arm64' if arm else 'x86-64',
+        'level': supported[-1] if supported else 'Unknown',
+        'levels': supported,
+        'next_level': next_level,
+        'missing_for_next': missing,
+        'crypto': [label for label, any_of in CRYPTO_FEATURES if bits & encode_flags(any_of)]
+    }
+
+    if arm:
+        info['vector'] = [flag for flag in ARM_VECTOR_FEATURES if bits >> _BIT[flag] & 1]
+        return info
+
+    info['avx512'] = [flag for flag in flags if flag.startswith('avx512')]
+    info['avx512_generation'] = None
+    for generation, required in AVX512_GENERATIONS:
+        if not _has_all(bits, required):
+            break
+        info['avx512_generation'] = generation
+    info['amx'] = [flag for flag in AMX_FLAGS if bits >> _BIT[flag] & 1]
+
+    return info
@@ -0,0 +1,359 @@
+"""
+CPU Isolation Module
+Cross-checks isolated CPUs against IRQ affinity, local interrupts and the threads that actually ran on them
+"""
+
+import os
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .sysfs import host_path, read_attribute, read_attributes, parse_cpulist, format_cpulist, get_numa_nodes
+
+# Task flag set on kernel threads, see include/linux/sched.h
+PF_KTHREAD = 0x00200000
+
+# Kernel threads bound to one CPU: ksoftirqd/3, migration/3, cpuhp/3, rcuc/3, kworker/3:1H
+PER_CPU_KTHREAD_PATTERN = re.compile(r'/\d+(?::\d+H?)?$')
+
+# Timer ticks per second above which nohz_full is not stopping the tick
+MAX_TICK_RATE = 10.0
+
+# Flags that may precede the CPU list in isolcpus=
+ISOLCPUS_FLAGS = ['nohz', 'domain', 'managed_irq']
+
+# Inter-processor interrupts that pull an isolated CPU into kernel work
+IPI_TYPES = ['RES', 'CAL', 'TLB', 'IWI']
+
+IRQBALANCE_CONFIGS = ['/etc/default/irqbalance', '/etc/sysconfig/irqbalance']
+
+class IsolationInfo:
+    """Handles CPU isolation auditing on top of the interrupt sampler"""
+
+    def __init__(self, interrupt_info):
+        self.cpu_path = host_path('/sys/devices/system/cpu')
+        self.interrupts = interrupt_info
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+
+    def _parse_cpus(self, text: str, last_cpu: int) -> List[int]:
+        """Parse a boot parameter CPU list, where N stands for the last CPU"""
+        try:
+            return parse_cpulist(re.sub(r'\bN\b', str(last_cpu), text))
+        except ValueError:
+            return []
+
+    def _parse_mask(self, text: str) -> List[int]:
+        """Parse a hex CPU mask such as "ff,ffffffff" """
+        try:
+            value = int(text.replace(',', ''), 16)
+        except ValueError:
+            return []
+        return [cpu for cpu in range(value.bit_length()) if value >> cpu & 1]
+
+    def _get_cmdline(self) -> Dict[str, str]:
+        """Get the isolation parameters from the kernel command line"""
+        params = {'isolcpus': '', 'isolcpus_flags': '', 'nohz_full': '', 'rcu_nocbs': '', 'irqaffinity': ''}
+        for token in read_attribute(host_path('/proc/cmdline')).split():
+            key, _, value = token.partition('=')
+            if key == 'isolcpus':
+                # isolcpus=[nohz,domain,managed_irq,]cpulist
+                parts = value.split(',')
+                flags = [part for part in parts if part in ISOLCPUS_FLAGS]
+                params['isolcpus_flags'] = ','.join(flags)
+                params['isolcpus'] = ','.join(part for part in parts if part not in flags)
+            elif key in params:
+                params[key] = value
+        return params
+
+    def _get_irqbalance_banned(self, last_cpu: int) -> Optional[List[int]]:
+        """Get the CPUs irqbalance is configured to leave alone, None when no config sets them"""
+        for path in IRQBALANCE_CONFIGS:
+            try:
+                with open(host_path(path)) as f:
+                    lines = f.read().splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                key, _, value = line.strip().partition('=')
+                value = value.strip().strip('"\'')
+                if key == 'IRQBALANCE_BANNED_CPULIST' and value:
+                    return self._parse_cpus(value, last_cpu)
+                if key == 'IRQBALANCE_BANNED_CPUS' and value:
+                    return self._parse_mask(value)
+        return None
+
+    def _get_topology(self, cpus: List[int]) -> Dict[int, Dict]:
+        """Get the package and SMT siblings of every CPU"""
+        topology = {}
+        for cpu in cpus:
+            attrs = read_attributes(os.path.join(self.cpu_path, f"cpu{cpu}", 'topology'),
+                                    ['physical_package_id', 'thread_siblings_list'])
+            topology[cpu] = {
+                'package': int(attrs['physical_package_id']) if attrs['physical_package_id'].isdigit() else None,
+                'siblings': [sibling for sibling in parse_cpulist(attrs['thread_siblings_list'])
+                             if sibling != cpu] if attrs['thread_siblings_list'] else []
+            }
+        return topology
+
+    def _snapshot_tasks(self) -> Dict[Tuple[int, int], Tuple[str, str, int, int, int]]:
+        """Read every thread's name, state, flags, CPU time and last CPU, one directory fd per process"""
+        tasks = {}
+        try:
+            pids = [name for name in os.listdir(host_path('/proc')) if name.isdigit()]
+        except OSError:
+            return tasks
+
+        for pid in pids:
+            task_path = host_path(f'/proc/{pid}/task')
+            try:
+                tids = [name for name in os.listdir(task_path) if name.isdigit()]
+            except OSError:
+                # The process exited between the two listings
+                continue
+            stats = read_attributes(task_path, [f"{tid}/stat" for tid in tids])
+            for tid in tids:
+                stat = stats[f"{tid}/stat"]
+                # The name may hold spaces and parentheses, fields restart after the last ')'
+                start, end = stat.find('('), stat.rfind(')')
+                fields = stat[end + 2:].split()
+                if start < 0 or len(fields) < 37:
+                    continue
+                try:
+                    # Fields 3 (state), 9 (flags), 14 + 15 (utime + stime), 39 (processor)
+                    tasks[(int(pid), int(tid))] = (stat[start + 1:end], fields[0], int(fields[6]),
+                                                   int(fields[11]) + int(fields[12]), int(fields[36]))
+                except ValueError:
+                    continue
+        return tasks
+
+    def _get_allowed(self, pid: int, tid: int) -> List[int]:
+        """Get the CPUs a thread may run on"""
+        try:
+            with open(host_path(f'/proc/{pid}/task/{tid}/status')) as f:
+                for line in f:
+                    if line.startswith('Cpus_allowed_list:'):
+                        return parse_cpulist(line.split(':', 1)[1])
+        except (OSError, ValueError):
+            pass
+        return []
+
+    def _get_tasks(self, before: Dict, after: Dict, isolated: List[int], elapsed: float) -> Dict[int, List[Dict]]:
+        """Get the threads that ran on each isolated CPU during the sample"""
+        by_cpu = {cpu: [] for cpu in isolated}
+        for (pid, tid), (comm, state, flags, ticks, processor) in after.items():
+            if processor not in by_cpu:
+                continue
+            previous = before.get((pid, tid))
+            ran = ticks - previous[3] if previous else ticks
+            if ran <= 0 and state != 'R':
+                continue
+
+            allowed = self._get_allowed(pid, tid)
+            if flags & PF_KTHREAD:
+                kind = 'per-cpu kthread' if PER_CPU_KTHREAD_PATTERN.search(comm) or allowed == [processor] \
+                    else 'kthread'
+            else:
+                kind = 'user'
+            by_cpu[processor].append({
+                'pid': pid,
+                'tid': tid,
+                'comm': comm,
+                'kind': kind,
+                'state': state,
+                'cpu_percent': round(max(ran, 0) / self.clock_ticks / elapsed * 100, 1),
+                'allowed': format_cpulist(allowed) if allowed else 'Unknown',
+                'pinned': bool(allowed) and set(allowed) <= set(isolated)
+            })
+
+        for tasks in by_cpu.values():
+            tasks.sort(key=lambda task: task['cpu_percent'], reverse=True)
+        return by_cpu
+
+    def _check_cpu(self, entry: Dict) -> List[str]:
+        """Flag interrupts and foreign threads on one isolated CPU"""
+        contamination = []
+
+        if entry['irq_rate'] >= 1:
+            busiest = [irq for irq in entry['irqs'] if irq['rate'] >= 1][:3]
+            contamination.append(f"handles {entry['irq_rate']:.0f} device IRQs/s" + (
+                f" ({', '.join(irq['actions'] for irq in busiest)})" if busiest else ''))
+        if entry['nohz_full'] and entry['tick_rate'] > MAX_TICK_RATE:
+            contamination.append(f"timer tick still runs at {entry['tick_rate']:.0f}/s despite nohz_full")
+        if entry['ipi_rate'] >= 1:
+            contamination.append(f"receives {entry['ipi_rate']:.0f} IPIs/s (" + ', '.join(
+                f"{label} {rate:.0f}/s" for label, rate in entry['ipis'].items() if rate >= 1) + ")")
+
+        foreign = [task for task in entry['tasks'] if task['kind'] != 'per-cpu kthread']
+        if len(foreign) > 1:
+            contamination.append(f"shared by {len(foreign)} threads: " + ', '.join(
+                f"{task['comm']} ({task['tid']})" for task in foreign[:5]))
+        for task in foreign:
+            if task['kind'] == 'kthread':
+                contamination.append(f"unbound kernel thread {task['comm']} ran here")
+            elif not task['pinned'] and task['allowed'] != 'Unknown':
+                contamination.append(f"{task['comm']} ({task['tid']}) is not pinned: allowed on CPUs {task['allowed']}")
+
+        return contamination
+
+    def _check(self, isolated: List[int], sources: Dict[str, List[int]], cmdline: Dict[str, str],
+               default_affinity: List[int], workqueue: List[int], irqbalance: Dict,
+               topology: Dict[int, Dict], irqs: List[Dict]) -> List[str]:
+        """Flag isolation settings that leave isolated CPUs exposed"""
+        issues = []
+        isolated_set = set(isolated)
+
+        ticking = sorted(set(sources['isolcpus']) - set(sources['nohz_full']))
+        if ticking:
+            issues.append(f"CPU{'s' if len(ticking) > 1 else ''} {format_cpulist(ticking)} "
+                          f"{'are' if len(ticking) > 1 else 'is'} in isolcpus but not nohz_full: "
+                          f"the scheduler tick still interrupts {'them' if len(ticking) > 1 else 'it'}")
+
+        exposed = sorted(set(default_affinity) & isolated_set)
+        if exposed:
+            issues.append(f"Default IRQ affinity includes isolated CPUs {format_cpulist(exposed)}: "
+                          f"new IRQs may land there (set irqaffinity= or /proc/irq/default_smp_affinity)")
+
+        exposed = sorted(set(workqueue) & isolated_set)
+        if exposed:
+            issues.append(f"Unbound workqueues may run on isolated CPUs {format_cpulist(exposed)} "
+                          f"(set /sys/devices/virtual/workqueue/cpumask)")
+
+        pinned = [irq for irq in irqs if set(irq['effective_cpus'] or irq['affinity_cpus']) & isolated_set]
+        if pinned:
+            hint = ''
+            banned = parse_cpulist(irqbalance['banned']) if irqbalance['banned'] else []
+            if irqbalance['running'] and not isolated_set <= set(banned):
+                hint = ' (irqbalance is running, ban them with IRQBALANCE_BANNED_CPULIST)'
+            elif 'managed_irq' not in cmdline['isolcpus_flags'].split(',') and sources['isolcpus']:
+                hint = ' (add managed_irq to isolcpus to keep managed queue IRQs off)'
+            issues.append(f"{len(pinned)} IRQ(s) may fire on isolated CPUs: " + ', '.join(
+                f"{irq['irq']} {irq['actions']}" for irq in pinned[:5]) + (', ...' if len(pinned) > 5 else '') + hint)
+
+        shared = sorted({cpu for cpu in isolated for sibling in topology[cpu]['siblings']
+                         if sibling not in isolated_set})
+        if shared:
+            issues.append(f"Isolated CPU{'s' if len(shared) > 1 else ''} {format_cpulist(shared)} "
+                          f"share{'' if len(shared) > 1 else 's'} a core with housekeeping CPUs: "
+                          f"SMT siblings compete for the same execution units")
+
+        return issues
+
+    def get_all_info(self) -> Dict:
+        """Sample interrupts and threads and audit the isolated CPUs"""
+        online = read_attribute(os.path.join(self.cpu_path, 'online'))
+        all_cpus = parse_cpulist(online) if online else []
+        last_cpu = max(all_cpus, default=0)
+
+        cmdline = self._get_cmdline()
+        sysfs_isolated = read_attribute(os.path.join(self.cpu_path, 'isolated'))
+        sysfs_nohz = read_attribute(os.path.join(self.cpu_path, 'nohz_full'))
+        cpuset = read_attribute(host_path('/sys/fs/cgroup/cpuset.cpus.isolated'))
+        sources = {
+            # sysfs reflects what the kernel accepted, the command line fills in older kernels
+            'isolcpus': self._parse_cpus(sysfs_isolated or cmdline['isolcpus'], last_cpu),
+            'nohz_full': self._parse_cpus(sysfs_nohz if sysfs_nohz != '(null)' else cmdline['nohz_full'], last_cpu),
+            'rcu_nocbs': self._parse_cpus(cmdline['rcu_nocbs'], last_cpu),
+            'cpuset': self._parse_cpus(cpuset, last_cpu)
+        }
+        isolated = sorted(set(sources['isolcpus']) | set(sources['nohz_full']) | set(sources['cpuset']))
+
+        default_affinity = self._parse_mask(read_attribute(host_path('/proc/irq/default_smp_affinity')))
+        workqueue = self._parse_mask(read_attribute(host_path('/sys/devices/virtual/workqueue/cpumask')))
+
+        info = {
+            'available': bool(all_cpus),
+            'interval': 0.0,
+            'cmdline': cmdline,
+            'isolated': format_cpulist(isolated),
+            'isolated_cpus': isolated,
+            'sources': {name: format_cpulist(source) for name, source in sources.items()},
+            'housekeeping': format_cpulist([cpu for cpu in all_cpus if cpu not in isolated]),
+            'default_irq_affinity': format_cpulist(default_affinity),
+            'workqueue_cpumask': format_cpulist(workqueue),
+            'irqbalance': {'running': False, 'banned': ''},
+            'cpus': [],
+            'contaminated': [],
+            'issues': []
+        }
+        # Nothing to cross-check, so skip the two /proc walks and the sampling interval
+        if not isolated:
+            return info
+
+        start = time.monotonic()
+        before = self._snapshot_tasks()
+        interrupts = self.interrupts.sample()
+        # The interrupt sampler skips its sleep when its last snapshot is recent, threads need a window too
+        remaining = self.interrupts.interval - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        after = self._snapshot_tasks()
+        elapsed = max(time.monotonic() - start, 1e-6)
+
+        irqbalance_running = any(comm == 'irqbalance' and pid == tid for (pid, tid), (comm, *_) in after.items())
+        banned = self._get_irqbalance_banned(last_cpu)
+        irqbalance = {
+            'running': irqbalance_running,
+            'banned': format_cpulist(banned) if banned else ''
+        }
+
+        numa_nodes = get_numa_nodes(host_path('/sys/devices/system/node'))
+        topology = self._get_topology(isolated)
+        tasks = self._get_tasks(before, after, isolated, elapsed)
+        columns = {cpu: index for index, cpu in enumerate(interrupts['cpus'])}
+        local = interrupts['local_interrupts']
+
+        cpus = []
+        for cpu in isolated:
+            column = columns.get(cpu)
+            irqs = []
+            for irq in interrupts['irqs']:
+                rate = dict(irq['top_cpus']).get(cpu, 0.0)
+                if rate > 0 or cpu in (irq['effective_cpus'] or irq['affinity_cpus']):
+                    irqs.append({'irq': irq['irq'], 'actions': irq['actions'], 'rate': rate})
+            irqs.sort(key=lambda irq: irq['rate'], reverse=True)
+
+            entry = {
+                'cpu': cpu,
+                'node': next((node for node, node_cpus in numa_nodes.items() if cpu in node_cpus), None),
+                'package': topology[cpu]['package'],
+                'siblings': format_cpulist(topology[cpu]['siblings']),
+                'isolcpus': cpu in sources['isolcpus'],
+                'nohz_full': cpu in sources['nohz_full'],
+                'rcu_nocb': cpu in sources['rcu_nocbs'],
+                'cpuset': cpu in sources['cpuset'],
+                'irq_rate': interrupts['cpu_totals'][column] if column is not None else 0.0,
+                'irqs': irqs,
+                'tick_rate': local['LOC']['per_cpu'][column] if 'LOC' in local and column is not None else 0.0,
+                'ipis': {label: local[label]['per_cpu'][column] for label in IPI_TYPES
+                         if label in local and column is not None},
+                'tasks': tasks[cpu]
+            }
+            entry['ipi_rate'] = sum(entry['ipis'].values())
+            entry['contamination'] = self._check_cpu(entry)
+            cpus.append(entry)
+
+        issues = self._check(isolated, sources, cmdline, default_affinity, workqueue, irqbalance,
+                             topology, interrupts['irqs'])
+        for entry in cpus:
+            issues.extend(f"CPU {entry['cpu']}: {item}" for item in entry['contamination'])
+
+        info.update({
+            'interval': elapsed,
+            'irqbalance': irqbalance,
+            'cpus': cpus,
+            'contaminated': [entry['cpu'] for entry in cpus if entry['contamination']],
+            'issues': issues
+        })
+        return info
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary isolation information"""
+        if info is None:
+            info = self.get_all_info()
+        if not info['isolated_cpus']:
+            return {'Isolated CPUs': 'None'}
+        return {
+            'Isolated CPUs': info['isolated'],
+            'Contaminated CPUs': format_cpulist(info['contaminated']) or 'None',
+            'Isolation Issues': str(len(info['issues']))
+        }
@@ -6,14 +6,18 @@ Gathers detailed RAM and memory information
 import subprocess
 import os
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from .sysfs import host_path
+from .dimms import analyze
 
 class MemoryInfo:
     """Handles memory information gathering"""
     
     def __init__(self):
-        self.meminfo_path = "/proc/meminfo"
+        self.meminfo_path = host_path("/proc/meminfo")
         self.dmidecode_available = self._check_command("dmidecode")
+        self._slots = None
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available"""
@@ -58,12 +62,44 @@ class MemoryInfo:
         
         return data
     
-    def _get_memory_modules(self) -> List[Dict]:
-        """Get memory module information from dmidecode"""
-        modules = []
+    def _parse_size(self, value: str) -> int:
+        """Parse a dmidecode size such as "32 GB" into bytes"""
+        match = re.match(r'(\d+)\s*([KMGT]?B)', value)
+        if not match:
+            return 0
+        return int(match.group(1)) * 1024 ** ['B', 'KB', 'MB', 'GB', 'TB'].index(match.group(2))
+    
+    def _parse_number(self, value: str) -> int:
+        """Parse the leading number of a dmidecode value such as 4800 MT/s or 64 bits"""
+        match = re.match(r'(\d+)', value)
+        return int(match.group(1)) if match else 0
+    
+    def _get_memory_slots(self) -> List[Dict]:
+        """Get every memory slot from dmidecode, populated or empty"""
+        # DIMMs are not hot-plugged, so dmidecode runs once per instance once it succeeds
+        if self._slots is not None:
+            return self._slots
         
+        slots = []
         if not self.dmidecode_available:
-            return modules
+            return slots
+        
+        fields = {
+            'size': 'size',
+            'locator': 'locator',
+            'bank locator': 'bank_locator',
+            'type': 'type',
+            'form factor': 'form_factor',
+            'speed': 'speed',
+            'configured memory speed': 'configured_speed',
+            # dmidecode before 3.0
+            'configured clock speed': 'configured_speed',
+            'rank': 'rank',
+            'data width': 'data_width',
+            'total width': 'total_width',
+            'manufacturer': 'manufacturer',
+            'part number': 'part_number'
+        }
         
         try:
             output = self._run_command(['sudo', 'dmidecode', '-t', 'memory'])
@@ -71,44 +107,47 @@ class MemoryInfo:
                 # Try without sudo
                 output = self._run_command(['dmidecode', '-t', 'memory'])
             
-            if output:
-                current_module = {}
-                in_memory_device = False
+            current_slot = None
+            for line in output.split('\n'):
+                line = line.strip()
                 
-                for line in output.split('\n'):
-                    line = line.strip()
-                    
-                    if line.startswith('Memory Device'):
-                        if current_module and current_module.get('size') != 'No Module Installed':
-                            modules.append(current_module)
-                        current_module = {}
-                        in_memory_device = True
-                    elif in_memory_device and ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip().lower()
-                        value = value.strip()
-                        
-                        if key == 'size':
-                            current_module['size'] = value
-                        elif key == 'locator':
-                            current_module['locator'] = value
-                        elif key == 'type':
-                            current_module['type'] = value
-                        elif key == 'speed':
-                            current_module['speed'] = value
-                        elif key == 'manufacturer':
-                            current_module['manufacturer'] = value
-                
-                if current_module and current_module.get('size') != 'No Module Installed':
-                    modules.append(current_module)
+                if line.startswith('Handle '):
+                    current_slot = None
+                elif line == 'Memory Device':
+                    current_slot = {}
+                    slots.append(current_slot)
+                elif current_slot is not None and ':' in line:
+                    key, value = line.split(':', 1)
+                    key = fields.get(key.strip().lower())
+                    if key and key not in current_slot:
+                        current_slot[key] = value.strip()
         except Exception:
             pass
         
-        return modules
+        for slot in slots:
+            slot['size_bytes'] = self._parse_size(slot.get('size', ''))
+            slot['populated'] = slot['size_bytes'] > 0
+            slot['speed_mts'] = self._parse_number(slot.get('speed', ''))
+            # Boards that do not report the configured speed run the module at its rated one
+            slot['configured_speed_mts'] = self._parse_number(slot.get('configured_speed', '')) or slot['speed_mts']
+            slot['data_width_bits'] = self._parse_number(slot.get('data_width', ''))
+        
+        # A failed or denied dmidecode is retried on the next call instead of hiding the modules for the session
+        if slots:
+            self._slots = slots
+        return slots
+    
+    def _get_memory_modules(self, slots: Optional[List[Dict]] = None) -> List[Dict]:
+        """Get memory module information from dmidecode, or from slots already read"""
+        if slots is None:
+            slots = self._get_memory_slots()
+        return [slot for slot in slots if slot['populated']]
     
     def get_all_info(self) -> Dict:
         """Get all memory information"""
         meminfo = self._parse_meminfo()
+        # One dmidecode attempt per refresh, an uncached failure would otherwise fork it for every field
+        slots = self._get_memory_slots()
         
         # Total memory
         total_kb = meminfo.get('MemTotal', 0)
@@ -146,7 +185,9 @@ class MemoryInfo:
             'swap_used': self._format_bytes(swap_used_bytes),
             'swap_free': self._format_bytes(swap_free_bytes),
             'swap_percent': f"{swap_percent:.1f}%",
-            'modules': self._get_memory_modules()
+            'modules': self._get_memory_modules(slots),
+            'slots': slots,
+            'topology': analyze(slots)
         }
         
         return data
@@ -213,9 +254,10 @@ class MemoryInfo:
         
         return data
     
-    def get_summary(self) -> Dict:
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
         """Get summary memory information"""
-        info = self.get_all_info()
+        if info is None:
+            info = self.get_all_info()
         return {
             'Total RAM': info.get('total', 'Unknown'),
             'Available': info.get('available', 'Unknown'),
@@ -0,0 +1,218 @@
+"""
+Mitigations Module
+Reports CPU vulnerability mitigations, microcode and kernel parameters with their typical cost
+"""
+
+import os
+import re
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attribute, read_attributes
+
+# Kernel parameters that change which mitigations run
+CMDLINE_PARAMETERS = [
+    'mitigations', 'nopti', 'pti', 'nospectre_v1', 'nospectre_v2', 'spectre_v2', 'spectre_v2_user',
+    'spectre_bhi', 'spec_store_bypass_disable', 'nospec_store_bypass_disable', 'l1tf', 'mds',
+    'tsx', 'tsx_async_abort', 'mmio_stale_data', 'retbleed', 'srbds', 'spec_rstack_overflow',
+    'gather_data_sampling', 'reg_file_data_sampling', 'nosmt', 'ibt', 'kvm.nx_huge_pages',
+    'l1d_flush'
+]
+
+# Enhanced IBRS as the primary mitigation. Anchored, because the status of every other
+# spectre_v2 mitigation goes on to list "PBRSB-eIBRS: Not affected".
+PRIMARY_EIBRS = r'^Mitigation: (Enhanced( / Automatic)? IBRS|Automatic IBRS|eIBRS)'
+
+# (vulnerability, alternatives of (pattern in its status, mitigation, typical cost)). The first
+# matching alternative wins, so cheap variants are listed before the expensive ones they contain.
+MITIGATION_COSTS = [
+    ('meltdown', [
+        (r'PTI', 'Page table isolation (PTI)',
+         'Every kernel entry switches page tables: typically 5-30% on syscall- and IO-heavy '
+         'workloads, less with PCID')
+    ]),
+    ('spectre_v2', [
+        (PRIMARY_EIBRS, None, None),
+        (r'Retpolines?', 'Retpoline',
+         'Indirect branches go through thunks: typically 1-5%, more on branchy kernel paths; '
+         'CPUs with eIBRS avoid it'),
+        (r'\bIBRS\b', 'IBRS on kernel entry',
+         'Legacy IBRS toggles an MSR on every kernel entry: up to 10-30% on syscall-heavy workloads')
+    ]),
+    ('spectre_v2', [
+        (r'BHI: SW loop', 'BHI software loop',
+         'Clears branch history on syscall entry: typically a few percent on syscall-heavy workloads')
+    ]),
+    ('retbleed', [
+        (PRIMARY_EIBRS, None, None),
+        (r'untrained return thunk|IBRS|[Ss]tuffing', 'Retbleed return thunks',
+         'Returns go through a thunk or call depth tracking: typically 5-15% on kernel-heavy workloads')
+    ]),
+    ('spec_rstack_overflow', [
+        (r'Safe RET', 'SRSO Safe RET',
+         'Every kernel return goes through a safe sequence: up to 10-15% on syscall-heavy workloads'),
+        (r'IBPB', 'SRSO IBPB on kernel entry',
+         'Flushes branch prediction on entry: often 20% or more on syscall-heavy workloads')
+    ]),
+    ('mds', [
+        (r'Clear CPU buffers', 'MDS buffer clearing (VERW)',
+         'Buffers are cleared on every return to user space: typically 1-10% on syscall-heavy workloads')
+    ]),
+    ('l1tf', [
+        (r'cache flushes', 'L1D flush on VM entry',
+         'Flushes L1D on VM entry: noticeable for VM-exit-heavy guests')
+    ]),
+    ('gather_data_sampling', [
+        (r'Microcode', 'GDS microcode mitigation',
+         'Slows AVX gather instructions: up to 50% on gather-heavy vector code')
+    ]),
+    ('reg_file_data_sampling', [
+        (r'Clear Register File', 'RFDS register file clearing',
+         'Clears register files on kernel exit: typically small')
+    ]),
+    ('srbds', [
+        (r'Microcode', 'SRBDS microcode mitigation',
+         'Slows RDRAND/RDSEED considerably: matters for code that reads them in a loop')
+    ])
+]
+
+SMT_COST = 'Only one thread per core: typically 10-30% less throughput on well-threaded workloads'
+
+class MitigationInfo:
+    """Handles vulnerability, microcode and kernel parameter reporting"""
+
+    def __init__(self):
+        self.vulnerabilities_path = host_path('/sys/devices/system/cpu/vulnerabilities')
+
+    def _classify(self, status: str) -> str:
+        """Get the state of a vulnerability from its sysfs status"""
+        lowered = status.lower()
+        if lowered.startswith('not affected'):
+            return 'not_affected'
+        if lowered.startswith('vulnerable'):
+            return 'vulnerable'
+        if lowered.startswith('mitigation'):
+            # Partially mitigated, e.g. "Mitigation: ...; BHI: Vulnerable"
+            return 'partial' if 'vulnerable' in lowered else 'mitigated'
+        return 'unknown'
+
+    def _get_vulnerabilities(self) -> List[Dict]:
+        """Get every vulnerability the kernel knows about"""
+        try:
+            names = sorted(os.listdir(self.vulnerabilities_path))
+        except OSError:
+            return []
+
+        statuses = read_attributes(self.vulnerabilities_path, names)
+        return [{
+            'name': name,
+            'status': statuses[name] or 'Unknown',
+            'state': self._classify(statuses[name])
+        } for name in names]
+
+    def _get_microcode(self) -> Dict:
+        """Get the microcode revision and whether every CPU runs the same one"""
+        revisions = set()
+        try:
+            with open(host_path('/proc/cpuinfo')) as f:
+                for line in f:
+                    if line.startswith('microcode'):
+                        revisions.add(line.split(':', 1)[1].strip())
+        except OSError:
+            pass
+
+        if len(revisions) == 1:
+            revision = next(iter(revisions))
+        elif revisions:
+            revision = 'mixed'
+        else:
+            revision = read_attribute(host_path('/sys/devices/system/cpu/cpu0/microcode/version'), 'Unknown')
+        return {
+            'revision': revision,
+            'revisions': sorted(revisions),
+            'consistent': len(revisions) <= 1
+        }
+
+    def _get_cmdline(self) -> Dict:
+        """Get the kernel command line and the mitigation parameters on it"""
+        cmdline = read_attribute(host_path('/proc/cmdline'))
+        parameters = {}
+        # Arguments after "--" belong to init, not the kernel
+        for token in cmdline.split(' -- ')[0].split():
+            key, _, value = token.partition('=')
+            if key in CMDLINE_PARAMETERS:
+                parameters[key] = value or 'on'
+        return {'cmdline': cmdline, 'parameters': parameters}
+
+    def _get_smt(self) -> Dict:
+        """Get the SMT control state"""
+        attrs = read_attributes(host_path('/sys/devices/system/cpu/smt'), ['control', 'active'])
+        return {
+            'control': attrs['control'] or 'Unknown',
+            'active': attrs['active'] == '1'
+        }
+
+    def _get_costs(self, vulnerabilities: List[Dict], smt: Dict, parameters: Dict) -> List[Dict]:
+        """Get the active mitigations known to cost performance"""
+        statuses = {vulnerability['name']: vulnerability['status'] for vulnerability in vulnerabilities}
+        costs = []
+        for name, alternatives in MITIGATION_COSTS:
+            status = statuses.get(name, '')
+            if not status.startswith('Mitigation'):
+                continue
+            for pattern, mitigation, cost in alternatives:
+                if re.search(pattern, status):
+                    if mitigation:
+                        costs.append({'vulnerability': name, 'mitigation': mitigation, 'cost': cost})
+                    break
+
+        # SMT that could run but was switched off, as opposed to hardware without it
+        if smt['control'] in ('off', 'forceoff') or 'nosmt' in parameters:
+            costs.append({'vulnerability': 'smt', 'mitigation': f"SMT disabled ({smt['control']})",
+                          'cost': SMT_COST})
+
+        return costs
+
+    def _check(self, vulnerabilities: List[Dict], microcode: Dict, parameters: Dict) -> List[str]:
+        """Flag unmitigated vulnerabilities and inconsistent microcode"""
+        issues = []
+
+        if parameters.get('mitigations') == 'off':
+            issues.append("mitigations=off: all CPU vulnerability mitigations are disabled")
+
+        for vulnerability in vulnerabilities:
+            if vulnerability['state'] in ('vulnerable', 'partial'):
+                issues.append(f"{vulnerability['name']}: {vulnerability['status']}")
+
+        if not microcode['consistent']:
+            issues.append(f"CPUs run different microcode revisions: {', '.join(microcode['revisions'])}")
+
+        return issues
+
+    def get_all_info(self) -> Dict:
+        """Get all mitigation information"""
+        vulnerabilities = self._get_vulnerabilities()
+        microcode = self._get_microcode()
+        cmdline = self._get_cmdline()
+        smt = self._get_smt()
+
+        return {
+            'vulnerabilities': vulnerabilities,
+            'microcode': microcode,
+            'cmdline': cmdline['cmdline'],
+            'parameters': cmdline['parameters'],
+            'smt': smt,
+            'costs': self._get_costs(vulnerabilities, smt, cmdline['parameters']),
+            'issues': self._check(vulnerabilities, microcode, cmdline['parameters'])
+        }
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary mitigation information"""
+        if info is None:
+            info = self.get_all_info()
+        mitigated = sum(1 for v in info['vulnerabilities'] if v['state'] == 'mitigated')
+        affected = sum(1 for v in info['vulnerabilities'] if v['state'] != 'not_affected')
+        return {
+            'Microcode': info['microcode']['revision'],
+            'Mitigated': f"{mitigated} of {affected} affected",
+            'Costly Mitigations': ', '.join(cost['mitigation'] for cost in info['costs']) or 'None'
+        }
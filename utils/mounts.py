@@ -0,0 +1,230 @@
+"""
+Mount Scanner Module
+Gathers filesystem usage with bounded statvfs calls, inode pressure and backing devices
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from .sysfs import read_attribute, host_path
+
+# Filesystems that never have a backing device worth reporting
+PSEUDO_FILESYSTEMS = {
+    'proc', 'sysfs', 'devtmpfs', 'devpts', 'tmpfs', 'cgroup', 'cgroup2', 'securityfs',
+    'pstore', 'efivarfs', 'bpf', 'debugfs', 'tracefs', 'configfs', 'fusectl', 'mqueue',
+    'hugetlbfs', 'autofs', 'binfmt_misc', 'rpc_pipefs', 'nsfs', 'ramfs', 'overlay', 'squashfs'
+}
+
+INODE_WARNING_PERCENT = 90.0
+
+# Mount options that matter for performance
+TRACKED_OPTIONS = ['noatime', 'relatime', 'strictatime', 'nodiratime', 'discard', 'nodiscard',
+                   'barrier', 'nobarrier', 'sync', 'ro']
+
+class MountScanner:
+    """Handles filesystem usage scanning that cannot be blocked by a hung mount"""
+
+    def __init__(self, timeout: float = 2.0, ttl: float = 5.0):
+        self.timeout = timeout
+        self.ttl = ttl
+        self._cache = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _parse_mountinfo(self) -> List[Dict]:
+        """Parse /proc/self/mountinfo"""
+        mounts = []
+        try:
+            with open(host_path('/proc/self/mountinfo')) as f:
+                for line in f:
+                    fields = line.split()
+                    if '-' not in fields:
+                        continue
+                    sep = fields.index('-')
+                    if len(fields) < sep + 3:
+                        continue
+
+                    mounts.append({
+                        'devno': fields[2],
+                        'mountpoint': self._unescape(fields[4]),
+                        'options': fields[5].split(','),
+                        'fstype': fields[sep + 1],
+                        'device': self._unescape(fields[sep + 2]),
+                        'super_options': fields[sep + 3].split(',') if len(fields) > sep + 3 else []
+                    })
+        except OSError:
+            pass
+        return mounts
+
+    def _unescape(self, value: str) -> str:
+        """Decode octal escapes such as \\040 used for spaces"""
+        # Only the escapes the kernel writes, unicode_escape would mangle non-ASCII names
+        return re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), value)
+
+    def _is_reportable(self, mount: Dict) -> bool:
+        """Check whether a mount is a real or network filesystem"""
+        if mount['fstype'] in PSEUDO_FILESYSTEMS:
+            return False
+        return (mount['device'].startswith('/dev/') or mount['fstype'].startswith('fuse')
+                or mount['fstype'] in ('nfs', 'nfs4', 'cifs', 'smb3', 'ceph', 'glusterfs', 'zfs', 'btrfs'))
+
+    def _statvfs_worker(self, mountpoint: str, result: Dict, done: threading.Event):
+        """Run statvfs in a daemon thread, a hung mount only blocks this thread"""
+        try:
+            result['stat'] = os.statvfs(host_path(mountpoint))
+        except OSError as e:
+            result['error'] = e.strerror or str(e)
+        finally:
+            done.set()
+            with self._lock:
+                self._pending.pop(mountpoint, None)
+
+    def _start_statvfs(self, mountpoint: str):
+        """Start (or join an in-flight) statvfs call for a mount"""
+        with self._lock:
+            pending = self._pending.get(mountpoint)
+            if pending:
+                return pending[0], pending[1], False
+
+            result, done = {}, threading.Event()
+            self._pending[mountpoint] = (result, done)
+
+        thread = threading.Thread(
+            target=self._statvfs_worker, args=(mountpoint, result, done),
+            name='lxz-statvfs', daemon=True
+        )
+        thread.start()
+        return result, done, True
+
+    def _get_backing_chain(self, devno: str) -> str:
+        """Resolve dm/LVM/mdraid stacking down to the physical devices"""
+        path = host_path(f'/sys/dev/block/{devno}')
+        if not os.path.exists(path):
+            return ''
+
+        def describe(sys_path: str) -> str:
+            name = os.path.basename(os.path.realpath(sys_path))
+            dm_name = read_attribute(os.path.join(sys_path, 'dm', 'name'))
+            md_level = read_attribute(os.path.join(sys_path, 'md', 'level'))
+            if dm_name:
+                return f"{name}[{dm_name}]"
+            if md_level:
+                return f"{name}[{md_level}]"
+            return name
+
+        def walk(sys_path: str) -> str:
+            real = os.path.realpath(sys_path)
+            slaves_dir = os.path.join(real, 'slaves')
+            try:
+                slaves = sorted(os.listdir(slaves_dir))
+            except OSError:
+                slaves = []
+
+            if not slaves:
+                return describe(real)
+            lower = [walk(os.path.join(slaves_dir, slave)) for slave in slaves]
+            if len(lower) > 1:
+                return f"{describe(real)} → ({' + '.join(lower)})"
+            return f"{describe(real)} → {lower[0]}"
+
+        return walk(path)
+
+    def _format_options(self, mount: Dict) -> List[str]:
+        """Get the performance-relevant mount options"""
+        options = set(mount['options']) | set(mount['super_options'])
+        return [option for option in TRACKED_OPTIONS if option in options]
+
+    def _build_entry(self, mount: Dict, result: Dict) -> Dict:
+        """Build the report entry for a mount from its statvfs result"""
+        entry = {
+            'device': mount['device'],
+            'mountpoint': mount['mountpoint'],
+            'fstype': mount['fstype'],
+            'options': self._format_options(mount),
+            'backing': self._get_backing_chain(mount['devno']),
+            'status': 'ok',
+            'error': None
+        }
+
+        stat = result.get('stat')
+        if stat is None:
+            entry['status'] = 'timeout' if 'timed out' in str(result.get('error')) else 'error'
+            entry['error'] = result.get('error', 'Unknown error')
+        else:
+            size = stat.f_blocks * stat.f_frsize
+            free = stat.f_bfree * stat.f_frsize
+            used = size - free
+            inodes_used = stat.f_files - stat.f_ffree
+            entry.update({
+                'size_bytes': size,
+                'used_bytes': used,
+                'free_bytes': free,
+                'percent': (used / size * 100) if size > 0 else 0.0,
+                'inodes_total': stat.f_files,
+                'inodes_used': inodes_used,
+                'inodes_percent': (inodes_used / stat.f_files * 100) if stat.f_files > 0 else None
+            })
+
+        entry['issues'] = self._check_mount(entry)
+        return entry
+
+    def iter_scan(self) -> Iterator[Tuple[int, Dict]]:
+        """Yield (position in mount order, entry) as each statvfs returns, bounded by the timeout"""
+        mounts = [mount for mount in self._parse_mountinfo() if self._is_reportable(mount)]
+        now = time.monotonic()
+
+        # Start every stale statvfs at once so they overlap
+        calls = {}
+        for index, mount in enumerate(mounts):
+            cached = self._cache.get(mount['mountpoint'])
+            if cached and now - cached[0] < self.ttl:
+                yield index, self._build_entry(mount, cached[1])
+                continue
+            calls[index] = self._start_statvfs(mount['mountpoint'])
+
+        deadline = time.monotonic() + self.timeout
+        while calls:
+            finished = [index for index, (_, done, _) in calls.items() if done.is_set()]
+            for index in finished:
+                result, _, _ = calls.pop(index)
+                self._cache[mounts[index]['mountpoint']] = (time.monotonic(), dict(result))
+                yield index, self._build_entry(mounts[index], result)
+
+            # A call still hanging from an earlier scan is not waited on again
+            expired = time.monotonic() >= deadline
+            for index in [index for index, (_, _, started) in calls.items() if expired or not started]:
+                result, _, _ = calls.pop(index)
+                self._cache.pop(mounts[index]['mountpoint'], None)
+                result = dict(result, error=f"statvfs timed out after {self.timeout:.1f}s")
+                yield index, self._build_entry(mounts[index], result)
+
+            if calls:
+                next(iter(calls.values()))[1].wait(0.005)
+
+    def scan(self) -> List[Dict]:
+        """Scan all reportable mounts, bounded by the per-mount timeout"""
+        return [entry for _, entry in sorted(self.iter_scan(), key=lambda item: item[0])]
+
+    def _check_mount(self, entry: Dict) -> List[str]:
+        """Flag full inode tables, hung mounts and costly mount options"""
+        issues = []
+        options = entry['options']
+
+        if entry['status'] == 'timeout':
+            issues.append("statvfs did not answer, the mount may be hung")
+        if (entry.get('inodes_percent') or 0) >= INODE_WARNING_PERCENT:
+            issues.append(f"{entry['inodes_percent']:.1f}% of inodes used, file creation will fail "
+                          f"before the disk is full")
+        if 'nobarrier' in options:
+            issues.append("nobarrier risks filesystem corruption on power loss")
+        if 'discard' in options:
+            issues.append("Online discard adds latency to deletes, a periodic fstrim is usually cheaper")
+        if 'strictatime' in options or (entry['device'].startswith('/dev/')
+                                        and not {'noatime', 'relatime', 'ro'} & set(options)
+                                        and entry['fstype'] not in ('vfat', 'exfat', 'ntfs', 'ntfs3')):
+            issues.append("atime updates on every read turn reads into writes, consider noatime")
+
+        return issues
@@ -0,0 +1,172 @@
+"""
+NVMe Information Module
+Gathers NVMe controller, namespace and queue details with tuning checks
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attribute, read_attributes, parse_cpulist, get_numa_nodes
+
+class NVMeInfo:
+    """Handles NVMe controller and namespace information gathering"""
+
+    def __init__(self, nvme_path: Optional[str] = None, block_path: Optional[str] = None):
+        self.nvme_path = nvme_path or host_path('/sys/class/nvme')
+        self.block_path = block_path or host_path('/sys/block')
+
+    def _get_scheduler(self, value: str) -> str:
+        """Get the active scheduler from "[none] mq-deadline kyber" """
+        for token in value.split():
+            if token.startswith('[') and token.endswith(']'):
+                return token[1:-1]
+        return value or 'Unknown'
+
+    def _get_irq_nodes(self, controller_path: str, numa_nodes: Dict[int, List[int]]) -> List[int]:
+        """Get the NUMA nodes of the CPUs handling the controller's queue interrupts"""
+        try:
+            irqs = os.listdir(os.path.join(controller_path, 'device', 'msi_irqs'))
+        except OSError:
+            return []
+
+        # Completions run where the interrupt lands, so that is where the IO is handled
+        irq_cpus = set()
+        for irq in irqs:
+            affinity = read_attributes(host_path(f"/proc/irq/{irq}"),
+                                       ['effective_affinity_list', 'smp_affinity_list'])
+            affinity = affinity['effective_affinity_list'] or affinity['smp_affinity_list']
+            if affinity:
+                irq_cpus.update(parse_cpulist(affinity))
+
+        return sorted(node for node, cpus in numa_nodes.items() if irq_cpus & set(cpus))
+
+    def _get_namespace(self, name: str, online_cpus: int) -> Dict:
+        """Get details and queue settings for one namespace block device"""
+        device_path = os.path.join(self.block_path, name)
+        attrs = read_attributes(device_path, ['size', 'nsid', 'wwid'])
+        queue = read_attributes(os.path.join(device_path, 'queue'), [
+            'scheduler', 'nr_requests', 'max_hw_sectors_kb', 'max_sectors_kb',
+            'logical_block_size', 'physical_block_size'
+        ])
+
+        # Each directory under mq/ is one hardware queue
+        try:
+            hw_queues = len(os.listdir(os.path.join(device_path, 'mq')))
+        except OSError:
+            hw_queues = 0
+
+        size = int(attrs['size']) * 512 if attrs['size'].isdigit() else 0
+        return {
+            'name': name,
+            'nsid': attrs['nsid'] or 'Unknown',
+            'wwid': attrs['wwid'] or 'Unknown',
+            'size_bytes': size,
+            'scheduler': self._get_scheduler(queue['scheduler']),
+            'nr_requests': queue['nr_requests'] or 'Unknown',
+            'max_hw_sectors_kb': queue['max_hw_sectors_kb'] or 'Unknown',
+            'max_sectors_kb': queue['max_sectors_kb'] or 'Unknown',
+            'logical_block_size': queue['logical_block_size'] or 'Unknown',
+            'physical_block_size': queue['physical_block_size'] or 'Unknown',
+            'hw_queues': hw_queues,
+            'online_cpus': online_cpus
+        }
+
+    def _check_controller(self, controller: Dict) -> List[str]:
+        """Flag sub-optimal settings for a controller and its namespaces"""
+        issues = []
+
+        if controller['state'] not in ('live', 'Unknown'):
+            issues.append(f"Controller state is '{controller['state']}'")
+
+        numa_node = controller['numa_node']
+        irq_nodes = controller['irq_nodes']
+        if numa_node.isdigit() and irq_nodes and int(numa_node) not in irq_nodes:
+            issues.append(f"Controller is on NUMA node {numa_node} but its interrupts are handled on node(s) "
+                          f"{', '.join(map(str, irq_nodes))} (cross-NUMA DMA and completions)")
+
+        # The admin queue is counted in queue_count, the rest is what the controller granted for IO
+        io_queues = int(controller['queue_count']) - 1 if controller['queue_count'].isdigit() else 0
+
+        for namespace in controller['namespaces']:
+            if namespace['scheduler'] not in ('none', 'Unknown'):
+                issues.append(f"{namespace['name']}: scheduler '{namespace['scheduler']}' adds "
+                              f"per-IO overhead on NVMe, 'none' is usually faster")
+            # Fewer queues than CPUs is normal when the controller has no more, only an unused share is a problem
+            if 0 < namespace['hw_queues'] < namespace['online_cpus'] and namespace['hw_queues'] < io_queues // 2:
+                issues.append(f"{namespace['name']}: {namespace['hw_queues']} hardware queues in use of "
+                              f"{io_queues} on the controller for {namespace['online_cpus']} CPUs")
+            if (namespace['max_sectors_kb'].isdigit() and namespace['max_hw_sectors_kb'].isdigit()
+                    and int(namespace['max_sectors_kb']) < int(namespace['max_hw_sectors_kb']) // 4):
+                issues.append(f"{namespace['name']}: max_sectors_kb {namespace['max_sectors_kb']} is far "
+                              f"below the hardware limit {namespace['max_hw_sectors_kb']}")
+
+        return issues
+
+    def get_controllers(self) -> List[Dict]:
+        """Get every NVMe controller with its namespaces"""
+        controllers = []
+
+        try:
+            names = sorted(name for name in os.listdir(self.nvme_path) if name.startswith('nvme'))
+        except OSError:
+            return controllers
+
+        try:
+            block_devices = os.listdir(self.block_path)
+        except OSError:
+            block_devices = []
+
+        online = read_attribute(host_path('/sys/devices/system/cpu/online'))
+        online_cpus = len(parse_cpulist(online)) if online else os.cpu_count() or 0
+        numa_nodes = get_numa_nodes(host_path('/sys/devices/system/node'))
+
+        for name in names:
+            controller_path = os.path.join(self.nvme_path, name)
+            attrs = read_attributes(controller_path, [
+                'model', 'serial', 'firmware_rev', 'transport', 'state', 'address', 'cntlid', 'queue_count'
+            ])
+            device = read_attributes(os.path.join(controller_path, 'device'), ['numa_node', 'local_cpulist'])
+
+            # Namespaces appear as nvme<ctrl>n<ns>, or nvme<subsys>n<ns> with multipath
+            namespaces = [
+                self._get_namespace(block, online_cpus)
+                for block in sorted(block_devices)
+                if block.startswith(f"{name}n") or os.path.isdir(os.path.join(controller_path, block))
+            ]
+
+            controller = {
+                'name': name,
+                'model': attrs['model'] or 'Unknown',
+                'serial': attrs['serial'] or 'Unknown',
+                'firmware': attrs['firmware_rev'] or 'Unknown',
+                'transport': attrs['transport'] or 'Unknown',
+                'state': attrs['state'] or 'Unknown',
+                'address': attrs['address'] or 'Unknown',
+                'queue_count': attrs['queue_count'] or 'Unknown',
+                'numa_node': device['numa_node'] if device['numa_node'] not in ('', '-1') else 'N/A',
+                'local_cpus': device['local_cpulist'] or 'Unknown',
+                'irq_nodes': self._get_irq_nodes(controller_path, numa_nodes),
+                'namespaces': namespaces
+            }
+            controller['issues'] = self._check_controller(controller)
+            controllers.append(controller)
+
+        return controllers
+
+    def get_all_info(self) -> Dict:
+        """Get all NVMe information"""
+        controllers = self.get_controllers()
+        return {
+            'controllers': controllers,
+            'issues': [f"{c['name']}: {issue}" for c in controllers for issue in c['issues']]
+        }
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary NVMe information"""
+        if info is None:
+            info = self.get_all_info()
+        namespaces = sum(len(c['namespaces']) for c in info['controllers'])
+        return {
+            'NVMe Controllers': f"{len(info['controllers'])} ({namespaces} namespaces)",
+            'NVMe Issues': str(len(info['issues']))
+        }
@@ -0,0 +1,164 @@
+"""
+PCIe Link Module
+Audits negotiated versus maximum PCIe link speed and width for every device
+"""
+
+import os
+import re
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attributes
+
+# Transfer rate in GT/s to PCIe generation
+PCIE_GENERATIONS = {
+    2.5: 1,
+    5.0: 2,
+    8.0: 3,
+    16.0: 4,
+    32.0: 5,
+    64.0: 6
+}
+
+PCI_ADDRESS_RE = re.compile(r'^[0-9a-f]{4}:[0-9a-f]{2}:[0-9a-f]{2}\.[0-7]$')
+
+class PCIeInfo:
+    """Handles PCIe link health information gathering"""
+
+    def __init__(self, pci_path: Optional[str] = None):
+        self.pci_path = pci_path or host_path('/sys/bus/pci/devices')
+
+    def _parse_speed(self, value: str) -> Optional[float]:
+        """Parse "16.0 GT/s PCIe" into 16.0"""
+        match = re.match(r'([\d.]+)\s*GT/s', value)
+        return float(match.group(1)) if match else None
+
+    def _parse_width(self, value: str) -> Optional[int]:
+        """Parse a link width, "0" means the link is down"""
+        return int(value) if value.isdigit() else None
+
+    def format_link(self, speed: Optional[float], width: Optional[int]) -> str:
+        """Format a link as "Gen4 x16 (16.0 GT/s)" """
+        if speed is None or width is None:
+            return 'Unknown'
+        generation = PCIE_GENERATIONS.get(speed)
+        label = f"Gen{generation}" if generation else f"{speed:g} GT/s"
+        return f"{label} x{width}"
+
+    def _get_role(self, pci_class: str, device_path: str) -> str:
+        """Classify a device as GPU, NVMe, network or other"""
+        if pci_class.startswith('0x03'):
+            return 'GPU'
+        if pci_class.startswith('0x010802') or os.path.isdir(os.path.join(device_path, 'nvme')):
+            return 'NVMe'
+        if pci_class.startswith('0x02'):
+            return 'Network'
+        if pci_class.startswith('0x0106') or pci_class.startswith('0x0104') or pci_class.startswith('0x0107'):
+            return 'Storage Controller'
+        if pci_class.startswith('0x0604'):
+            return 'Bridge'
+        return 'Other'
+
+    def _get_identity(self, role: str, device_path: str) -> List[str]:
+        """Get the NVMe controllers or network interfaces behind a device"""
+        subdir = {'NVMe': 'nvme', 'Network': 'net'}.get(role)
+        if not subdir:
+            return []
+        try:
+            return sorted(os.listdir(os.path.join(device_path, subdir)))
+        except OSError:
+            return []
+
+    def get_links(self) -> List[Dict]:
+        """Walk every PCI device once and compare current and maximum links"""
+        links = []
+
+        try:
+            addresses = sorted(os.listdir(self.pci_path))
+        except OSError:
+            return links
+
+        for address in addresses:
+            device_path = os.path.join(self.pci_path, address)
+            attrs = read_attributes(device_path, [
+                'class', 'vendor', 'device', 'numa_node',
+                'current_link_speed', 'current_link_width',
+                'max_link_speed', 'max_link_width'
+            ])
+
+            # Devices without link attributes are integrated or not PCIe
+            if not attrs['max_link_speed']:
+                continue
+
+            current_speed = self._parse_speed(attrs['current_link_speed'])
+            current_width = self._parse_width(attrs['current_link_width'])
+            max_speed = self._parse_speed(attrs['max_link_speed'])
+            max_width = self._parse_width(attrs['max_link_width'])
+
+            speed_down = None not in (current_speed, max_speed) and current_speed < max_speed
+            width_down = None not in (current_width, max_width) and 0 < current_width < max_width
+
+            role = self._get_role(attrs['class'], device_path)
+            driver_link = os.path.join(device_path, 'driver')
+            numa_node = attrs['numa_node']
+
+            link = {
+                'address': address,
+                'role': role,
+                'vendor': attrs['vendor'],
+                'device': attrs['device'],
+                'driver': os.path.basename(os.readlink(driver_link)) if os.path.islink(driver_link) else 'None',
+                'identity': self._get_identity(role, device_path),
+                'numa_node': numa_node if numa_node and numa_node != '-1' else 'N/A',
+                'current_link': self.format_link(current_speed, current_width),
+                'max_link': self.format_link(max_speed, max_width),
+                'speed_downgraded': speed_down,
+                'width_downgraded': width_down,
+                'downgraded': speed_down or width_down,
+                'note': ''
+            }
+
+            # GPUs and some NICs drop the link speed when idle to save power
+            if speed_down and not width_down and role == 'GPU':
+                link['note'] = 'Speed may recover under load (ASPM/idle power saving)'
+            elif width_down:
+                link['note'] = 'Fewer lanes negotiated than supported (check slot/riser)'
+
+            links.append(link)
+
+        return links
+
+    def find_address(self, sysfs_path: str) -> Optional[str]:
+        """Get the closest PCI address in a resolved sysfs device path"""
+        for component in reversed(os.path.realpath(sysfs_path).split('/')):
+            if PCI_ADDRESS_RE.match(component):
+                return component
+        return None
+
+    def get_block_device_links(self, links: List[Dict], names: List[str]) -> Dict[str, Dict]:
+        """Map block device names to the link of the PCI device they sit behind"""
+        by_address = {link['address']: link for link in links}
+        mapping = {}
+
+        for name in names:
+            address = self.find_address(host_path(f'/sys/block/{name}'))
+            if address in by_address:
+                mapping[name] = by_address[address]
+
+        return mapping
+
+    def get_all_info(self) -> Dict:
+        """Get all PCIe link information"""
+        links = self.get_links()
+        return {
+            'links': links,
+            'downgraded': [link for link in links if link['downgraded']]
+        }
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary PCIe link information"""
+        if info is None:
+            info = self.get_all_info()
+        return {
+            'PCIe Links': str(len(info['links'])),
+            'Downgraded': str(len(info['downgraded']))
+        }
@@ -0,0 +1,301 @@
+"""
+Profiler Module
+Records collector, subprocess, sysfs batch and statvfs timings for --profile
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import threading
+import subprocess
+from typing import Callable, Dict, Optional
+
+from . import sysfs
+
+# Span categories in the order the breakdown shows them
+CATEGORIES = ['collector', 'subprocess', 'sysfs', 'statvfs']
+
+class Profiler:
+    """Handles timing instrumentation, installed only while enabled so it costs nothing otherwise"""
+
+    def __init__(self):
+        self.spans = []
+        self.enabled = False
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._patches = []
+        self._local = threading.local()
+        # RUSAGE_CHILDREN is process-wide, so a child's CPU time is only known when no other child overlapped it
+        self._children_running = 0
+        self._children_spawned = 0
+
+    def _record(self, category: str, name: str, start: float, end: float, cpu: Optional[float], args: Dict,
+                collector: Optional[str] = None):
+        """Store one finished span, tagged with the collector running in this thread unless one is given"""
+        if collector is None:
+            collector = getattr(self._local, 'collector', None)
+        with self._lock:
+            self.spans.append({
+                'category': category,
+                'name': name,
+                'start': start - self._start,
+                'duration': end - start,
+                'cpu': cpu,
+                'thread': threading.get_ident(),
+                'collector': collector if category != 'collector' else name,
+                'args': args
+            })
+
+    def _patch(self, owner, attribute: str, wrapper: Callable):
+        """Replace an attribute with a wrapper, remembering the original"""
+        original = getattr(owner, attribute)
+        self._patches.append((owner, attribute, original))
+        setattr(owner, attribute, wrapper(original))
+
+    def _wrap_popen(self, original):
+        """Time every child process from spawn to reap with command, exit code and child CPU time"""
+        profiler = self
+
+        class Popen(original):
+            def __init__(self, *args, **kwargs):
+                command = args[0] if args else kwargs.get('args', [])
+                self._profile_name = ' '.join(command) if isinstance(command, (list, tuple)) else str(command)
+                self._profile_collector = getattr(profiler._local, 'collector', None)
+                self._profile_done = False
+                with profiler._lock:
+                    self._profile_overlapped = profiler._children_running > 0
+                    self._profile_spawned = profiler._children_spawned
+                    profiler._children_running += 1
+                    profiler._children_spawned += 1
+                self._profile_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+                self._profile_start = time.perf_counter()
+                try:
+                    super().__init__(*args, **kwargs)
+                except Exception as e:
+                    self._profile_finish(type(e).__name__)
+                    raise
+
+            def _profile_finish(self, error: Optional[str] = None):
+                """Record the span once, when the child is reaped or failed to start"""
+                if self._profile_done:
+                    return
+                self._profile_done = True
+                end = time.perf_counter()
+                after = resource.getrusage(resource.RUSAGE_CHILDREN)
+                with profiler._lock:
+                    profiler._children_running -= 1
+                    overlapped = (self._profile_overlapped or profiler._children_running > 0
+                                  or profiler._children_spawned != self._profile_spawned + 1)
+                cpu = None
+                if not overlapped:
+                    cpu = ((after.ru_utime - self._profile_usage.ru_utime)
+                           + (after.ru_stime - self._profile_usage.ru_stime))
+                profiler._record('subprocess', self._profile_name, self._profile_start, end, cpu, {
+                    'exit_code': getattr(self, 'returncode', None) if error is None else None,
+                    'error': error
+                }, collector=self._profile_collector)
+
+            def poll(self):
+                result = super().poll()
+                if result is not None:
+                    self._profile_finish()
+                return result
+
+            def wait(self, timeout=None):
+                result = super().wait(timeout)
+                self._profile_finish()
+                return result
+
+        return Popen
+
+    def _wrap_thread_start(self, original):
+        """Carry the collector tag into threads a collector starts, such as bounded statvfs workers"""
+        profiler = self
+
+        def start(thread):
+            collector = getattr(profiler._local, 'collector', None)
+            if collector is not None:
+                run = thread.run
+
+                def tagged_run():
+                    profiler._local.collector = collector
+                    run()
+                thread.run = tagged_run
+            return original(thread)
+        return start
+
+    def _wrap_read_attributes(self, original):
+        """Time one batched sysfs read"""
+        def read_attributes(directory, names, *args, **kwargs):
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            try:
+                return original(directory, names, *args, **kwargs)
+            finally:
+                self._record('sysfs', directory, start, time.perf_counter(),
+                             time.thread_time() - cpu_start, {'attributes': len(names)})
+        return read_attributes
+
+    def _wrap_statvfs(self, original):
+        """Time statvfs, which is where a hung mount shows up"""
+        def statvfs(path):
+            start = time.perf_counter()
+            error = None
+            try:
+                return original(path)
+            except OSError as e:
+                error = e.strerror
+                raise
+            finally:
+                self._record('statvfs', str(path), start, time.perf_counter(), 0.0, {'error': error})
+        return statvfs
+
+    def _wrap_collector(self, name: str, original):
+        """Time a collector, tagging the spans recorded while it runs"""
+        def collect():
+            previous = getattr(self._local, 'collector', None)
+            self._local.collector = name
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            try:
+                return original()
+            finally:
+                self._record('collector', name, start, time.perf_counter(),
+                             time.thread_time() - cpu_start, {})
+                self._local.collector = previous
+        return collect
+
+    def _wrap_stream(self, name: str, original):
+        """Time a streaming collector from its first to its last part"""
+        def stream():
+            previous = getattr(self._local, 'collector', None)
+            start, cpu = time.perf_counter(), 0.0
+            try:
+                parts = original()
+                while True:
+                    # The tag and CPU clock only cover this thread while it produces a part
+                    self._local.collector = name
+                    cpu_start = time.thread_time()
+                    try:
+                        part = next(parts)
+                    except StopIteration:
+                        return
+                    finally:
+                        cpu += time.thread_time() - cpu_start
+                        self._local.collector = previous
+                    yield part
+            finally:
+                self._record('collector', name, start, time.perf_counter(), cpu, {'streamed': True})
+        return stream
+
+    def enable(self):
+        """Install the instrumentation"""
+        if self.enabled:
+            return
+        self.enabled = True
+        # run(), check_output() and friends all spawn through Popen
+        self._patch(subprocess, 'Popen', self._wrap_popen)
+        self._patch(threading.Thread, 'start', self._wrap_thread_start)
+        self._patch(os, 'statvfs', self._wrap_statvfs)
+
+        # Modules bind read_attributes at import, so patch every binding of it
+        original = sysfs.read_attributes
+        wrapper = self._wrap_read_attributes(original)
+        for module in list(sys.modules.values()):
+            if getattr(module, 'read_attributes', None) is original:
+                self._patches.append((module, 'read_attributes', original))
+                setattr(module, 'read_attributes', wrapper)
+
+    def instrument(self, registry):
+        """Time every collector of a registry"""
+        for collector in registry:
+            self._patch(collector, 'collect', lambda original, name=collector.name:
+                        self._wrap_collector(name, original))
+            if collector.stream:
+                self._patch(collector, 'stream', lambda original, name=collector.name:
+                            self._wrap_stream(name, original))
+
+    def disable(self):
+        """Restore everything that was patched"""
+        for owner, attribute, original in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches = []
+        self.enabled = False
+
+    def get_breakdown(self) -> Dict:
+        """Get collectors ranked by wall time with their subprocess and sysfs totals"""
+        with self._lock:
+            spans = list(self.spans)
+
+        collectors = {}
+        for span in spans:
+            name = span['collector'] or '(outside collectors)'
+            entry = collectors.setdefault(name, {
+                'name': name, 'calls': 0, 'wall': 0.0, 'cpu': 0.0,
+                'subprocess': 0, 'subprocess_time': 0.0, 'subprocess_cpu': 0.0, 'subprocess_overlapped': 0,
+                'sysfs': 0, 'sysfs_time': 0.0, 'statvfs': 0, 'statvfs_time': 0.0
+            })
+            if span['category'] == 'collector':
+                entry['calls'] += 1
+                entry['wall'] += span['duration']
+                entry['cpu'] += span['cpu']
+            else:
+                entry[span['category']] += 1
+                entry[f"{span['category']}_time"] += span['duration']
+                if span['category'] == 'subprocess':
+                    if span['cpu'] is None:
+                        entry['subprocess_overlapped'] += 1
+                    else:
+                        entry['subprocess_cpu'] += span['cpu']
+
+        for entry in collectors.values():
+            if not entry['calls']:
+                entry['wall'] = entry['subprocess_time'] + entry['sysfs_time'] + entry['statvfs_time']
+
+        return {
+            'collectors': sorted(collectors.values(), key=lambda entry: entry['wall'], reverse=True),
+            'subprocesses': sorted((span for span in spans if span['category'] == 'subprocess'),
+                                   key=lambda span: span['duration'], reverse=True),
+            'statvfs': sorted((span for span in spans if span['category'] == 'statvfs'),
+                              key=lambda span: span['duration'], reverse=True)
+        }
+
+    def write_trace(self, filename: str):
+        """Write the spans as a Chrome trace (chrome://tracing, Perfetto)"""
+        with self._lock:
+            spans = list(self.spans)
+
+        pid = os.getpid()
+        events = [{
+            'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+            'args': {'name': 'lxz'}
+        }]
+        for span in spans:
+            events.append({
+                'name': span['name'],
+                'cat': span['category'],
+                'ph': 'X',
+                'ts': round(span['start'] * 1e6, 3),
+                'dur': round(span['duration'] * 1e6, 3),
+                'pid': pid,
+                'tid': span['thread'],
+                'args': {'cpu_ms': round(span['cpu'] * 1000, 3) if span['cpu'] is not None else None,
+                         'collector': span['collector'], **span['args']}
+            })
+
+        with open(filename, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+_active: Optional[Profiler] = None
+
+def start() -> Profiler:
+    """Enable the process-wide profiler"""
+    global _active
+    if _active is None:
+        _active = Profiler()
+        _active.enable()
+    return _active
+
+def get_active() -> Optional[Profiler]:
+    """Get the process-wide profiler, None when profiling is off"""
+    return _active
@@ -0,0 +1,466 @@
+"""
+Collector Registry Module
+Describes report sections with cost, volatility and privilege metadata
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Estimated cost of one collection
+COST_CHEAP = 'cheap'            # sysfs/procfs reads only
+COST_EXPENSIVE = 'expensive'    # forks one or more subprocesses
+
+# How often the collected data changes
+VOLATILITY_STATIC = 'static'    # only changes with hardware
+VOLATILITY_BOOT = 'per-boot'    # changes with drivers/kernel, stable until reboot
+VOLATILITY_LIVE = 'live'        # changes while running
+
+# Seconds a result stays fresh, None means for the whole boot
+DEFAULT_TTL = {
+    VOLATILITY_STATIC: None,
+    VOLATILITY_BOOT: None,
+    VOLATILITY_LIVE: 2.0
+}
+
+def _has_serials(value) -> bool:
+    """Check whether a section holds serial numbers, which identify the machine and stay off disk"""
+    if isinstance(value, dict):
+        return any('serial' in str(key).lower() or _has_serials(item) for key, item in value.items())
+    if isinstance(value, list):
+        return any(_has_serials(item) for item in value)
+    return False
+
+class Collector:
+    """Describes one report section and how to collect it"""
+
+    def __init__(self, name: str, title: str, collect: Callable[[], Dict],
+                 cost: str = COST_CHEAP, volatility: str = VOLATILITY_LIVE,
+                 privileges: Optional[List[str]] = None,
+                 summary: Optional[Callable[[Optional[Dict]], Dict]] = None,
+                 ttl: Optional[float] = -1,
+                 stream: Optional[Callable[[], Iterator[Tuple[str, object]]]] = None,
+                 sampling: bool = False):
+        self.name = name
+        # Instance providing collect(), e.g. CPUInfo, when it is a bound method
+        self.source = getattr(collect, '__self__', None)
+        self.title = title
+        self.collect = collect
+        self.cost = cost
+        self.volatility = volatility
+        self.privileges = privileges or []
+        # Condenses the collected section, so callers pass the registry's data instead of collecting again
+        self.summary = summary
+        self.ttl = DEFAULT_TTL[volatility] if ttl == -1 else ttl
+        # Yields (key, value) as parts of the section complete, for progressive rendering
+        self.stream = stream
+        # Waits a sampling interval for rate deltas, only worth collecting when a view asks for it
+        self.sampling = sampling
+
+    def to_dict(self) -> Dict:
+        """Get the collector metadata"""
+        return {
+            'name': self.name,
+            'title': self.title,
+            'cost': self.cost,
+            'volatility': self.volatility,
+            'privileges': list(self.privileges),
+            'ttl': self.ttl,
+            'sampling': self.sampling
+        }
+
+class CollectorRegistry:
+    """Handles registered collectors and their cached results"""
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self.collectors = {}
+        self.cache_path = cache_path
+        self.boot_id = self._read_boot_id()
+        self.pci_devices = self._read_pci_devices()
+        self._cache = {}
+        self._locks = {}
+        self._disk_cache = self._load_disk_cache()
+
+    def _read_boot_id(self) -> str:
+        """Get the kernel boot id used to invalidate per-boot results"""
+        try:
+            with open('/proc/sys/kernel/random/boot_id') as f:
+                return f.read().strip()
+        except Exception:
+            return ''
+
+    def _read_pci_devices(self) -> List[str]:
+        """Get the PCI device addresses, which change with hot-plug without a reboot"""
+        try:
+            return sorted(os.listdir('/sys/bus/pci/devices'))
+        except OSError:
+            return []
+
+    def _load_disk_cache(self) -> Dict:
+        """Load persisted results from this boot and PCI device list"""
+        if not self.cache_path or not self.boot_id:
+            return {}
+
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+            if (cache.get('boot_id') == self.boot_id and cache.get('euid') == os.geteuid()
+                    and cache.get('pci_devices') == self.pci_devices):
+                return cache.get('sections', {})
+        except Exception:
+            pass
+
+        return {}
+
+    def _save_disk_cache(self):
+        """Persist expensive results that stay valid for the whole boot"""
+        if not self.cache_path or not self.boot_id:
+            return
+
+        sections = {}
+        for name, (_, value) in list(self._cache.items()):
+            collector = self.collectors.get(name)
+            if collector and collector.ttl is None and collector.cost == COST_EXPENSIVE and not _has_serials(value):
+                sections[name] = value
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), mode=0o700, exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            # Readable by the owner only, the sections describe the machine in detail
+            with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+                json.dump({'boot_id': self.boot_id, 'euid': os.geteuid(), 'pci_devices': self.pci_devices,
+                           'sections': sections}, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception:
+            pass
+
+    def register(self, collector: Collector):
+        """Register a collector, replacing one with the same name"""
+        self.collectors[collector.name] = collector
+        self._locks[collector.name] = threading.Lock()
+        self._cache.pop(collector.name, None)
+
+    def get(self, name: str) -> Collector:
+        """Get a registered collector"""
+        return self.collectors[name]
+
+    def names(self) -> List[str]:
+        """Get collector names in registration order"""
+        return list(self.collectors)
+
+    def __iter__(self):
+        return iter(list(self.collectors.values()))
+
+    def missing_privileges(self, name: str) -> List[str]:
+        """Get privileges a collector needs but the process lacks"""
+        missing = []
+        for privilege in self.collectors[name].privileges:
+            if privilege == 'root' and os.geteuid() != 0:
+                missing.append(privilege)
+        return missing
+
+    def is_fresh(self, name: str) -> bool:
+        """Check whether a cached result can be used without collecting"""
+        collector = self.collectors[name]
+        cached = self._cache.get(name)
+        if cached is None:
+            return name in self._disk_cache
+        if collector.ttl is None:
+            return True
+        return time.monotonic() - cached[0] < collector.ttl
+
+    def get_timestamp(self, name: str) -> Optional[float]:
+        """Get the monotonic time a cached result was collected"""
+        cached = self._cache.get(name)
+        return cached[0] if cached else None
+
+    def get_cached(self, name: str) -> Optional[Dict]:
+        """Get a cached result regardless of its age"""
+        cached = self._cache.get(name)
+        return cached[1] if cached else self._disk_cache.get(name)
+
+    def get_data(self, name: str, refresh: bool = False) -> Dict:
+        """Get a section, collecting it only when the cached result is stale"""
+        with self._locks[name]:
+            if not refresh and self.is_fresh(name):
+                if name not in self._cache:
+                    self._cache[name] = (time.monotonic(), self._disk_cache[name])
+                return self._cache[name][1]
+
+            collector = self.collectors[name]
+            value = collector.collect()
+            self._cache[name] = (time.monotonic(), value)
+
+        if collector.ttl is None and collector.cost == COST_EXPENSIVE:
+            self._save_disk_cache()
+        return value
+
+    def stream_data(self, name: str, refresh: bool = False) -> Iterator[Tuple[str, object]]:
+        """Yield a section key by key as it is collected, or all at once when cached"""
+        collector = self.collectors[name]
+        if collector.stream is None:
+            yield from self.get_data(name, refresh).items()
+            return
+
+        with self._locks[name]:
+            if not refresh and self.is_fresh(name):
+                if name not in self._cache:
+                    self._cache[name] = (time.monotonic(), self._disk_cache[name])
+                yield from list(self._cache[name][1].items())
+                return
+
+            value = {}
+            for key, part in collector.stream():
+                value[key] = part
+                yield key, part
+            self._cache[name] = (time.monotonic(), value)
+
+        if collector.ttl is None and collector.cost == COST_EXPENSIVE:
+            self._save_disk_cache()
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop cached results for one collector or all of them"""
+        names = [name] if name else self.names()
+        for key in names:
+            self._cache.pop(key, None)
+            self._disk_cache.pop(key, None)
+
+    def plan(self, names: Optional[List[str]] = None) -> List[str]:
+        """Get stale collectors ordered cheapest and most volatile first"""
+        cost_order = {COST_CHEAP: 0, COST_EXPENSIVE: 1}
+        volatility_order = {VOLATILITY_LIVE: 0, VOLATILITY_BOOT: 1, VOLATILITY_STATIC: 2}
+
+        stale = [name for name in (names or self.names()) if not self.is_fresh(name)]
+        return sorted(
+            stale,
+            key=lambda name: (cost_order.get(self.collectors[name].cost, 1),
+                              volatility_order.get(self.collectors[name].volatility, 0))
+        )
+
+    def collect_all(self, names: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Get every section, keyed by collector name in registration order"""
+        return {name: self.get_data(name) for name in (names or self.names())}
+
+class Prefetcher:
+    """Handles collecting stale sections in the background while the UI waits for input"""
+
+    def __init__(self, registry: CollectorRegistry, names: Optional[List[str]] = None):
+        self.registry = registry
+        self.names = names
+        self.uses = {}
+        # Age in seconds of stale data handed to a view while it refreshes
+        self.ages = {}
+        self._stop = threading.Event()
+        self._thread = None
+        # Refresh threads still running, keyed by section
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+    def order(self) -> List[str]:
+        """Get stale sections to collect in the background, cheap ones first and then the most opened"""
+        # Privileged collectors would prompt for a sudo password from this thread and fight the menu for the TTY,
+        # sampling collectors would sleep through every menu redraw
+        names = [name for name in self.registry.plan(self.names)
+                 if not self.registry.missing_privileges(name) and not self.registry.get(name).sampling]
+        with self._lock:
+            uses = dict(self.uses)
+        # plan() is already ordered by volatility, the stable sort keeps that within each group
+        return sorted(names, key=lambda name: (self.registry.get(name).cost != COST_CHEAP, -uses.get(name, 0)))
+
+    def _run(self):
+        """Collect one pass of stale sections until stopped"""
+        for name in self.order():
+            if self._stop.is_set():
+                return
+            try:
+                self.registry.get_data(name)
+            except Exception:
+                pass
+
+    def start(self):
+        """Start a prefetch pass unless one is still running"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        # Daemon threads, so a collector stuck in a subprocess never delays exit
+        self._thread = threading.Thread(target=self._run, name='prefetch', daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = False):
+        """Cancel the pass after the section being collected, optionally waiting for it and for running refreshes"""
+        self._stop.set()
+        if not wait:
+            return
+        if self._thread and self._thread.is_alive():
+            self._thread.join()
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join()
+
+    def refresh(self, name: str):
+        """Collect one section again in the background"""
+        # A sudo prompt from a background thread would fight the menu for the TTY
+        if self.registry.missing_privileges(name):
+            return
+
+        def worker():
+            try:
+                self.registry.get_data(name, refresh=True)
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.pop(name, None)
+
+        with self._lock:
+            if name in self._refreshing:
+                return
+            thread = threading.Thread(target=worker, name=f'refresh-{name}', daemon=True)
+            self._refreshing[name] = thread
+        thread.start()
+
+    def get(self, name: str) -> Dict:
+        """Get a section for a view, showing stale expensive data at once and refreshing it behind the view"""
+        collector = self.registry.get(name)
+        with self._lock:
+            self.uses[name] = self.uses.get(name, 0) + 1
+            self.ages.pop(name, None)
+        if (collector.cost == COST_CHEAP or collector.sampling or self.registry.is_fresh(name)
+                or self.registry.get_cached(name) is None or self.registry.missing_privileges(name)):
+            # Waits on the section lock when the prefetch pass is collecting it right now
+            return self.registry.get_data(name)
+
+        timestamp = self.registry.get_timestamp(name)
+        if timestamp is not None:
+            with self._lock:
+                self.ages[name] = time.monotonic() - timestamp
+        self.refresh(name)
+        return self.registry.get_cached(name)
+
+    def wait_refresh(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Wait for the background refresh of a section, True once none is running"""
+        with self._lock:
+            thread = self._refreshing.get(name)
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def get_age(self, name: str) -> Optional[float]:
+        """Get the age of the stale data the last get() returned, None when it was current"""
+        with self._lock:
+            return self.ages.get(name)
+
+    def stream(self, name: str) -> Iterator[Tuple[str, object]]:
+        """Like get(), but yields the section key by key when it has to be collected now"""
+        if self.registry.get_cached(name) is not None:
+            yield from self.get(name).items()
+            return
+        with self._lock:
+            self.uses[name] = self.uses.get(name, 0) + 1
+        yield from self.registry.stream_data(name)
+
+def create_default_registry(inventory=None, cache_path: Optional[str] = None) -> CollectorRegistry:
+    """Create a registry with the built-in hardware collectors"""
+    from .cpu import CPUInfo
+    from .memory import MemoryInfo
+    from .storage import StorageInfo
+    from .gpu import GPUInfo
+    from .sensors import SensorInfo
+    from .pcie import PCIeInfo
+    from .nvme import NVMeInfo
+    from .blockqueue import BlockQueueInfo
+    from .interrupts import InterruptInfo
+    from .cgroups import CgroupInfo
+    from .mitigations import MitigationInfo
+    from .cpufreq import FrequencyPolicyInfo
+    from .sysctl import SysctlInfo
+    from .isolation import IsolationInfo
+
+    cpu_info = CPUInfo()
+    memory_info = MemoryInfo()
+    storage_info = StorageInfo(inventory=inventory)
+    gpu_info = GPUInfo(inventory=inventory)
+    sensor_info = SensorInfo()
+    pcie_info = PCIeInfo()
+    nvme_info = NVMeInfo()
+    blockqueue_info = BlockQueueInfo()
+    interrupt_info = InterruptInfo()
+    cgroup_info = CgroupInfo()
+    mitigation_info = MitigationInfo()
+    frequency_policy_info = FrequencyPolicyInfo()
+    sysctl_info = SysctlInfo()
+    isolation_info = IsolationInfo(interrupt_info)
+
+    registry = CollectorRegistry(cache_path=cache_path)
+    # lscpu runs once per instance, later collections only re-read the frequency from sysfs
+    registry.register(Collector(
+        'cpu', 'CPU Information', cpu_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=cpu_info.get_summary
+    ))
+    registry.register(Collector(
+        'memory', 'Memory (RAM) Information', memory_info.get_all_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_LIVE, privileges=['root'],
+        summary=memory_info.get_summary
+    ))
+    registry.register(Collector(
+        'storage', 'Storage Devices', storage_info.get_all_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_LIVE, summary=storage_info.get_summary,
+        stream=storage_info.stream_info
+    ))
+    registry.register(Collector(
+        'gpu', 'GPU Information', gpu_info.get_all_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_BOOT, summary=gpu_info.get_summary,
+        stream=gpu_info.stream_info
+    ))
+    registry.register(Collector(
+        'motherboard', 'Motherboard & BIOS', memory_info.get_motherboard_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_STATIC, privileges=['root']
+    ))
+    registry.register(Collector(
+        'sensors', 'Sensors & Hardware Monitor', sensor_info.get_all_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_LIVE
+    ))
+    # Only procfs reads, but the first sample waits one interval for the deltas
+    registry.register(Collector(
+        'interrupts', 'Interrupts & IRQ Affinity', interrupt_info.get_all_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_LIVE, summary=interrupt_info.get_summary, sampling=True
+    ))
+    registry.register(Collector(
+        'cgroup', 'Cgroup & Container Limits', cgroup_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=cgroup_info.get_summary
+    ))
+    registry.register(Collector(
+        'mitigations', 'CPU Vulnerabilities & Mitigations', mitigation_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_BOOT, summary=mitigation_info.get_summary
+    ))
+    registry.register(Collector(
+        'cpufreq', 'CPU Frequency Policy', frequency_policy_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=frequency_policy_info.get_summary
+    ))
+    registry.register(Collector(
+        'sysctl', 'Kernel Tunables (sysctl & THP)', sysctl_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=sysctl_info.get_summary
+    ))
+    # Shares the interrupt sampler and waits one interval for thread CPU time
+    registry.register(Collector(
+        'isolation', 'CPU Isolation Audit', isolation_info.get_all_info,
+        cost=COST_EXPENSIVE, volatility=VOLATILITY_LIVE, summary=isolation_info.get_summary, sampling=True
+    ))
+    registry.register(Collector(
+        'pcie', 'PCIe Link Health', pcie_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=pcie_info.get_summary
+    ))
+    registry.register(Collector(
+        'nvme', 'NVMe Controllers', nvme_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=nvme_info.get_summary
+    ))
+    registry.register(Collector(
+        'blockqueue', 'Block Queue Tuning', blockqueue_info.get_all_info,
+        cost=COST_CHEAP, volatility=VOLATILITY_LIVE, summary=blockqueue_info.get_summary
+    ))
+
+    return registry
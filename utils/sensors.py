@@ -1,18 +1,31 @@
 """
 Sensors Information Module
-Gathers temperature, fan, and power information
+Gathers temperature, fan, voltage, current and power information
 """
 
 import subprocess
 import os
-import re
 from typing import Dict, List
 
+from .sysfs import host_path
+from .hwmon import HwmonScanner, format_value, parse_sensors_json
+
+# (data key, hwmon channel type)
+SECTIONS = [
+    ('temperatures', 'temp'),
+    ('fans', 'fan'),
+    ('voltages', 'in'),
+    ('currents', 'curr'),
+    ('power', 'power'),
+    ('energy', 'energy')
+]
+
 class SensorInfo:
     """Handles sensor information gathering"""
     
     def __init__(self):
         self.sensors_available = self._check_command("sensors")
+        self.hwmon = HwmonScanner()
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available"""
@@ -35,7 +48,7 @@ class SensorInfo:
         temps = {}
         
         try:
-            thermal_path = "/sys/class/thermal"
+            thermal_path = host_path("/sys/class/thermal")
             if os.path.exists(thermal_path):
                 for zone in os.listdir(thermal_path):
                     if zone.startswith('thermal_zone'):
@@ -61,97 +74,50 @@ class SensorInfo:
         
         return temps
     
-    def _get_hwmon_temps(self) -> Dict[str, str]:
-        """Get temperature from hwmon"""
-        temps = {}
+    def sample(self) -> Dict[str, float]:
+        """Take one numeric sample of temperatures, fans, power and CPU frequencies from sysfs"""
+        values = {}
+        
+        for name, temp in self._get_thermal_zones().items():
+            values[f"temp:{name}"] = float(temp.replace('°C', ''))
+        # Energy counters only grow, their rate is the power channel
+        for channel in self.hwmon.read():
+            if channel['value'] is not None and channel['type'] != 'energy':
+                values[f"{channel['type']}:{channel['name']}"] = channel['value']
         
         try:
-            hwmon_path = "/sys/class/hwmon"
-            if os.path.exists(hwmon_path):
-                for hwmon in os.listdir(hwmon_path):
-                    hwmon_dir = os.path.join(hwmon_path, hwmon)
-                    
-                    # Get device name
-                    name_file = os.path.join(hwmon_dir, 'name')
-                    device_name = hwmon
-                    if os.path.exists(name_file):
-                        with open(name_file) as f:
-                            device_name = f.read().strip()
-                    
-                    # Find temperature inputs
-                    for item in os.listdir(hwmon_dir):
-                        if item.startswith('temp') and item.endswith('_input'):
-                            temp_file = os.path.join(hwmon_dir, item)
-                            label_file = os.path.join(hwmon_dir, item.replace('_input', '_label'))
-                            
-                            try:
-                                with open(temp_file) as f:
-                                    temp = int(f.read().strip()) / 1000.0
-                                
-                                # Get label if available
-                                label = item.replace('_input', '')
-                                if os.path.exists(label_file):
-                                    with open(label_file) as f:
-                                        label = f.read().strip()
-                                
-                                sensor_name = f"{device_name} - {label}"
-                                temps[sensor_name] = f"{temp:.1f}°C"
-                            except Exception:
-                                continue
+            cpu_path = host_path("/sys/devices/system/cpu")
+            for cpu in os.listdir(cpu_path):
+                freq_file = os.path.join(cpu_path, cpu, 'cpufreq', 'scaling_cur_freq')
+                if cpu[3:].isdigit() and os.path.exists(freq_file):
+                    with open(freq_file) as f:
+                        values[f"freq:{cpu}"] = int(f.read().strip()) / 1000.0  # MHz
         except Exception:
             pass
         
-        return temps
+        return values
     
-    def _get_lm_sensors_info(self) -> Dict:
-        """Get information from lm-sensors"""
-        data = {
-            'temperatures': {},
-            'fans': {}
-        }
-        
+    def get_sample_limits(self) -> Dict[str, Dict[str, float]]:
+        """Get limits keyed by sample channel name"""
+        limits = {}
+        for channel in self.hwmon.index():
+            limit = {key: channel['limits'][key] for key in ['max', 'crit'] if key in channel['limits']}
+            if limit and channel['type'] in ('temp', 'power'):
+                limits[f"{channel['type']}:{channel['name']}"] = limit
+        return limits
+    
+    def _get_lm_sensors_channels(self) -> List[Dict]:
+        """Get channels from lm-sensors JSON output"""
         if not self.sensors_available:
-            return data
-        
-        try:
-            output = self._run_command(['sensors'])
-            
-            current_adapter = None
-            for line in output.split('\n'):
-                line = line.strip()
-                
-                if not line or line.startswith('Adapter:'):
-                    continue
-                
-                # Parse sensor line
-                if ':' in line:
-                    parts = line.split(':')
-                    sensor_name = parts[0].strip()
-                    sensor_value = parts[1].strip()
-                    
-                    # Temperature
-                    if '°C' in sensor_value:
-                        # Extract temperature value
-                        temp_match = re.search(r'[+-]?\d+\.\d+°C', sensor_value)
-                        if temp_match:
-                            data['temperatures'][sensor_name] = temp_match.group()
-                    
-                    # Fan speed
-                    elif 'RPM' in sensor_value:
-                        rpm_match = re.search(r'\d+\s*RPM', sensor_value)
-                        if rpm_match:
-                            data['fans'][sensor_name] = rpm_match.group()
-        except Exception:
-            pass
-        
-        return data
+            return []
+        return parse_sensors_json(self._run_command(['sensors', '-j']))
     
     def _get_battery_info(self) -> Dict:
         """Get battery information if available"""
         battery = {}
         
         try:
-            power_supply_path = "/sys/class/power_supply"
+            power_supply_path = host_path("/sys/class/power_supply")
             if os.path.exists(power_supply_path):
                 for device in os.listdir(power_supply_path):
                     if device.startswith('BAT'):
@@ -201,26 +167,37 @@ class SensorInfo:
         """Get all sensor information"""
         data = {}
         
-        # Try lm-sensors first
-        lm_data = self._get_lm_sensors_info()
-        
-        if lm_data['temperatures']:
-            data['temperatures'] = lm_data['temperatures']
-        else:
-            # Fallback to thermal zones and hwmon
+        # Native hwmon first, lm-sensors costs a fork and only helps where sysfs is hidden
+        channels = self.hwmon.read()
+        source = 'hwmon'
+        if not channels:
+            channels = self._get_lm_sensors_channels()
+            source = 'lm-sensors'
+        
+        if channels:
+            data['source'] = source
+            data['channels'] = channels
+        
+        for key, kind in SECTIONS:
+            values = {channel['name']: format_value(channel) for channel in channels
+                      if channel['type'] == kind and channel['value'] is not None}
+            if values:
+                data[key] = values
+        
+        limits = {channel['name']: channel['limits'] for channel in channels
+                  if channel['type'] == 'temp' and channel['limits']}
+        if limits and data.get('temperatures'):
+            data['limits'] = limits
+        
+        # ACPI thermal zones when no hwmon temperature is visible
+        if not data.get('temperatures'):
             thermal_temps = self._get_thermal_zones()
-            hwmon_temps = self._get_hwmon_temps()
-            
-            # Merge temperature sources
-            all_temps = {}
-            all_temps.update(thermal_temps)
-            all_temps.update(hwmon_temps)
-            
-            if all_temps:
-                data['temperatures'] = all_temps
-        
-        if lm_data['fans']:
-            data['fans'] = lm_data['fans']
+            if thermal_temps:
+                data['temperatures'] = thermal_temps
+        
+        alarms = [f"{channel['name']}: {', '.join(channel['alarms'])}" for channel in channels if channel['alarms']]
+        if alarms:
+            data['alarms'] = alarms
         
         # Battery information
         battery_info = self._get_battery_info()
@@ -243,6 +220,12 @@ class SensorInfo:
             fan_count = len(info['fans'])
             summary['Fans Detected'] = str(fan_count)
         
+        if info.get('power'):
+            summary['Power Sensors'] = str(len(info['power']))
+        
+        if info.get('alarms'):
+            summary['Alarms'] = str(len(info['alarms']))
+        
         if info.get('battery'):
             summary['Battery'] = info['battery'].get('Capacity', 'Unknown')
         
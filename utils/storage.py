@@ -6,13 +6,20 @@ Gathers detailed storage device and partition information
 import subprocess
 import os
 import re
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .sysfs import read_attributes, host_path
+from .mounts import MountScanner
 
 class StorageInfo:
     """Handles storage information gathering"""
     
-    def __init__(self):
+    def __init__(self, inventory=None):
         self.lsblk_available = self._check_command("lsblk")
+        self.inventory = inventory
+        self._devices_cache = None
+        self._devices_generation = None
+        self.mount_scanner = MountScanner()
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available"""
@@ -82,88 +89,69 @@ class StorageInfo:
         devices = []
         
         try:
-            for device in os.listdir('/sys/block'):
+            for device in os.listdir(host_path('/sys/block')):
                 if device.startswith('sd') or device.startswith('nvme') or device.startswith('vd'):
-                    device_path = f'/sys/block/{device}'
-                    
-                    # Get size
-                    size = 0
-                    size_file = os.path.join(device_path, 'size')
-                    if os.path.exists(size_file):
-                        with open(size_file) as f:
-                            size = int(f.read().strip()) * 512  # Sectors to bytes
+                    device_path = host_path(f'/sys/block/{device}')
                     
-                    # Check if removable
-                    removable = 'No'
-                    removable_file = os.path.join(device_path, 'removable')
-                    if os.path.exists(removable_file):
-                        with open(removable_file) as f:
-                            removable = 'Yes' if f.read().strip() == '1' else 'No'
+                    # One batched pass per directory instead of open/read/close per file
+                    attrs = read_attributes(device_path, ['size', 'removable', 'ro'])
+                    queue = read_attributes(os.path.join(device_path, 'queue'), ['rotational'])
+                    model = read_attributes(os.path.join(device_path, 'device'), ['model'])['model']
                     
-                    # Check if rotational (SSD vs HDD)
-                    is_ssd = True
-                    rotational_file = os.path.join(device_path, 'queue/rotational')
-                    if os.path.exists(rotational_file):
-                        with open(rotational_file) as f:
-                            is_ssd = f.read().strip() == '0'
+                    size = int(attrs['size']) * 512 if attrs['size'].isdigit() else 0  # Sectors to bytes
+                    removable = 'Yes' if attrs['removable'] == '1' else 'No'
+                    is_ssd = queue['rotational'] != '1'
                     
                     devices.append({
                         'name': device,
                         'path': f'/dev/{device}',
                         'size': self._format_bytes(size),
                         'type': 'SSD' if is_ssd else 'HDD',
-                        'model': 'Unknown',
+                        'model': model or 'Unknown',
                         'removable': removable,
-                        'readonly': 'No'
+                        'readonly': 'Yes' if attrs['ro'] == '1' else 'No'
                     })
         except Exception:
             pass
         
         return devices
     
-    def _get_partitions(self) -> List[Dict]:
-        """Get partition and filesystem information"""
-        partitions = []
+    def _format_partition(self, mount: Dict) -> Dict:
+        """Format one mount scanner entry for display"""
+        partition = {
+            'device': mount['device'],
+            'mountpoint': mount['mountpoint'],
+            'fstype': mount['fstype'],
+            'options': mount['options'],
+            'backing': mount['backing'],
+            'status': mount['status'],
+            'issues': mount['issues']
+        }
         
-        try:
-            # Read /proc/mounts for mounted filesystems
-            with open('/proc/mounts') as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        device = parts[0]
-                        mountpoint = parts[1]
-                        fstype = parts[2]
-                        
-                        # Skip non-disk filesystems
-                        if not device.startswith('/dev/'):
-                            continue
-                        if fstype in ['tmpfs', 'devtmpfs', 'proc', 'sysfs', 'cgroup', 'cgroup2']:
-                            continue
-                        
-                        # Get partition size and usage
-                        try:
-                            stat = os.statvfs(mountpoint)
-                            size = stat.f_blocks * stat.f_frsize
-                            free = stat.f_bfree * stat.f_frsize
-                            used = size - free
-                            percent = (used / size * 100) if size > 0 else 0
-                            
-                            partitions.append({
-                                'device': device,
-                                'mountpoint': mountpoint,
-                                'fstype': fstype,
-                                'size': self._format_bytes(size),
-                                'used': self._format_bytes(used),
-                                'free': self._format_bytes(free),
-                                'percent': f"{percent:.1f}%"
-                            })
-                        except Exception:
-                            continue
-        except Exception:
-            pass
+        if mount['status'] == 'ok':
+            inodes = mount['inodes_percent']
+            partition.update({
+                'size': self._format_bytes(mount['size_bytes']),
+                'used': self._format_bytes(mount['used_bytes']),
+                'free': self._format_bytes(mount['free_bytes']),
+                'percent': f"{mount['percent']:.1f}%",
+                'inodes': f"{inodes:.1f}%" if inodes is not None else 'N/A'
+            })
+        else:
+            # Keep hung or failing mounts visible instead of dropping them
+            partition.update({
+                'size': 'N/A',
+                'used': 'N/A',
+                'free': 'N/A',
+                'percent': mount['status'],
+                'inodes': 'N/A'
+            })
         
-        return partitions
+        return partition
+    
+    def _get_partitions(self) -> List[Dict]:
+        """Get partition and filesystem information"""
+        return [self._format_partition(mount) for mount in self.mount_scanner.scan()]
     
     def _get_smart_info(self, device: str) -> Dict:
         """Get SMART information for a device"""
@@ -186,18 +174,42 @@ class StorageInfo:
         
         return smart_info
     
+    def _get_cached_block_devices(self) -> List[Dict]:
+        """Get block devices, re-scanning only after a hot-plug event"""
+        if self.inventory is None or not self.inventory.is_active():
+            return self._get_block_devices()
+        
+        generation = self.inventory.get_generation('block')
+        if self._devices_cache is None or generation != self._devices_generation:
+            self._devices_cache = self._get_block_devices()
+            self._devices_generation = generation
+        
+        return [dict(device) for device in self._devices_cache]
+    
+    def stream_info(self) -> Iterator[Tuple[str, object]]:
+        """Yield the device list, then the partition list again each time a mount's statvfs returns"""
+        yield 'devices', self._get_cached_block_devices()
+        
+        partitions = {}
+        for index, mount in self.mount_scanner.iter_scan():
+            partitions[index] = self._format_partition(mount)
+            yield 'partitions', [partitions[key] for key in sorted(partitions)]
+        if not partitions:
+            yield 'partitions', []
+    
     def get_all_info(self) -> Dict:
         """Get all storage information"""
         data = {
-            'devices': self._get_block_devices(),
+            'devices': self._get_cached_block_devices(),
             'partitions': self._get_partitions()
         }
         
         return data
     
-    def get_summary(self) -> Dict:
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
         """Get summary storage information"""
-        info = self.get_all_info()
+        if info is None:
+            info = self.get_all_info()
         
         total_devices = len(info.get('devices', []))
         device_types = {}
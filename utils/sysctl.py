@@ -0,0 +1,190 @@
+"""
+Sysctl Module
+Audits memory, scheduler and network sysctls and the transparent hugepage mode against workload profiles
+"""
+
+from typing import Dict, List, Optional
+
+from .sysfs import host_path, read_attributes
+
+SYSCTL_KEYS = [
+    'vm.swappiness',
+    'vm.dirty_ratio',
+    'vm.dirty_background_ratio',
+    'vm.dirty_bytes',
+    'vm.dirty_background_bytes',
+    'vm.dirty_expire_centisecs',
+    'vm.dirty_writeback_centisecs',
+    'vm.zone_reclaim_mode',
+    'vm.overcommit_memory',
+    'vm.min_free_kbytes',
+    'vm.max_map_count',
+    'vm.nr_hugepages',
+    'kernel.numa_balancing',
+    'kernel.sched_autogroup_enabled',
+    'net.core.somaxconn',
+    'net.core.netdev_max_backlog',
+    'net.core.rmem_max',
+    'net.core.wmem_max',
+    'net.core.busy_read',
+    'net.core.busy_poll',
+    'net.ipv4.tcp_rmem',
+    'net.ipv4.tcp_wmem',
+    'net.ipv4.tcp_max_syn_backlog',
+    'net.ipv4.tcp_congestion_control',
+    'net.ipv4.tcp_slow_start_after_idle',
+    'fs.file-max'
+]
+
+# Defaults the kernel scales with usable memory, so they differ between otherwise identical hosts
+AUTO_SCALED_KEYS = ['fs.file-max', 'vm.min_free_kbytes', 'net.ipv4.tcp_rmem', 'net.ipv4.tcp_wmem',
+                    'net.ipv4.tcp_max_syn_backlog']
+
+# Transparent hugepage files under /sys/kernel/mm/transparent_hugepage, reported as thp.<name>
+THP_KEYS = {
+    'thp.enabled': 'enabled',
+    'thp.defrag': 'defrag',
+    'thp.khugepaged_defrag': 'khugepaged/defrag'
+}
+
+# Rules check one setting against a set of allowed values or a numeric min/max
+COMMON_RULES = [
+    {'setting': 'vm.zone_reclaim_mode', 'expect': ['0'],
+     'reason': "Reclaiming the local node before using remote memory stalls allocations and thrashes the page cache"},
+]
+
+PROFILES = {
+    'throughput': COMMON_RULES + [
+        {'setting': 'vm.swappiness', 'max': 10,
+         'reason': "Anonymous memory of busy workers gets swapped out in favour of page cache"},
+        {'setting': 'vm.dirty_ratio', 'min': 20,
+         'reason': "Writers are throttled early, batching large writes needs a bigger dirty budget"},
+        {'setting': 'thp.enabled', 'expect': ['always', 'madvise'],
+         'reason': "Large working sets lose TLB reach without huge pages"},
+        {'setting': 'net.core.somaxconn', 'min': 4096,
+         'reason': "A short accept queue drops connections under bursts"},
+        {'setting': 'net.core.rmem_max', 'min': 16777216,
+         'reason': "Socket buffers below 16 MB cap TCP windows on fast, long links"},
+        {'setting': 'net.core.wmem_max', 'min': 16777216,
+         'reason': "Socket buffers below 16 MB cap TCP windows on fast, long links"},
+        {'setting': 'net.ipv4.tcp_slow_start_after_idle', 'expect': ['0'],
+         'reason': "Idle keep-alive connections restart from a small congestion window"},
+    ],
+    'low-latency': COMMON_RULES + [
+        {'setting': 'vm.swappiness', 'max': 10,
+         'reason': "A swapped-out page costs a major fault on the request path"},
+        {'setting': 'vm.dirty_ratio', 'max': 10,
+         'reason': "Large dirty budgets flush in bursts that stall writers"},
+        {'setting': 'kernel.numa_balancing', 'expect': ['0'],
+         'reason': "Page migration and its hinting faults add latency spikes to pinned workloads"},
+        {'setting': 'thp.enabled', 'expect': ['madvise', 'never'],
+         'reason': "khugepaged collapses and compaction run behind every process"},
+        {'setting': 'thp.defrag', 'expect': ['defer', 'defer+madvise', 'madvise', 'never'],
+         'reason': "Synchronous compaction on fault stalls allocations for milliseconds"},
+        {'setting': 'net.core.busy_read', 'min': 50,
+         'reason': "Busy polling trades CPU for lower receive latency"},
+        {'setting': 'net.core.busy_poll', 'min': 50,
+         'reason': "Busy polling trades CPU for lower receive latency"},
+    ],
+    'database': COMMON_RULES + [
+        {'setting': 'vm.swappiness', 'max': 10,
+         'reason': "Swapping the buffer pool is worse than dropping page cache"},
+        {'setting': 'vm.dirty_background_ratio', 'max': 5,
+         'reason': "Background writeback starts too late and checkpoints hit a wall of dirty pages"},
+        {'setting': 'vm.dirty_ratio', 'max': 15,
+         'reason': "Large dirty budgets flush in bursts that stall commits"},
+        {'setting': 'thp.enabled', 'expect': ['madvise', 'never'],
+         'reason': "PostgreSQL, MongoDB, Redis and Oracle recommend against always-on THP: latency spikes and bloat"},
+        {'setting': 'thp.defrag', 'expect': ['defer', 'defer+madvise', 'madvise', 'never'],
+         'reason': "Synchronous compaction on fault stalls queries"},
+        {'setting': 'kernel.numa_balancing', 'expect': ['0'],
+         'reason': "Migrating shared buffers between nodes costs more than it saves for large shared memory"},
+        {'setting': 'vm.max_map_count', 'min': 262144,
+         'reason': "Memory-mapped storage engines run out of mappings"},
+        {'setting': 'net.core.somaxconn', 'min': 1024,
+         'reason': "Connection storms overflow a short accept queue"},
+    ]
+}
+
+class SysctlInfo:
+    """Handles sysctl and transparent hugepage auditing"""
+
+    def __init__(self, profile: str = 'throughput'):
+        self.proc_sys_path = host_path('/proc/sys')
+        self.thp_path = host_path('/sys/kernel/mm/transparent_hugepage')
+        self.profile = profile
+
+    def _get_selected(self, value: str) -> str:
+        """Get the active mode from "always [madvise] never" """
+        for token in value.split():
+            if token.startswith('[') and token.endswith(']'):
+                return token[1:-1]
+        return value
+
+    def get_values(self) -> Dict[str, str]:
+        """Read every audited setting, one directory fd for /proc/sys and one for THP"""
+        paths = {key: key.replace('.', '/') for key in SYSCTL_KEYS}
+        raw = read_attributes(self.proc_sys_path, list(paths.values()))
+        values = {key: ' '.join(raw[path].split()) for key, path in paths.items()}
+
+        thp = read_attributes(self.thp_path, list(THP_KEYS.values()))
+        for key, name in THP_KEYS.items():
+            values[key] = self._get_selected(thp[name])
+
+        return values
+
+    def check_values(self, values: Dict[str, str], profile: Optional[str] = None) -> List[Dict]:
+        """Check settings against a profile's rules"""
+        deviations = []
+
+        for rule in PROFILES[profile or self.profile]:
+            value = values.get(rule['setting'], '')
+            if not value:
+                continue
+            # Setting vm.dirty_bytes makes the kernel report vm.dirty_ratio as 0, the byte limit is the one in force
+            if rule['setting'].endswith('_ratio') and values.get(rule['setting'][:-6] + '_bytes', '0') not in ('', '0'):
+                continue
+
+            if 'expect' in rule:
+                if value in rule['expect']:
+                    continue
+                expected = ' or '.join(rule['expect'])
+            else:
+                if not value.isdigit():
+                    continue
+                number = int(value)
+                if 'min' in rule and number < rule['min']:
+                    expected = f">= {rule['min']}"
+                elif 'max' in rule and number > rule['max']:
+                    expected = f"<= {rule['max']}"
+                else:
+                    continue
+
+            deviations.append({
+                'setting': rule['setting'],
+                'value': value,
+                'expected': expected,
+                'reason': rule['reason']
+            })
+
+        return deviations
+
+    def get_all_info(self) -> Dict:
+        """Get all audited settings with deviations from the active profile"""
+        values = self.get_values()
+        return {
+            'available': any(values.values()),
+            'profile': self.profile,
+            'values': values,
+            'deviations': self.check_values(values)
+        }
+
+    def get_summary(self, info: Optional[Dict] = None) -> Dict:
+        """Get summary sysctl information"""
+        if info is None:
+            info = self.get_all_info()
+        return {
+            'Sysctl Profile': info['profile'],
+            'THP': info['values']['thp.enabled'] or 'Unknown',
+            'Deviations': str(len(info['deviations']))
+        }
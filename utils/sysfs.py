@@ -0,0 +1,95 @@
+"""
+Sysfs Helpers Module
+Shared helpers for reading sysfs/procfs attributes and CPU lists
+"""
+
+import os
+from typing import Dict, List
+
+# Prefix for /proc and /sys paths, points collectors at a recorded fixture tree
+ROOT = os.environ.get('LXZ_ROOT', '')
+
+def set_root(root: str):
+    """Set the prefix used for /proc and /sys paths ('' for the live system)"""
+    global ROOT
+    ROOT = root.rstrip('/')
+
+def host_path(path: str) -> str:
+    """Get the path of a /proc or /sys file under the configured root"""
+    return ROOT + path if ROOT else path
+
+def read_attribute(path: str, default: str = '') -> str:
+    """Read a single attribute, returning default when it is missing"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return default
+
+def read_attributes(directory: str, names: List[str], default: str = '') -> Dict[str, str]:
+    """Read several attributes of one sysfs directory in a single pass"""
+    values = {}
+    dir_fd = None
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return {name: default for name in names}
+
+    try:
+        for name in names:
+            # Opening relative to the directory fd skips the path walk per file
+            try:
+                fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+            except OSError:
+                values[name] = default
+                continue
+            try:
+                values[name] = os.read(fd, 65536).decode(errors='replace').strip()
+            except OSError:
+                values[name] = default
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
+
+    return values
+
+def parse_cpulist(text: str) -> List[int]:
+    """Parse a kernel CPU list such as "0-3,8,10-11" """
+    cpus = []
+    for part in text.strip().split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            # Ranges may carry a stride, e.g. "0-15:2"
+            step = 1
+            if ':' in end:
+                end, step = end.split(':', 1)
+            cpus.extend(range(int(start), int(end) + 1, int(step)))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+def format_cpulist(cpus: List[int]) -> str:
+    """Format CPUs as a compact kernel CPU list"""
+    ranges = []
+    for cpu in sorted(set(cpus)):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ','.join(f"{start}-{end}" if start != end else str(start) for start, end in ranges)
+
+def get_numa_nodes(node_path: str = '/sys/devices/system/node') -> Dict[int, List[int]]:
+    """Get the CPUs of every NUMA node"""
+    nodes = {}
+    try:
+        for name in os.listdir(node_path):
+            if name.startswith('node') and name[4:].isdigit():
+                cpulist = read_attribute(os.path.join(node_path, name, 'cpulist'))
+                nodes[int(name[4:])] = parse_cpulist(cpulist) if cpulist else []
+    except OSError:
+        pass
+    return nodes
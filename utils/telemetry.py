@@ -0,0 +1,273 @@
+"""
+GPU Telemetry Module
+Streams live GPU utilization, memory, power and clocks without a fork per sample
+"""
+
+import os
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Fields requested from nvidia-smi, in output order
+NVIDIA_FIELDS = [
+    'index',
+    'pci.bus_id',
+    'name',
+    'utilization.gpu',
+    'utilization.memory',
+    'memory.used',
+    'memory.total',
+    'power.draw',
+    'clocks.sm',
+    'clocks.mem',
+    'temperature.gpu'
+]
+
+# Seconds to wait for the first nvidia-smi sample before trusting a silent stream is starting up
+STARTUP_TIMEOUT = 2.0
+
+class GPUTelemetry:
+    """Handles live GPU telemetry from one nvidia-smi stream and DRM sysfs"""
+
+    def __init__(self, interval_ms: int = 500, nvidia_smi: str = 'nvidia-smi',
+                 drm_path: str = '/sys/class/drm'):
+        self.interval_ms = interval_ms
+        self.nvidia_smi = nvidia_smi
+        self.drm_path = drm_path
+        self._process = None
+        self._reader = None
+        self._first_sample = threading.Event()
+        self._lock = threading.Lock()
+        self._nvidia = {}
+        self._drm_cards = []
+
+    def _parse_number(self, value: str) -> Optional[float]:
+        """Parse a nvidia-smi value, "[N/A]" and "[Not Supported]" become None"""
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    def parse_nvidia_line(self, line: str) -> Optional[Dict]:
+        """Parse one CSV line of the nvidia-smi stream"""
+        parts = [part.strip() for part in line.split(',')]
+        if len(parts) != len(NVIDIA_FIELDS) or not parts[0].isdigit():
+            return None
+
+        values = dict(zip(NVIDIA_FIELDS, parts))
+        return {
+            'id': f"nvidia{values['index']}",
+            'vendor': 'NVIDIA',
+            'name': values['name'],
+            'bus_id': values['pci.bus_id'],
+            'utilization': self._parse_number(values['utilization.gpu']),
+            'memory_utilization': self._parse_number(values['utilization.memory']),
+            'memory_used': self._parse_number(values['memory.used']),
+            'memory_total': self._parse_number(values['memory.total']),
+            'power': self._parse_number(values['power.draw']),
+            'core_clock': self._parse_number(values['clocks.sm']),
+            'memory_clock': self._parse_number(values['clocks.mem']),
+            'temperature': self._parse_number(values['temperature.gpu']),
+            'source': 'nvidia-smi'
+        }
+
+    def _read_stream(self, stream):
+        """Reader thread: keep the latest sample per NVIDIA GPU"""
+        try:
+            for line in stream:
+                sample = self.parse_nvidia_line(line)
+                if sample:
+                    sample['timestamp'] = time.monotonic()
+                    with self._lock:
+                        self._nvidia[sample['id']] = sample
+                    self._first_sample.set()
+        finally:
+            # End of stream also wakes up start(), which then finds no sample
+            self._first_sample.set()
+
+    def _start_nvidia_stream(self) -> bool:
+        """Start the long-lived nvidia-smi loop"""
+        try:
+            self._process = subprocess.Popen(
+                [
+                    self.nvidia_smi,
+                    f"--query-gpu={','.join(NVIDIA_FIELDS)}",
+                    '--format=csv,noheader,nounits',
+                    f"--loop-ms={self.interval_ms}"
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        except (FileNotFoundError, PermissionError):
+            self._process = None
+            return False
+
+        self._first_sample.clear()
+        self._reader = threading.Thread(
+            target=self._read_stream, args=(self._process.stdout,),
+            name='lxz-nvidia-smi', daemon=True
+        )
+        self._reader.start()
+
+        # Without a driver or GPU nvidia-smi prints an error and exits, which only shows after it was spawned
+        started = self._first_sample.wait(STARTUP_TIMEOUT)
+        with self._lock:
+            streaming = bool(self._nvidia)
+        if not streaming and (started or self._process.poll() is not None):
+            self.stop()
+            return False
+        return True
+
+    def _open_attribute(self, path: str) -> Optional[int]:
+        """Open a sysfs attribute once so it can be re-read with pread"""
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+
+    def _find_hwmon_attribute(self, device_path: str, names: List[str]) -> Optional[int]:
+        """Open the first matching attribute under the device's hwmon directory"""
+        hwmon_root = os.path.join(device_path, 'hwmon')
+        try:
+            for hwmon in sorted(os.listdir(hwmon_root)):
+                for name in names:
+                    fd = self._open_attribute(os.path.join(hwmon_root, hwmon, name))
+                    if fd is not None:
+                        return fd
+        except OSError:
+            pass
+        return None
+
+    def _discover_drm_cards(self):
+        """Find AMD and Intel cards and open their telemetry attributes"""
+        try:
+            cards = sorted(name for name in os.listdir(self.drm_path)
+                           if name.startswith('card') and name[4:].isdigit())
+        except OSError:
+            return
+
+        for card in cards:
+            card_path = os.path.join(self.drm_path, card)
+            device_path = os.path.join(card_path, 'device')
+
+            try:
+                with open(os.path.join(device_path, 'vendor')) as f:
+                    vendor_id = f.read().strip()
+                driver = os.path.basename(os.readlink(os.path.join(device_path, 'driver')))
+            except OSError:
+                continue
+
+            # NVIDIA cards are covered by the nvidia-smi stream
+            if vendor_id == '0x1002':
+                vendor = 'AMD'
+            elif vendor_id == '0x8086':
+                vendor = 'Intel'
+            else:
+                continue
+
+            core_clock = self._open_attribute(os.path.join(card_path, 'gt_act_freq_mhz'))
+            if core_clock is None:
+                core_clock = self._find_hwmon_attribute(device_path, ['freq1_input'])
+
+            self._drm_cards.append({
+                'id': card,
+                'vendor': vendor,
+                'name': f"{vendor} ({driver})",
+                'bus_id': os.path.basename(os.path.realpath(device_path)),
+                'fds': {
+                    'utilization': self._open_attribute(os.path.join(device_path, 'gpu_busy_percent')),
+                    'memory_used': self._open_attribute(os.path.join(device_path, 'mem_info_vram_used')),
+                    'memory_total': self._open_attribute(os.path.join(device_path, 'mem_info_vram_total')),
+                    'power': self._find_hwmon_attribute(device_path, ['power1_average', 'power1_input']),
+                    'core_clock': core_clock,
+                    'memory_clock': self._find_hwmon_attribute(device_path, ['freq2_input']),
+                    'temperature': self._find_hwmon_attribute(device_path, ['temp1_input'])
+                }
+            })
+
+    def _read_fd(self, fd: Optional[int]) -> Optional[float]:
+        """Re-read an open sysfs attribute from offset 0"""
+        if fd is None:
+            return None
+        try:
+            return float(os.pread(fd, 64, 0).split()[0])
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def _sample_drm_card(self, card: Dict) -> Dict:
+        """Read one AMD or Intel card, converting to the nvidia-smi units"""
+        raw = {key: self._read_fd(fd) for key, fd in card['fds'].items()}
+
+        def scaled(key, divisor):
+            return raw[key] / divisor if raw[key] is not None else None
+
+        # gt_act_freq_mhz is already MHz, hwmon freq*_input is Hz
+        core_clock = raw['core_clock']
+        if core_clock is not None and core_clock > 100000:
+            core_clock /= 1000000
+
+        return {
+            'id': card['id'],
+            'vendor': card['vendor'],
+            'name': card['name'],
+            'bus_id': card['bus_id'],
+            'utilization': raw['utilization'],
+            'memory_utilization': None,
+            'memory_used': scaled('memory_used', 1024 * 1024),
+            'memory_total': scaled('memory_total', 1024 * 1024),
+            'power': scaled('power', 1000000),
+            'core_clock': core_clock,
+            'memory_clock': scaled('memory_clock', 1000000),
+            'temperature': scaled('temperature', 1000),
+            'source': 'sysfs',
+            'timestamp': time.monotonic()
+        }
+
+    def start(self) -> List[str]:
+        """Start streaming, returning the active sources"""
+        sources = []
+        if self._start_nvidia_stream():
+            sources.append('nvidia-smi')
+
+        self._discover_drm_cards()
+        if self._drm_cards:
+            sources.append('sysfs')
+
+        return sources
+
+    def stop(self):
+        """Stop the nvidia-smi stream and close sysfs attributes"""
+        if self._process:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+        # The reader sees end of stream once the process is gone
+        if self._reader:
+            self._reader.join(timeout=2)
+            self._reader = None
+
+        for card in self._drm_cards:
+            for fd in card['fds'].values():
+                if fd is not None:
+                    os.close(fd)
+        self._drm_cards = []
+
+    def sample(self) -> List[Dict]:
+        """Get the latest per-GPU sample (units: %, MiB, W, MHz, °C)"""
+        now = time.monotonic()
+        with self._lock:
+            samples = [dict(sample) for sample in self._nvidia.values()]
+        samples.extend(self._sample_drm_card(card) for card in self._drm_cards)
+
+        for sample in samples:
+            sample['age'] = now - sample.pop('timestamp')
+
+        return sorted(samples, key=lambda sample: sample['id'])